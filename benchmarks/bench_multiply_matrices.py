@@ -0,0 +1,54 @@
+# calculadora_matrizes/benchmarks/bench_multiply_matrices.py
+
+# Benchmark do kernel de multiplicação de matrizes.
+# Compara o laço i-j-k clássico (versão original de multiply_matrices, reproduzida
+# abaixo como referência) com o kernel atual, para matrizes quadradas 64, 128 e 256.
+# Execução: python benchmarks/bench_multiply_matrices.py
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from logic.multiply_matrices import multiply_matrices
+
+SIZES = (64, 128, 256)
+REPEATS = 3
+
+def classic_multiply(matrix_a, matrix_b):
+    """Laço i-j-k clássico, lendo B coluna a coluna (implementação de referência)."""
+    rows_a = len(matrix_a)
+    cols_a = len(matrix_a[0])
+    cols_b = len(matrix_b[0])
+    result = [[0 for _ in range(cols_b)] for _ in range(rows_a)]
+    for i in range(rows_a):
+        for j in range(cols_b):
+            sum_val = 0
+            for k in range(cols_a):
+                sum_val += matrix_a[i][k] * matrix_b[k][j]
+            result[i][j] = sum_val
+    return result
+
+def best_time(function, *args):
+    """Retorna o menor tempo (em segundos) entre REPEATS execuções de function(*args)."""
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def main():
+    rng = random.Random(0)
+    print(f"{'n':>5} {'clássico (s)':>14} {'kernel (s)':>12} {'speedup':>9}")
+    for n in SIZES:
+        matrix_a = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        matrix_b = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+        assert classic_multiply(matrix_a, matrix_b) == multiply_matrices(matrix_a, matrix_b)
+        classic = best_time(classic_multiply, matrix_a, matrix_b)
+        kernel = best_time(multiply_matrices, matrix_a, matrix_b)
+        print(f"{n:>5} {classic:>14.4f} {kernel:>12.4f} {classic / kernel:>8.1f}x")
+
+if __name__ == "__main__":
+    main()
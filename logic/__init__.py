@@ -6,14 +6,24 @@
 # diretamente de 'logic' (ex: from logic import add_matrices) em vez de ter que
 # especificar o módulo completo (ex: from logic.add_matrices import add_matrices).
 
-from .add_matrices import add_matrices
-from .subtract_matrices import subtract_matrices
-from .multiply_matrices import multiply_matrices
-from .scalar_multiply import scalar_multiply
+from .add_matrices import add_matrices, iadd
+from .subtract_matrices import subtract_matrices, isub
+from .multiply_matrices import multiply_matrices, multiply_chain
+from .scalar_multiply import scalar_multiply, iscale
 from .transpose_matrix import transpose_matrix
-from .determinant import determinant
+from .determinant import determinant, determinant_modular, slogdet
 from .inverse_matrix import inverse_matrix
-from .solve_linear_system import solve_linear_system_inverse 
+from .matrix_rank import matrix_rank
+from .matrix_structure import detect_structure
+from .solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu, solve_linear_system_cholesky
+from .banded import solve_tridiagonal, solve_banded, detect_bandwidth, to_band_storage
+from .iterative_solvers import conjugate_gradient, jacobi, gauss_seidel, IterativeResult
+from .lu_factorization import LUFactorization, factorize
+from .backend import get_backend, set_backend, numpy_available
+from .matrix import Matrix
+from .sparse import CSRMatrix, CSCMatrix
+from .expression import expr, Expression
+from .blas import axpy, gemm
                                                            
 # A variável especial __all__ define a interface pública do pacote 'logic'.
 # Quando um usuário faz 'from logic import *', apenas os nomes listados em __all__
@@ -23,12 +33,42 @@ from .solve_linear_system import solve_linear_system_inverse
 __all__ = [
     "add_matrices",
     "subtract_matrices",
+    "iadd",
+    "isub",
+    "iscale",
     "multiply_matrices",
+    "multiply_chain",
     "scalar_multiply",
     "transpose_matrix",
     "determinant",
+    "determinant_modular",
+    "slogdet",
     "inverse_matrix",
+    "matrix_rank",
+    "detect_structure",
     "solve_linear_system_inverse", 
+    "solve_linear_system_lu",
+    "solve_linear_system_cholesky",
+    "solve_tridiagonal",
+    "solve_banded",
+    "detect_bandwidth",
+    "to_band_storage",
+    "conjugate_gradient",
+    "jacobi",
+    "gauss_seidel",
+    "IterativeResult",
+    "LUFactorization",
+    "factorize",
+    "get_backend",
+    "set_backend",
+    "numpy_available",
+    "Matrix",
+    "CSRMatrix",
+    "CSCMatrix",
+    "expr",
+    "Expression",
+    "axpy",
+    "gemm",
     # Funções de validation_utils.py e helper_utils.py não estão listadas aqui
     # pois são consideradas utilitários internos para o pacote 'logic' e não
     # parte de sua API pública primária para o resto da aplicação.
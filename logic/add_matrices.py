@@ -1,34 +1,81 @@
 # calculadora_matrizes/logic/add_matrices.py
-from .validation_utils import validate_matrices_for_add_sub
+from operator import add
+from .validation_utils import validate_matrices_for_broadcast, validate_output_matrix
+from .matrix import Matrix, any_matrix, _write_into
+from .sparse import any_sparse, sparse_add
+from .broadcasting import _needs_broadcast, _broadcast_apply
+from . import backend
 
-def add_matrices(matrix_a, matrix_b):
+def add_matrices(matrix_a, matrix_b, out=None):
     """
     Soma duas matrizes, A e B.
-    Pré-condição: Matrizes A e B devem ser válidas e ter as mesmas dimensões.
-    Retorna: Uma nova matriz contendo a soma de A e B.
+    Pré-condição: Matrizes A e B devem ser válidas e ter as mesmas dimensões, ou dimensões
+    compatíveis por broadcasting: um escalar, um vetor linha (1 x n) ou um vetor coluna
+    (m x 1) é somado a cada linha/coluna do outro operando, sem ser expandido.
+    Com 'out' (lista de listas ou Matrix com as mesmas dimensões), a soma é escrita
+    nessa matriz, reaproveitando o seu armazenamento; 'out' pode ser A ou B.
+    Retorna: Uma nova matriz contendo a soma de A e B (um Matrix, se algum operando for Matrix;
+             uma matriz esparsa, se ambos forem esparsos), ou a própria 'out'.
     """
     # 1. Validação das entradas:
-    #    Garante que A e B são matrizes válidas e possuem dimensões idênticas.
+    #    Garante que A e B são matrizes válidas e possuem dimensões idênticas
+    #    (ou compatíveis por broadcasting); 'shape' são as dimensões do resultado.
     #    Se não, uma exceção (ValueError) é lançada pela função de validação.
-    validate_matrices_for_add_sub(matrix_a, matrix_b)
-
-    # 2. Obtenção das dimensões:
-    #    As dimensões da matriz resultado serão as mesmas das matrizes de entrada.
-    rows = len(matrix_a)      # Número de linhas.
-    cols = len(matrix_a[0])   # Número de colunas.
-
-    # 3. Criação da matriz resultado:
-    #    Inicializa uma nova matriz (result) com zeros, do mesmo tamanho de A e B.
-    #    Ex: Para A e B 2x3, result = [[0, 0, 0], [0, 0, 0]].
-    result = [[0 for _ in range(cols)] for _ in range(rows)]
-
-    # 4. Processo de soma:
-    #    Itera sobre cada posição (i, j) das matrizes.
-    for i in range(rows):          # Para cada linha i...
-        for j in range(cols):      # Para cada coluna j...
-            # Soma os elementos A[i][j] e B[i][j] e armazena em result[i][j].
-            result[i][j] = matrix_a[i][j] + matrix_b[i][j]
-
-    # 5. Retorno do resultado:
+    shape = validate_matrices_for_broadcast(matrix_a, matrix_b)
+
+    #    Com 'out', o resultado é escrito na matriz do chamador (sem nova alocação).
+    if out is not None:
+        validate_output_matrix(out, shape, matrix_a, matrix_b)
+        if _needs_broadcast(matrix_a, matrix_b):
+            return _broadcast_apply(add, matrix_a, matrix_b, shape, out)
+        return _write_into(out, add, matrix_a, matrix_b)
+
+    #    Broadcasting: um escalar, vetor linha (1 x n) ou vetor coluna (m x 1) é
+    #    combinado com cada linha/coluna do outro operando sem ser expandido (ver broadcasting.py).
+    if _needs_broadcast(matrix_a, matrix_b):
+        return _broadcast_apply(add, matrix_a, matrix_b, shape)
+
+    #    Com algum operando esparso, usa o kernel esparso (ver sparse.py):
+    #    esparsa com esparsa resulta em esparsa; com densa, em densa.
+    if any_sparse(matrix_a, matrix_b):
+        return sparse_add(matrix_a, matrix_b)
+
+    #    Se algum operando for um Matrix, soma diretamente os arrays planos
+    #    e devolve um Matrix.
+    if any_matrix(matrix_a, matrix_b):
+        flat_a = Matrix._from_rows(matrix_a).data
+        flat_b = Matrix._from_rows(matrix_b).data
+        return Matrix._from_flat(len(matrix_a), len(matrix_a[0]), list(map(add, flat_a, flat_b)))
+
+    #    Para matrizes grandes de floats, delega ao backend NumPy (se disponível).
+    if backend.should_use_numpy(matrix_a, matrix_b):
+        return backend.numpy_add(matrix_a, matrix_b)
+
+    # 2. Processo de soma:
+    #    Cada linha do resultado é produzida diretamente, em uma única passada,
+    #    somando os elementos correspondentes de A e B: result[i][j] = A[i][j] + B[i][j].
+    #    (Não há uma matriz de zeros preenchida depois.)
+    result = [list(map(add, row_a, row_b)) for row_a, row_b in zip(matrix_a, matrix_b)]
+
+    # 3. Retorno do resultado:
     #    Devolve a matriz 'result' contendo a soma.
-    return result
\ No newline at end of file
+    return result
+
+
+def iadd(matrix_a, matrix_b):
+    """
+    Soma B em A no próprio A (A += B), sem alocar uma nova matriz.
+    Útil em algoritmos iterativos que atualizam a mesma matriz a cada passo.
+
+    Args:
+        matrix_a (list[list[float]] or Matrix): A matriz atualizada (densa).
+        matrix_b (list[list[float]] or Matrix): A matriz somada.
+
+    Returns:
+        list[list[float]] or Matrix: A própria matrix_a, já atualizada.
+
+    Raises:
+        ValueError: Se as matrizes não forem válidas, forem esparsas ou tiverem dimensões diferentes.
+    """
+    return add_matrices(matrix_a, matrix_b, out=matrix_a)
+
@@ -0,0 +1,263 @@
+# calculadora_matrizes/logic/backend.py
+
+# Este módulo implementa a camada de backend opcional baseada em NumPy.
+# Quando o NumPy está instalado, as operações do pacote 'logic' podem delegar o
+# cálculo a implementações vetorizadas para matrizes grandes, mantendo o mesmo
+# contrato de entrada/saída (listas de listas) e as mesmas mensagens de erro.
+# Sem NumPy, tudo continua funcionando pelo caminho em Python puro.
+#
+# A validação das entradas continua sendo feita pelas funções públicas ANTES
+# do despacho; as funções numpy_* abaixo assumem entradas já validadas.
+#
+# Os dois backends usam o mesmo critério de singularidade: o determinante é o
+# produto dos pivôs (zero apenas com um pivô exatamente nulo), e inversa e
+# sistemas recusam a matriz quando algum pivô da eliminação com pivoteamento
+# parcial é desprezível em relação à escala da sua coluna (has_negligible_pivot).
+
+try:
+    import numpy as np
+except ImportError: # NumPy é opcional: o caminho em Python puro é o padrão.
+    np = None
+
+from .helper_utils import is_negligible_pivot
+
+# Número mínimo de elementos (linhas x colunas do maior operando) para que o
+# modo "auto" despache para o NumPy. Abaixo disso, o custo de conversão entre
+# listas e arrays supera o ganho da vetorização.
+NUMPY_THRESHOLD = 1024
+
+# Backend ativo: "auto" (NumPy acima do limiar, se disponível), "python" ou "numpy".
+_backend = "auto"
+
+_VALID_BACKENDS = ("auto", "python", "numpy")
+
+def numpy_available():
+    """Retorna True se o NumPy pôde ser importado."""
+    return np is not None
+
+
+def get_backend():
+    """Retorna o nome do backend ativo ("auto", "python" ou "numpy")."""
+    return _backend
+
+
+def set_backend(name):
+    """
+    Define o backend usado pelas operações do pacote 'logic'.
+
+    Args:
+        name (str): "auto" (NumPy para matrizes grandes, se disponível),
+                    "python" (sempre Python puro) ou "numpy" (sempre NumPy
+                    para entradas numéricas reais).
+
+    Raises:
+        ValueError: Se o nome for desconhecido ou se "numpy" for pedido sem o NumPy instalado.
+    """
+    global _backend
+    if name not in _VALID_BACKENDS:
+        raise ValueError(f"Backend desconhecido: '{name}'. Use um de {_VALID_BACKENDS}.")
+    if name == "numpy" and np is None:
+        raise ValueError("Backend 'numpy' indisponível: o NumPy não está instalado.")
+    _backend = name
+
+
+def should_use_numpy(*matrices):
+    """
+    Decide se uma operação sobre 'matrices' (já validadas) deve ir para o NumPy.
+
+    O despacho só acontece se o NumPy estiver disponível, o backend permitir,
+    e todos os elementos forem int ou float. No modo "auto" exige-se ainda que o
+    maior operando atinja NUMPY_THRESHOLD elementos e que haja ao menos um float:
+    matrizes só de inteiros permanecem em Python puro, preservando resultados
+    inteiros exatos (sem o estouro silencioso de int64).
+    """
+    if np is None or _backend == "python":
+        return False
+
+    if _backend == "auto":
+        if max(len(m) * len(m[0]) for m in matrices) < NUMPY_THRESHOLD:
+            return False
+
+    has_float = False
+    for matrix in matrices:
+        for row in matrix:
+            for value in row:
+                value_type = type(value)
+                if value_type is float:
+                    has_float = True
+                elif value_type is not int:
+                    return False
+    return has_float or _backend == "numpy"
+
+
+def _to_array(matrix):
+    """(Função auxiliar interna) Converte uma lista de listas em array float64."""
+    return np.array(matrix, dtype=float)
+
+
+def numpy_add(matrix_a, matrix_b):
+    """A + B vetorizado. Retorna lista de listas."""
+    return (_to_array(matrix_a) + _to_array(matrix_b)).tolist()
+
+
+def numpy_subtract(matrix_a, matrix_b):
+    """A - B vetorizado. Retorna lista de listas."""
+    return (_to_array(matrix_a) - _to_array(matrix_b)).tolist()
+
+
+def numpy_scalar_multiply(matrix, scalar):
+    """scalar * A vetorizado. Retorna lista de listas."""
+    return (_to_array(matrix) * scalar).tolist()
+
+
+def numpy_multiply(matrix_a, matrix_b):
+    """A * B (produto matricial) vetorizado. Retorna lista de listas."""
+    return (_to_array(matrix_a) @ _to_array(matrix_b)).tolist()
+
+
+def numpy_determinant(matrix):
+    """det(A) por np.linalg.det (o produto dos pivôs da LU do LAPACK). Retorna um float."""
+    return float(np.linalg.det(_to_array(matrix)))
+
+
+def numpy_slogdet(matrix):
+    """(sign, log|det|) por np.linalg.slogdet. Retorna (int, float)."""
+    sign, logabsdet = np.linalg.slogdet(_to_array(matrix))
+    return int(sign), float(logabsdet)
+
+
+# Largura das colunas (e dos blocos triangulares) tratadas passo a passo na LU
+# recursiva; acima disso, o trabalho é feito por produtos de matrizes (BLAS).
+_LU_BLOCK = 32
+
+def _lu_factor(array):
+    """
+    (Função auxiliar interna) Fatoração P*A = L*U com pivoteamento parcial, a mesma
+    do caminho em Python puro (lu_decompose), mas recursiva por metades de colunas:
+    a metade esquerda é fatorada, a direita é atualizada por uma resolução triangular
+    e um produto de matrizes (complemento de Schur), e só então é fatorada. Quase
+    todo o custo O(n³) fica nos produtos de matrizes do NumPy.
+
+    Returns:
+        tuple: (lu, perm) - L e U compactadas e a permutação das linhas (como em lu_decompose).
+    """
+    lu = array.copy()
+    return lu, _lu_panel(lu)
+
+
+def _lu_panel(panel):
+    """
+    (Função auxiliar interna) Fatora no lugar um painel m x n (m >= n) e devolve a
+    permutação das suas linhas. Um pivô exatamente nulo não elimina nada (a coluna
+    já é nula abaixo dele); a singularidade é decidida depois, por _is_singular_lu.
+    """
+    rows, cols = panel.shape
+    perm = np.arange(rows)
+
+    # 1. Painel Estreito: eliminação coluna a coluna, cada passo vetorizado, sobre a
+    #    transposta (work[j] é a coluna j do painel, contígua na memória).
+    if cols <= _LU_BLOCK:
+        work = panel.T.copy()
+        for k in range(cols):
+            pivot_row = k + int(np.argmax(np.abs(work[k, k:])))
+            if pivot_row != k:
+                work[:, [k, pivot_row]] = work[:, [pivot_row, k]]
+                perm[[k, pivot_row]] = perm[[pivot_row, k]]
+            pivot = work[k, k]
+            if pivot != 0:
+                work[k, k + 1:] /= pivot
+                work[k + 1:, k + 1:] -= np.outer(work[k + 1:, k], work[k, k + 1:])
+        panel[...] = work.T
+        return perm
+
+    # 2. Metade Esquerda (as trocas de linhas são repetidas na metade direita):
+    half = cols // 2
+    left_perm = _lu_panel(panel[:, :half])
+    panel[:, half:] = panel[left_perm, half:]
+    perm = perm[left_perm]
+
+    # 3. Bloco U12 = L11⁻¹ * A12 e Complemento de Schur A22 - L21 * U12:
+    panel[:half, half:] = _solve_triangular(panel[:half, :half], panel[:half, half:], lower=True)
+    panel[half:, half:] -= panel[half:, :half] @ panel[:half, half:]
+
+    # 4. Metade Direita (as trocas de linhas são repetidas em L21):
+    right_perm = _lu_panel(panel[half:, half:])
+    panel[half:, :half] = panel[half:, :half][right_perm]
+    perm[half:] = perm[half:][right_perm]
+    return perm
+
+
+def _solve_triangular(triangle, rhs, lower):
+    """
+    (Função auxiliar interna) Resolve T*X = B com T triangular (inferior com diagonal
+    unitária, como o L compactado, ou superior), recursivamente por blocos: cada
+    metade de X é resolvida e descontada da outra por um produto de matrizes.
+    """
+    size = triangle.shape[0]
+
+    # 1. Bloco Pequeno: substituição linha a linha (vetorizada sobre as colunas de B).
+    if size <= _LU_BLOCK:
+        solution = rhs.copy()
+        order = range(size) if lower else range(size - 1, -1, -1)
+        for i in order:
+            if lower:
+                solution[i] -= triangle[i, :i] @ solution[:i]
+            else:
+                solution[i] -= triangle[i, i + 1:] @ solution[i + 1:]
+                solution[i] /= triangle[i, i]
+        return solution
+
+    # 2. Divisão em Metades:
+    half = size // 2
+    if lower:
+        top = _solve_triangular(triangle[:half, :half], rhs[:half], lower)
+        bottom = _solve_triangular(triangle[half:, half:], rhs[half:] - triangle[half:, :half] @ top, lower)
+    else:
+        bottom = _solve_triangular(triangle[half:, half:], rhs[half:], lower)
+        top = _solve_triangular(triangle[:half, :half], rhs[:half] - triangle[:half, half:] @ bottom, lower)
+    return np.vstack((top, bottom))
+
+
+def _is_singular_lu(array, lu):
+    """
+    (Função auxiliar interna) Critério de singularidade do caminho NumPy, idêntico ao
+    do caminho em Python puro (ver lu_factorization.has_negligible_pivot): cada pivô
+    (diagonal de U) é comparado com a escala da sua coluna na matriz original por
+    is_negligible_pivot. O LAPACK sozinho só falharia com pivôs exatamente nulos.
+    """
+    scales = np.abs(array).max(axis=0)
+    return any(is_negligible_pivot(float(pivot), float(scale)) for pivot, scale in zip(np.diag(lu), scales))
+
+
+def _lu_solve(array, rhs, message):
+    """
+    (Função auxiliar interna) Resolve A*X = B com UMA fatoração: a mesma LU decide a
+    singularidade e fornece as substituições progressiva e regressiva.
+
+    Raises:
+        ValueError: Com 'message', se A for singular pelo critério de _is_singular_lu.
+    """
+    lu, perm = _lu_factor(array)
+    if _is_singular_lu(array, lu):
+        raise ValueError(message)
+    forward = _solve_triangular(lu, rhs[perm], lower=True)
+    return _solve_triangular(lu, forward, lower=False)
+
+
+def numpy_inverse(matrix):
+    """
+    A⁻¹ resolvendo A*X = I a partir de uma única LU (ver _lu_solve),
+    com a mesma mensagem de erro do caminho em Python puro.
+    """
+    array = _to_array(matrix)
+    return _lu_solve(array, np.eye(len(array)), "A matriz não é invertível (determinante é zero).").tolist()
+
+
+def numpy_solve(matrix_a, matrix_b):
+    """
+    Resolve A*X = B (B pode ter várias colunas) a partir de uma única LU
+    (ver _lu_solve), com a mesma mensagem de erro do caminho em Python puro.
+    """
+    array = _to_array(matrix_a)
+    return _lu_solve(array, _to_array(matrix_b),
+                     "Não é possível resolver o sistema: A matriz não é invertível (determinante é zero).").tolist()
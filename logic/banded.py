@@ -0,0 +1,283 @@
+# calculadora_matrizes/logic/banded.py
+
+# Este módulo contém os resolvedores para matrizes em banda (tridiagonais,
+# pentadiagonais, ...), comuns em discretizações por diferenças finitas:
+#   - solve_tridiagonal: algoritmo de Thomas, O(n), sobre as três diagonais;
+#   - solve_banded: fatoração LU em banda com pivoteamento parcial, O(n·p·(p+q)),
+#     sobre a matriz densa (banda detectada automaticamente) ou no formato compacto.
+#
+# Formato compacto de uma matriz com banda inferior p e superior q: uma lista de n
+# linhas, cada uma com p + q + 1 elementos, em que band[i][j - i + p] = A[i][j]
+# (posições fora da matriz, no início das primeiras linhas e no fim das últimas,
+# são preenchidas com 0). Ex: a tridiagonal [[2, 1, 0], [1, 2, 1], [0, 1, 2]]
+# (p = q = 1) fica [[0, 2, 1], [1, 2, 1], [1, 2, 0]].
+#
+# Com o formato compacto o custo de memória é O(n·(p+q)), o que permite resolver
+# sistemas com centenas de milhares de incógnitas, inviáveis na forma densa.
+from .validation_utils import validate_matrix_input, validate_square_matrix, validate_linear_system_inputs
+from .helper_utils import is_negligible_pivot
+from .matrix import Matrix, any_matrix, to_nested_list
+
+def detect_bandwidth(matrix):
+    """
+    Detecta as larguras de banda de uma matriz quadrada densa: p (inferior) é a maior
+    distância i - j e q (superior) a maior distância j - i de um elemento não nulo A[i][j].
+    Ex: diagonal -> (0, 0); tridiagonal -> (1, 1); triangular superior n x n -> (0, n - 1).
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz quadrada.
+
+    Returns:
+        tuple: (lower, upper), as larguras de banda inferior e superior.
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida.
+    """
+    validate_square_matrix(matrix, "Matriz para detecção de banda")
+    return _detect_bandwidth(to_nested_list(matrix))
+
+
+def _detect_bandwidth(matrix):
+    """
+    (Função auxiliar interna) Detecção de banda para matrizes já validadas (em listas).
+    Cada linha só é percorrida elemento a elemento quando há algo fora da banda
+    já encontrada (verificado com any() sobre as fatias).
+    """
+    rows = len(matrix)
+    lower = upper = 0
+    for i, row in enumerate(matrix):
+        if i - lower > 0 and any(row[:i - lower]):
+            lower = i - next(j for j in range(i - lower) if row[j])
+        if i + upper + 1 < rows and any(row[i + upper + 1:]):
+            upper = next(j for j in range(rows - 1, i + upper, -1) if row[j]) - i
+    return lower, upper
+
+
+def is_narrow_band(lower, upper, rows):
+    """
+    True se a banda for estreita o bastante para que a LU em banda compense
+    frente à densa (usado pelas resoluções no modo "auto").
+    """
+    return 2 * (lower + upper) < rows
+
+
+def to_band_storage(matrix, lower, upper):
+    """
+    Converte uma matriz quadrada densa para o formato compacto em banda
+    (band[i][j - i + lower] = A[i][j]). Elementos fora da banda são descartados.
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz quadrada densa.
+        lower (int): A largura de banda inferior p.
+        upper (int): A largura de banda superior q.
+
+    Returns:
+        list[list[float]]: As n linhas compactas, cada uma com lower + upper + 1 elementos.
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida ou se as larguras forem negativas.
+    """
+    validate_square_matrix(matrix, "Matriz para armazenamento em banda")
+    _validate_bandwidth(lower, upper)
+    return _to_band_storage(to_nested_list(matrix), lower, upper)
+
+
+def _to_band_storage(matrix, lower, upper):
+    """(Função auxiliar interna) Conversão para o formato em banda, sem validação."""
+    rows = len(matrix)
+    band = []
+    for i, row in enumerate(matrix):
+        start = i - lower
+        stop = i + upper + 1
+        band.append([0] * max(0, -start) + row[max(0, start):min(rows, stop)] + [0] * max(0, stop - rows))
+    return band
+
+
+def solve_tridiagonal(sub_diagonal, main_diagonal, super_diagonal, vector_b):
+    """
+    Resolve A*X = B para A tridiagonal pelo algoritmo de Thomas (eliminação de Gauss
+    sem pivoteamento restrita às três diagonais), em O(n) por coluna de B.
+    Adequado para matrizes diagonalmente dominantes ou simétricas definidas positivas
+    (ex: diferenças finitas 1D); para as demais, use solve_banded (com pivoteamento).
+
+    Args:
+        sub_diagonal (list[float]): A[i][i - 1] para i = 1..n-1 (n - 1 elementos).
+        main_diagonal (list[float]): A[i][i] (n elementos).
+        super_diagonal (list[float]): A[i][i + 1] para i = 0..n-2 (n - 1 elementos).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos
+                                      independentes (B), ou uma matriz N x k.
+
+    Returns:
+        list[list[float]]: A solução (X), com as mesmas dimensões de B.
+
+    Raises:
+        ValueError: Se os tamanhos das diagonais ou de B forem incompatíveis, ou se
+                    surgir um pivô nulo (a eliminação sem pivoteamento não se aplica).
+    """
+    # 1. Validação das Diagonais e de B:
+    rows = len(main_diagonal) if isinstance(main_diagonal, list) else 0
+    if rows == 0 or not all(isinstance(d, list) and len(d) == rows - 1 for d in (sub_diagonal, super_diagonal)):
+        raise ValueError("As diagonais devem ser listas com n - 1, n e n - 1 elementos (n >= 1).")
+    validate_matrix_input(vector_b, "Vetor B (termos independentes)")
+    list_b = to_nested_list(vector_b)
+    if len(list_b) != rows:
+        raise ValueError("Número de linhas do Vetor B deve ser igual ao tamanho da diagonal principal.")
+    #    Escala da coluna i (A[i-1][i], A[i][i] e A[i+1][i]), a referência do pivô i.
+    scales = [max(abs(main_diagonal[i]), abs(super_diagonal[i - 1]) if i > 0 else 0,
+                  abs(sub_diagonal[i]) if i < rows - 1 else 0) for i in range(rows)]
+
+    # 2. Eliminação Progressiva (as linhas de B são transformadas junto):
+    #    c'[i] = c[i] / (b[i] - a[i] * c'[i-1]);  d'[i] = (d[i] - a[i] * d'[i-1]) / (b[i] - a[i] * c'[i-1])
+    modified_super = [0.0] * rows
+    modified_rhs = [None] * rows
+    previous_super = 0.0
+    previous_rhs = [0.0] * len(list_b[0])
+    for i in range(rows):
+        factor = sub_diagonal[i - 1] if i > 0 else 0.0
+        pivot = main_diagonal[i] - factor * previous_super
+        if is_negligible_pivot(pivot, scales[i]):
+            raise ValueError("Pivô nulo no algoritmo de Thomas: use solve_banded (com pivoteamento).")
+        previous_super = super_diagonal[i] / pivot if i < rows - 1 else 0.0
+        previous_rhs = [(d - factor * p) / pivot for d, p in zip(list_b[i], previous_rhs)]
+        modified_super[i] = previous_super
+        modified_rhs[i] = previous_rhs
+
+    # 3. Substituição Regressiva: x[i] = d'[i] - c'[i] * x[i+1].
+    solution = [None] * rows
+    solution[-1] = modified_rhs[-1]
+    for i in range(rows - 2, -1, -1):
+        c = modified_super[i]
+        solution[i] = [d - c * x for d, x in zip(modified_rhs[i], solution[i + 1])]
+
+    # 4. Retorno da Solução (Matrix, se B for Matrix):
+    return Matrix._from_rows(solution) if isinstance(vector_b, Matrix) else solution
+
+
+def solve_banded(matrix_a, vector_b, bandwidth=None):
+    """
+    Resolve A*X = B para A em banda por fatoração LU em banda com pivoteamento
+    parcial, em O(n·p·(p+q)) operações e O(n·(p+q)) memória (contra O(n³) e O(n²)
+    da LU densa). Com o pivoteamento, a banda superior de U cresce no máximo para p + q.
+
+    Args:
+        matrix_a (list[list[float]] or Matrix): A matriz A, densa (n x n, com a banda
+                                                detectada automaticamente) ou, se
+                                                'bandwidth' for informado, no formato
+                                                compacto (n x (p + q + 1)).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos
+                                      independentes (B), ou uma matriz N x k.
+        bandwidth (tuple or None): (p, q) do formato compacto; None para A densa.
+
+    Returns:
+        list[list[float]]: A solução (X), com as mesmas dimensões de B.
+
+    Raises:
+        ValueError: Se as entradas não forem válidas, se a largura do formato
+                    compacto não corresponder a 'bandwidth' ou se A for singular.
+    """
+    # 1. Validação e Obtenção do Formato Compacto:
+    if bandwidth is None:
+        validate_linear_system_inputs(matrix_a, vector_b)
+        list_a = to_nested_list(matrix_a)
+        lower, upper = _detect_bandwidth(list_a)
+        band = _to_band_storage(list_a, lower, upper)
+    else:
+        lower, upper = bandwidth
+        _validate_bandwidth(lower, upper)
+        validate_matrix_input(matrix_a, "Matriz A (formato em banda)")
+        validate_matrix_input(vector_b, "Vetor B (termos independentes)")
+        band = to_nested_list(matrix_a)
+        if len(band[0]) != lower + upper + 1:
+            raise ValueError("Cada linha da Matriz A (formato em banda) deve ter p + q + 1 elementos.")
+        if len(band) != len(to_nested_list(vector_b)):
+            raise ValueError("Número de linhas da Matriz A (coeficientes) deve ser igual ao número de linhas do Vetor B.")
+
+    # 2. Resolução (Matrix, se algum operando for Matrix):
+    try:
+        solution = _solve_band(band, lower, upper, to_nested_list(vector_b))
+    except ValueError as e:
+        raise ValueError(f"Não é possível resolver o sistema: {e}")
+    return Matrix._from_rows(solution) if any_matrix(matrix_a, vector_b) else solution
+
+
+def _validate_bandwidth(lower, upper):
+    """(Função auxiliar interna) As larguras de banda devem ser inteiros não negativos."""
+    if not all(type(value) is int and value >= 0 for value in (lower, upper)):
+        raise ValueError("As larguras de banda (p, q) devem ser inteiros não negativos.")
+
+
+def _band_column_scales(band, lower):
+    """
+    (Função auxiliar interna) O maior |A[i][c]| de cada coluna c, lido do formato
+    compacto (band[i][j] = A[i][i - p + j]): a referência de cada pivô da LU em banda.
+    """
+    rows = len(band)
+    scales = [0] * rows
+    for i, row in enumerate(band):
+        for j, value in enumerate(row):
+            c = i - lower + j
+            if 0 <= c < rows and abs(value) > scales[c]:
+                scales[c] = abs(value)
+    return scales
+
+
+def _solve_band(band, lower, upper, matrix_b):
+    """
+    (Função auxiliar interna) LU em banda com pivoteamento parcial sobre [A | B],
+    seguida de substituição regressiva. Pré-condição: entradas já validadas.
+
+    Cada linha de trabalho é um par (início, valores): valores[c - início] = A[i][c].
+    O início viaja junto com a linha quando ela é trocada, e cada linha ativa é
+    estendida com zeros até o fim da janela de eliminação (no passo k, as linhas
+    ativas só têm elementos nas colunas k..k+p+q).
+    """
+    rows = len(band)
+    scales = _band_column_scales(band, lower)
+
+    # 1. Linhas de Trabalho (início, valores) e Cópia de B:
+    work = [(i - lower, list(row)) for i, row in enumerate(band)]
+    rhs = [list(row) for row in matrix_b]
+
+    for k in range(rows):
+        last = min(rows - 1, k + lower)
+
+        # 2. Pivoteamento Parcial entre as linhas k..k+p (as únicas com elemento na coluna k):
+        pivot_row = max(range(k, last + 1), key=lambda r: abs(work[r][1][k - work[r][0]]))
+        if pivot_row != k:
+            work[k], work[pivot_row] = work[pivot_row], work[k]
+            rhs[k], rhs[pivot_row] = rhs[pivot_row], rhs[k]
+        pivot_start, pivot_line = work[k]
+        pivot = pivot_line[k - pivot_start]
+        if is_negligible_pivot(pivot, scales[k]):
+            raise ValueError("A matriz não é invertível (determinante é zero).")
+
+        # 3. Eliminação abaixo do Pivô, restrita às colunas k..k+p+q da banda:
+        stop = min(rows, k + lower + upper + 1)
+        pivot_values = pivot_line[k - pivot_start:stop - pivot_start]
+        pivot_rhs = rhs[k]
+        for r in range(k + 1, last + 1):
+            start, line = work[r]
+            #    A linha é sempre estendida até 'stop' (mesmo com fator nulo): uma linha
+            #    trocada para cima depois precisa ter os elementos dos passos seguintes.
+            if len(line) < stop - start:
+                line.extend([0] * (stop - start - len(line)))
+            factor = line[k - start] / pivot
+            if factor:
+                first = k - start
+                line[first:first + len(pivot_values)] = [x - factor * y for x, y in
+                                                         zip(line[first:first + len(pivot_values)], pivot_values)]
+                rhs[r] = [x - factor * y for x, y in zip(rhs[r], pivot_rhs)]
+
+    # 4. Substituição Regressiva (U tem banda superior p + q):
+    #    x[i] = (b'[i] - soma(U[i][c] * x[c]) para c em i+1..i+p+q) / U[i][i].
+    solution = [None] * rows
+    for i in range(rows - 1, -1, -1):
+        start, line = work[i]
+        accumulated = rhs[i]
+        for c in range(i + 1, min(rows, start + len(line))):
+            coefficient = line[c - start]
+            if coefficient:
+                accumulated = [a - coefficient * x for a, x in zip(accumulated, solution[c])]
+        pivot = line[i - start]
+        solution[i] = [a / pivot for a in accumulated]
+    return solution
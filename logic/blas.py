@@ -0,0 +1,134 @@
+# calculadora_matrizes/logic/blas.py
+
+# Este módulo contém as primitivas no estilo BLAS que acumulam um resultado
+# escalado em uma matriz existente:
+#
+#   axpy(alpha, X, Y):           Y <- alpha*X + Y
+#   gemm(alpha, A, B, beta, C):  C <- alpha*A*B + beta*C
+#
+# Com as operações separadas, gemm custaria três chamadas (multiply_matrices,
+# scalar_multiply e add_matrices), três validações e três matrizes temporárias;
+# aqui a escala e a acumulação acontecem dentro do próprio kernel, que escreve
+# cada linha do resultado diretamente na matriz de destino (Y ou C), como nas
+# variantes in-place (iadd, isub, iscale).
+from operator import mul
+from .validation_utils import validate_matrices_for_add_sub, validate_matrix_for_mult, validate_matrix_input, validate_output_matrix, _shape
+from .matrix import Matrix, to_nested_list, _write_into
+from .sparse import any_sparse, is_sparse
+from .multiply_matrices import _multiply, _BLOCK_SIZE
+
+def axpy(alpha, matrix_x, matrix_y):
+    """
+    Calcula Y <- alpha*X + Y, atualizando Y no próprio objeto.
+
+    Args:
+        alpha (float or int): O escalar que multiplica X.
+        matrix_x (list[list[float]] or Matrix): A matriz X.
+        matrix_y (list[list[float]] or Matrix): A matriz Y (densa), atualizada com o resultado.
+
+    Returns:
+        list[list[float]] or Matrix: A própria matrix_y, já atualizada.
+
+    Raises:
+        ValueError: Se as matrizes não forem válidas, tiverem dimensões diferentes
+                    ou se alguma delas for esparsa.
+    """
+    # 1. Validação: X e Y com as mesmas dimensões; Y é o destino (densa).
+    validate_matrices_for_add_sub(matrix_x, matrix_y)
+    validate_output_matrix(matrix_y, _shape(matrix_x), matrix_x, matrix_y)
+
+    # 2. Atualização em Uma Passada: y = alpha*x + y, elemento a elemento.
+    if isinstance(matrix_y, Matrix):
+        flat_x = Matrix._from_rows(matrix_x).data
+        matrix_y._assign_flat([alpha * x + y for x, y in zip(flat_x, matrix_y.data)])
+    else:
+        for row_y, row_x in zip(matrix_y, to_nested_list(matrix_x)):
+            row_y[:] = [alpha * x + y for x, y in zip(row_x, row_y)]
+    return matrix_y
+
+
+def gemm(alpha, matrix_a, matrix_b, beta, matrix_c):
+    """
+    Calcula C <- alpha*A*B + beta*C, atualizando C no próprio objeto.
+    Cada elemento é alpha * (linha i de A · coluna j de B) + beta * C[i][j], calculado
+    no kernel de multiplicação: o produto A*B nunca é materializado.
+    Com beta = 0, o conteúdo anterior de C é ignorado (como no BLAS), e C serve
+    apenas como destino.
+
+    Args:
+        alpha (float or int): O escalar que multiplica o produto A*B.
+        matrix_a (list[list[float]]): A matriz A (m x n); pode ser Matrix ou esparsa.
+        matrix_b (list[list[float]]): A matriz B (n x p); pode ser Matrix ou esparsa.
+        beta (float or int): O escalar que multiplica C.
+        matrix_c (list[list[float]] or Matrix): A matriz C (m x p, densa), atualizada com o resultado.
+
+    Returns:
+        list[list[float]] or Matrix: A própria matrix_c, já atualizada.
+
+    Raises:
+        ValueError: Se as matrizes não forem válidas, se o número de colunas de A não
+                    for igual ao número de linhas de B, ou se C não for densa com
+                    dimensões (linhas de A) x (colunas de B).
+    """
+    # 1. Validação das Entradas:
+    validate_matrix_for_mult(matrix_a, matrix_b)
+    validate_matrix_input(matrix_c, "Matriz C")
+    rows = _shape(matrix_a)[0]
+    cols = _shape(matrix_b)[1]
+    if _shape(matrix_c) != (rows, cols):
+        raise ValueError("Matriz C deve ter dimensões (linhas de A) x (colunas de B) para gemm.")
+
+    # 2. Operandos Esparsos: o produto esparso (custo proporcional aos não nulos) é
+    #    combinado com C em uma passada.
+    if any_sparse(matrix_a, matrix_b):
+        product = _multiply(matrix_a, matrix_b)
+        product = product.to_list() if is_sparse(product) else product
+        if beta == 0:
+            return _write_into(matrix_c, lambda p: alpha * p, product)
+        return _write_into(matrix_c, lambda p, c: alpha * p + beta * c, product, matrix_c)
+
+    # 3. Linhas de A e Colunas de B como Sequências Contíguas (como em _multiply_kernel).
+    #    Se C for a própria A, as linhas de A são copiadas antes de C ser alterada.
+    if isinstance(matrix_a, Matrix):
+        data_a, cols_a = matrix_a.data, matrix_a.cols
+        rows_a = [data_a[start:start + cols_a] for start in range(0, len(data_a), cols_a)]
+    else:
+        rows_a = [row[:] for row in matrix_a] if matrix_a is matrix_c else matrix_a
+    if isinstance(matrix_b, Matrix):
+        columns_b = [matrix_b.data[j::cols] for j in range(cols)]
+    else:
+        columns_b = list(zip(*matrix_b))
+
+    # 4. Kernel Fundido por Blocos de Colunas de B (reaproveitados por todas as linhas
+    #    de A, como em _multiply_kernel): cada trecho de C é calculado e escrito no lugar.
+    #    Para um Matrix, todas as "linhas" de destino são a mesma lista plana 'values',
+    #    com a linha i começando no deslocamento i * cols.
+    is_matrix = isinstance(matrix_c, Matrix)
+    values = matrix_c.data.tolist() if is_matrix else None
+    target_rows = [values] * rows if is_matrix else matrix_c
+    offsets = range(0, rows * cols, cols) if is_matrix else [0] * rows
+    for block_start in range(0, cols, _BLOCK_SIZE):
+        block = columns_b[block_start:block_start + _BLOCK_SIZE]
+        for row_a, row_c, offset in zip(rows_a, target_rows, offsets):
+            start = offset + block_start
+            end = start + len(block)
+            row_c[start:end] = _gemm_row(alpha, row_a, block, beta, row_c[start:end])
+    if is_matrix:
+        matrix_c._assign_flat(values)
+    return matrix_c
+
+
+def _gemm_row(alpha, row_a, columns_b, beta, row_c):
+    """
+    (Função auxiliar interna) Uma linha de alpha*A*B + beta*C. Os casos comuns
+    (alpha = 1, beta = 0 ou 1) evitam as multiplicações desnecessárias.
+    """
+    if beta == 0:
+        if alpha == 1:
+            return [sum(map(mul, row_a, column_b)) for column_b in columns_b]
+        return [alpha * sum(map(mul, row_a, column_b)) for column_b in columns_b]
+    if beta == 1:
+        if alpha == 1:
+            return [sum(map(mul, row_a, column_b)) + c for column_b, c in zip(columns_b, row_c)]
+        return [alpha * sum(map(mul, row_a, column_b)) + c for column_b, c in zip(columns_b, row_c)]
+    return [alpha * sum(map(mul, row_a, column_b)) + beta * c for column_b, c in zip(columns_b, row_c)]
@@ -0,0 +1,78 @@
+# calculadora_matrizes/logic/broadcasting.py
+
+# Este módulo contém o kernel de broadcasting (como no NumPy) da adição e da
+# subtração: um escalar, um vetor linha (1 x n) ou um vetor coluna (m x 1) é
+# combinado com cada linha/coluna de uma matriz m x n SEM que a sua versão
+# expandida m x n seja criada. Ex: para centralizar as colunas de X (m x n),
+# subtract_matrices(X, medias) com 'medias' 1 x n reaproveita a mesma linha de
+# médias para todas as m linhas de X.
+#
+# As regras (validate_matrices_for_broadcast) ficam em validation_utils.py; aqui
+# as linhas de cada operando são apenas repetidas (itertools.repeat) nos eixos de
+# tamanho 1, e o resultado é produzido em uma única passada.
+from itertools import repeat
+from .validation_utils import _is_scalar, _shape
+from .matrix import Matrix, any_matrix
+
+def _needs_broadcast(matrix_a, matrix_b):
+    """(Função auxiliar interna) True se algum operando for escalar ou as dimensões diferirem."""
+    return _is_scalar(matrix_a) or _is_scalar(matrix_b) or _shape(matrix_a) != _shape(matrix_b)
+
+
+def _broadcast_apply(operation, matrix_a, matrix_b, shape, out=None):
+    """
+    (Função auxiliar interna) Aplica operation(a, b) elemento a elemento com broadcasting,
+    sem validação (os operandos densos e 'shape' vêm de validate_matrices_for_broadcast).
+
+    Returns:
+        O resultado rows x cols (um Matrix, se algum operando for Matrix), ou a própria
+        'out' (lista de listas ou Matrix), na qual o resultado é escrito.
+    """
+    rows, cols = shape
+    rows_a = _broadcast_rows(matrix_a, rows, cols)
+    rows_b = _broadcast_rows(matrix_b, rows, cols)
+
+    # 1. Escrita em 'out': cada linha é calculada por inteiro antes de ser escrita,
+    #    então 'out' pode ser o próprio operando de dimensões completas.
+    if out is not None:
+        if isinstance(out, Matrix):
+            out._assign_flat([value for row_a, row_b in zip(rows_a, rows_b) for value in map(operation, row_a, row_b)])
+        else:
+            for row_out, row_a, row_b in zip(out, rows_a, rows_b):
+                row_out[:] = map(operation, row_a, row_b)
+        return out
+
+    # 2. Novo Resultado, no tipo dos operandos:
+    if any_matrix(matrix_a, matrix_b):
+        values = [value for row_a, row_b in zip(rows_a, rows_b) for value in map(operation, row_a, row_b)]
+        return Matrix._from_flat(rows, cols, values)
+    return [list(map(operation, row_a, row_b)) for row_a, row_b in zip(rows_a, rows_b)]
+
+
+def _broadcast_rows(operand, rows, cols):
+    """
+    (Função auxiliar interna) As 'rows' linhas do operando expandido para rows x cols,
+    como iteráveis de 'cols' valores, sem materializar a expansão: um escalar (ou 1x1)
+    e cada elemento de uma coluna única viram repeat(valor, cols), e uma linha única
+    é o mesmo objeto repetido em todas as linhas.
+    """
+    # 1. Escalar (ou matriz 1x1): o mesmo valor em todas as posições.
+    if not _is_scalar(operand) and _shape(operand) == (1, 1):
+        operand = operand[0, 0] if isinstance(operand, Matrix) else operand[0][0]
+    if _is_scalar(operand):
+        return (repeat(operand, cols) for _ in range(rows))
+
+    # 2. Linhas do Operando (fatias do array plano, para um Matrix):
+    if isinstance(operand, Matrix):
+        data, width = operand.data, operand.cols
+        source = (data[start:start + width] for start in range(0, len(data), width))
+    else:
+        source = operand
+
+    # 3. Expansão de um Vetor Coluna (m x 1) ou de um Vetor Linha (1 x n):
+    operand_rows, operand_cols = _shape(operand)
+    if operand_cols < cols:
+        return (repeat(row[0], cols) for row in source)
+    if operand_rows < rows:
+        return repeat(next(iter(source)), rows)
+    return source
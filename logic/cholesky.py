@@ -0,0 +1,108 @@
+# calculadora_matrizes/logic/cholesky.py
+
+# Este módulo contém a fatoração de Cholesky (A = L*Lᵀ) para matrizes simétricas
+# definidas positivas e as substituições que a utilizam. Comparada à fatoração LU,
+# usa cerca de metade das operações e dispensa o pivoteamento.
+#
+# A fatoração falha (retorna None) se algum pivô não for positivo, o que indica que
+# a matriz não é definida positiva; os chamadores então recorrem à fatoração LU.
+import math
+from operator import mul
+from .helper_utils import max_abs_per_column, is_negligible_pivot
+from .matrix_structure import _detect_structure
+
+def cholesky_decompose(matrix):
+    """
+    Fatora uma matriz simétrica na forma A = L*Lᵀ, com L triangular inferior.
+    Apenas a parte triangular inferior de A é lida (a simetria é do chamador).
+
+    Pré-condição: 'matrix' deve ser quadrada e válida (validada pelo chamador).
+
+    Args:
+        matrix (list[list[float]]): A matriz simétrica A.
+
+    Returns:
+        list[list[float]] or None: O fator L (lista de listas), ou None se a matriz
+                                   não for definida positiva (pivô <= 0 ou desprezível).
+    """
+    rows = len(matrix)
+    scales = max_abs_per_column(matrix)
+    lower = [[0.0] * rows for _ in range(rows)]
+
+    for i in range(rows):
+        row_i = lower[i]
+        for j in range(i + 1):
+            row_j = lower[j]
+            # L[i][j] = (A[i][j] - soma(L[i][k] * L[j][k]) para k < j) / L[j][j]
+            value = matrix[i][j] - sum(map(mul, row_i[:j], row_j[:j]))
+            if i == j:
+                # Pivô não positivo (ou desprezível na escala da sua coluna):
+                # a matriz não é definida positiva.
+                if value <= 0 or is_negligible_pivot(value, scales[i]):
+                    return None
+                row_i[i] = math.sqrt(value)
+            else:
+                row_i[j] = value / row_j[j]
+
+    return lower
+
+
+def require_cholesky(matrix):
+    """
+    Fator L para os métodos explícitos "cholesky" (sem recorrer à LU).
+
+    Raises:
+        ValueError: Se a matriz não for simétrica definida positiva.
+    """
+    lower = cholesky_decompose(matrix) if _detect_structure(matrix).symmetric else None
+    if lower is None:
+        raise ValueError("A matriz não é simétrica definida positiva.")
+    return lower
+
+
+def cholesky_solve(lower, rhs):
+    """
+    Resolve A*x = b a partir do fator L de 'cholesky_decompose':
+    substituição progressiva (L*y = b) seguida da regressiva (Lᵀ*x = y). Custo O(n²).
+
+    Args:
+        lower (list[list[float]]): O fator L.
+        rhs (list[float]): O vetor b como lista simples de n números.
+
+    Returns:
+        list[float]: O vetor solução x como lista simples de n números.
+    """
+    rows = len(lower)
+
+    # 1. Substituição Progressiva: y[i] = (b[i] - soma(L[i][j] * y[j]) para j < i) / L[i][i]
+    y = [0.0] * rows
+    for i in range(rows):
+        row = lower[i]
+        y[i] = (rhs[i] - sum(map(mul, row[:i], y[:i]))) / row[i]
+
+    # 2. Substituição Regressiva com Lᵀ, orientada por linhas de L:
+    #    assim que x[i] é conhecido, sua contribuição L[i][k] * x[i] é retirada
+    #    de todos os x[k] com k < i (a linha i de L é a coluna i de Lᵀ).
+    x = y
+    for i in range(rows - 1, -1, -1):
+        row = lower[i]
+        x[i] /= row[i]
+        value = x[i]
+        if value:
+            x[:i] = [a - b * value for a, b in zip(x[:i], row[:i])]
+    return x
+
+
+def cholesky_determinant(lower):
+    """det(A) = (produto da diagonal de L)²."""
+    product = 1.0
+    for i, row in enumerate(lower):
+        product *= row[i]
+    return product * product
+
+
+def cholesky_inverse(lower):
+    """A⁻¹, resolvendo A*X = I coluna a coluna com o mesmo fator L. Custo O(n³)."""
+    rows = len(lower)
+    # A⁻¹ é simétrica: as colunas calculadas já são as suas linhas.
+    return [cholesky_solve(lower, [1.0 if r == c else 0.0 for r in range(rows)]) for c in range(rows)]
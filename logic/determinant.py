@@ -1,63 +1,370 @@
 # calculadora_matrizes/logic/determinant.py
+import math
+from concurrent.futures import ProcessPoolExecutor
+from operator import floordiv, truediv
 from .validation_utils import validate_square_matrix
-from .helper_utils import get_minor 
+from .helper_utils import get_minor
+from .lu_factorization import lu_decompose
+from .finite_field import determinant_mod, is_prime, validate_modulus
+from .matrix_structure import _detect_structure, structured_determinant
+from .cholesky import cholesky_decompose, cholesky_determinant, require_cholesky
+from .matrix import to_nested_list
+from . import backend
 
-def determinant(matrix):
+def determinant(matrix, method="auto", modulus=None):
     """
     Calcula o determinante de uma matriz quadrada.
-    Utiliza o método de expansão de cofatores recursivamente.
+    Por padrão utiliza eliminação de Gauss com pivoteamento parcial (O(n³)).
+    Se todos os elementos forem inteiros, o modo "auto" usa a eliminação de Bareiss
+    (sem frações, O(n³)), que devolve o determinante inteiro exato. Matrizes
+    triangulares (e diagonais, de permutação, identidade) são detectadas e
+    resolvidas em O(n) após a verificação O(n²) da estrutura, e matrizes simétricas
+    definidas positivas usam a fatoração de Cholesky (metade das operações da LU).
+    A expansão de cofatores (O(n!)) continua disponível com method="cofactor",
+    apenas como referência para matrizes pequenas.
     Pré-condição: A matriz de entrada deve ser quadrada (validada internamente).
-    Retorna: O valor do determinante (um número).
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz quadrada.
+        method (str): "auto" (Bareiss para matrizes inteiras, Cholesky para simétricas
+                      definidas positivas, LU caso contrário),
+                      "lu" para eliminação com pivoteamento parcial,
+                      "cholesky" para a fatoração de Cholesky (matriz simétrica definida positiva),
+                      "bareiss" para a eliminação de Bareiss (exata para inteiros),
+                      "modular" para o determinante multimodular (ver determinant_modular),
+                      "cofactor" para a expansão de cofatores recursiva.
+        modulus (int or None): Se informado (um primo p), calcula det(A) em GF(p)
+                               e ignora 'method'. A matriz deve ser de inteiros.
+
+    Returns:
+        O valor do determinante (um número; em GF(p), um inteiro em [0, p)).
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida, se o método for desconhecido,
+                    se o módulo não for primo ou se method="cholesky" e a matriz não
+                    for simétrica definida positiva.
     """
     # 1. Caso Base da Recursão (para menores de matrizes 1x1):
     #    O determinante da "matriz 0x0" (representada por uma lista vazia [])
     #    é definido como 1. Isso é crucial para o cálculo correto dos cofatores.
-    if matrix == []: 
+    if matrix == []:
         return 1
 
     # 2. Validação da Matriz de Entrada:
     #    Verifica se a 'matrix' é realmente quadrada e uma estrutura válida.
     #    A função 'validate_square_matrix' lança um ValueError se não for.
     #    O nome "Matriz para determinante" é passado para mensagens de erro mais claras.
-    validate_square_matrix(matrix, "Matriz para determinante") 
-    
-    # 3. Obtenção do Tamanho da Matriz:
+    validate_square_matrix(matrix, "Matriz para determinante")
+
+    #    Aritmética em GF(p): eliminação com inteiros módulo p (ver finite_field).
+    if modulus is not None:
+        validate_modulus(modulus)
+        return determinant_mod(to_nested_list(matrix), modulus)
+
+    # 3. Seleção do Algoritmo:
+    #    A validação é feita uma única vez aqui; as funções internas assumem
+    #    que a matriz já é quadrada e bem formada.
+    #    Um Matrix é convertido para listas: a eliminação O(n³) domina o custo O(n²) da conversão.
+    return _determinant(to_nested_list(matrix), method)
+
+
+def _determinant(matrix, method="auto"):
+    """
+    (Função auxiliar interna) Seleção do algoritmo de determinante, sem validação.
+    Usada por determinant e pelas operações compostas (inversa pela adjunta,
+    cofatores), cujas matrizes já têm formato garantido.
+    """
+    #    O menor de uma matriz 1x1 é a "matriz 0x0" [], cujo determinante é 1.
+    if not matrix:
+        return 1
+    #    No modo "auto", a estrutura é verificada primeiro (O(n²)): matrizes triangulares,
+    #    diagonais, de permutação e a identidade têm o determinante em O(n).
+    if method == "auto":
+        structure = _detect_structure(matrix)
+        det = structured_determinant(matrix, structure)
+        if det is not None:
+            return det
+    #    Matrizes só de inteiros usam Bareiss (resultado exato); as simétricas
+    #    tentam Cholesky (se a fatoração falhar, a matriz não é definida positiva
+    #    e o cálculo segue pela LU) e matrizes grandes de floats vão para o
+    #    backend NumPy (se disponível).
+    if method == "auto" and _is_integer_matrix(matrix):
+        return _determinant_bareiss(matrix)
+    if method == "auto" and structure.symmetric:
+        lower = cholesky_decompose(matrix)
+        if lower is not None:
+            return cholesky_determinant(lower)
+    if method == "auto" and backend.should_use_numpy(matrix):
+        return backend.numpy_determinant(matrix)
+    if method == "bareiss":
+        return _determinant_bareiss(matrix)
+    if method == "modular":
+        return _determinant_modular(matrix)
+    if method == "cholesky":
+        return cholesky_determinant(require_cholesky(matrix))
+    if method in ("auto", "lu"):
+        return _determinant_lu(matrix)
+    if method == "cofactor":
+        return _determinant_cofactor(matrix)
+    raise ValueError(f"Método de determinante desconhecido: '{method}'.")
+
+
+def _determinant_lu(matrix):
+    """
+    (Função auxiliar interna) Determinante por eliminação de Gauss com pivoteamento parcial.
+    Reduz a matriz à forma triangular superior; o determinante é o produto
+    dos pivôs, com o sinal invertido a cada troca de linhas. Custo O(n³).
+    """
+    rows = len(matrix)
+
+    # 1. Casos Base (resultados exatos para inteiros, sem divisões):
+    if rows == 1:
+        return matrix[0][0]
+    if rows == 2:
+        return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
+
+    # 2. Fatoração P*A = L*U (compartilhada com a resolução de sistemas):
+    #    Um 'sign' igual a zero indica um pivô exatamente zero; pivôs não nulos,
+    #    por menores que sejam, entram no produto.
+    lu, _, sign = lu_decompose(matrix)
+    if sign == 0:
+        return 0
+
+    # 3. Produto dos Pivôs (diagonal de U) com o sinal das trocas de linhas:
+    det = sign
+    for k in range(rows):
+        det *= lu[k][k]
+    return det
+
+
+def slogdet(matrix):
+    """
+    Calcula o sinal e o logaritmo natural do valor absoluto do determinante.
+    O determinante de matrizes grandes facilmente transborda para inf (ou vai a 0.0)
+    em ponto flutuante, mesmo quando log|det| é um número moderado; aqui os
+    log|pivô| são somados durante a eliminação, sem nunca formar o produto.
+
+    Ex: slogdet(100 * I de 200x200) = (1, 200 * log(100)) ≈ (1, 921.03),
+        enquanto det = 1e400 não é representável como float.
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz quadrada.
+
+    Returns:
+        tuple: (sign, logabsdet)
+            - sign (int): +1 ou -1, ou 0 se algum pivô for exatamente zero.
+            - logabsdet (float): log|det(A)|, ou -inf se algum pivô for exatamente zero.
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida.
+    """
+    # 1. Validação da Matriz de Entrada:
+    validate_square_matrix(matrix, "Matriz para determinante")
+    matrix = to_nested_list(matrix)
+
+    #    Matrizes grandes de floats vão para o backend NumPy (se disponível).
+    if backend.should_use_numpy(matrix):
+        return backend.numpy_slogdet(matrix)
+
+    # 2. Fatoração P*A = L*U: apenas um pivô exatamente zero torna o determinante
+    #    nulo; pivôs não nulos, por menores que sejam, nunca são descartados.
+    lu, _, sign = lu_decompose(matrix)
+    if sign == 0:
+        return 0, -math.inf
+
+    # 3. Soma dos log|pivô| de todos os pivôs, acumulando o sinal de cada um:
+    logabsdet = 0.0
+    for k in range(len(lu)):
+        pivot = lu[k][k]
+        if pivot < 0:
+            sign = -sign
+        logabsdet += math.log(abs(pivot))
+    return sign, logabsdet
+
+
+def _is_integer_matrix(matrix):
+    """(Função auxiliar interna) True se todos os elementos forem do tipo int."""
+    return all(type(value) is int for row in matrix for value in row)
+
+
+def _determinant_bareiss(matrix):
+    """
+    (Função auxiliar interna) Determinante pela eliminação de Bareiss (sem frações).
+    Cada passo calcula a[r][c] = (pivô * a[r][c] - a[r][k] * a[k][c]) / pivô_anterior,
+    e a divisão é sempre exata: para entradas inteiras todos os valores intermediários
+    são inteiros (menores da matriz original), e o último pivô é o determinante.
+    Custo O(n³) operações, sem erro de arredondamento (para int e Fraction).
+    """
+    rows = len(matrix)
+    #    Inteiros usam divisão inteira (exata); outros tipos, divisão comum.
+    divide = floordiv if _is_integer_matrix(matrix) else truediv
+
+    # 1. Cópia de Trabalho e Estado Inicial:
+    work = [list(row) for row in matrix]
+    sign = 1
+    previous_pivot = 1
+
+    for k in range(rows - 1):
+        # 2. Pivô Não Nulo:
+        #    Se a[k][k] for zero, troca com a primeira linha abaixo que tenha
+        #    elemento não nulo na coluna k (invertendo o sinal). Sem nenhuma, det = 0.
+        if work[k][k] == 0:
+            swap_row = next((r for r in range(k + 1, rows) if work[r][k] != 0), None)
+            if swap_row is None:
+                return 0
+            work[k], work[swap_row] = work[swap_row], work[k]
+            sign = -sign
+
+        # 3. Atualização Fração-Livre das Linhas Abaixo do Pivô:
+        #    A divisão é exata pela identidade de Sylvester.
+        pivot_line = work[k]
+        pivot = pivot_line[k]
+        for r in range(k + 1, rows):
+            row = work[r]
+            factor = row[k]
+            row[k + 1:] = [divide(pivot * x - factor * y, previous_pivot)
+                           for x, y in zip(row[k + 1:], pivot_line[k + 1:])]
+        previous_pivot = pivot
+
+    # 4. O último elemento da diagonal é o determinante (com o sinal das trocas):
+    return sign * work[-1][-1]
+
+
+def _determinant_cofactor(matrix):
+    """
+    (Função auxiliar interna) Determinante por expansão de cofatores ao longo da linha 0.
+    Custo O(n!): mantido apenas como implementação de referência para matrizes pequenas.
+    """
+    # 1. Obtenção do Tamanho da Matriz:
     #    'rows' armazena o número de linhas (que é igual ao número de colunas).
-    rows = len(matrix) 
+    rows = len(matrix)
 
-    # 4. Casos Base para Matrizes Pequenas (Otimização e Fim da Recursão):
+    # 2. Casos Base para Matrizes Pequenas (Otimização e Fim da Recursão):
     #    a) Matriz 1x1: O determinante é o próprio elemento.
     #       Ex: det([[a]]) = a
     if rows == 1:
         return matrix[0][0]
-    
+
     #    b) Matriz 2x2: O determinante é calculado pela fórmula ad - bc.
     #       Ex: det([[a,b],[c,d]]) = a*d - b*c
     if rows == 2:
         return matrix[0][0] * matrix[1][1] - matrix[0][1] * matrix[1][0]
 
-    # 5. Cálculo do Determinante por Expansão de Cofatores (para matrizes > 2x2):
+    # 3. Cálculo do Determinante por Expansão de Cofatores (para matrizes > 2x2):
     #    Inicializa o valor do determinante.
     det = 0
 
     #    Itera sobre os elementos da primeira linha da matriz (poderia ser qualquer linha ou coluna).
     #    'c_col' é o índice da coluna do elemento atual na primeira linha.
-    for c_col in range(rows): 
+    for c_col in range(rows):
         #    a) Obtenção do Menor:
         #       'minor_matrix' é a submatriz obtida removendo a primeira linha (linha 0)
         #       e a coluna 'c_col' da matriz original.
         minor_matrix = get_minor(matrix, 0, c_col)
-        
+
         #    b) Cálculo do Sinal do Cofator:
         #       O sinal alterna: + - + - ... e é dado por (-1)^(linha_idx + coluna_idx).
         #       Como estamos na linha 0 (índice 0), o sinal é (-1)^(0 + c_col) = (-1)^c_col.
-        sign = (-1)**c_col 
-        
+        sign = (-1)**c_col
+
         #    c) Acumulação do Termo da Expansão:
         #       O determinante é a soma dos produtos:
         #       sinal * elemento_da_primeira_linha * determinante_do_menor_correspondente.
-        #       A chamada 'determinant(minor_matrix)' é a chamada recursiva.
-        det += sign * matrix[0][c_col] * determinant(minor_matrix)
-        
-    # 6. Retorno do Determinante Calculado:
-    return det
\ No newline at end of file
+        #       A chamada recursiva não revalida o menor, que é quadrado por construção.
+        det += sign * matrix[0][c_col] * _determinant_cofactor(minor_matrix)
+
+    # 4. Retorno do Determinante Calculado:
+    return det
+
+
+# Limite dos primos usados pelo determinante multimodular: primos do tamanho de uma
+# palavra de 64 bits. Em Python puro o custo de cada operação módulo p quase não
+# depende do tamanho de p, então primos maiores reduzem o número de eliminações.
+MODULAR_PRIME_LIMIT = 2 ** 62
+
+def determinant_modular(matrix, workers=None):
+    """
+    Calcula o determinante exato de uma matriz de inteiros pelo método multimodular.
+
+    O determinante é calculado módulo vários primos p < 2^62, cada um por uma
+    eliminação O(n³) com números pequenos (independentes entre si, executadas em
+    paralelo em um ProcessPoolExecutor). O resultado é reconstruído pelo Teorema
+    Chinês do Resto; a quantidade de primos é a necessária para que o produto dos
+    módulos supere o dobro da cota de Hadamard |det(A)| <= prod(||linha_i||).
+    Evita o crescimento dos coeficientes intermediários da eliminação de Bareiss.
+
+    Args:
+        matrix (list[list[int]] or Matrix): A matriz quadrada de inteiros.
+        workers (int or None): Número de processos (padrão: número de CPUs).
+                               Com workers=1 o cálculo é feito no próprio processo.
+
+    Returns:
+        int: O determinante exato.
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida ou tiver elementos não inteiros.
+    """
+    validate_square_matrix(matrix, "Matriz para determinante")
+    return _determinant_modular(to_nested_list(matrix), workers)
+
+
+def _determinant_modular(matrix, workers=None):
+    """
+    (Função auxiliar interna) Determinante multimodular para matrizes já validadas.
+    """
+    if not _is_integer_matrix(matrix):
+        raise ValueError("Matriz para determinante deve conter apenas números inteiros para o método modular.")
+
+    # 1. Quantos Primos São Necessários (cota de Hadamard):
+    #    O produto dos módulos deve superar 2 * cota para que o resíduo, lido no
+    #    intervalo simétrico (-M/2, M/2], seja o próprio determinante.
+    bound = 1
+    for row in matrix:
+        bound *= math.isqrt(sum(value * value for value in row)) + 1
+    primes = []
+    modulus = 1
+    for prime in _primes_below(MODULAR_PRIME_LIMIT):
+        if modulus > 2 * bound:
+            break
+        primes.append(prime)
+        modulus *= prime
+
+    # 2. Determinantes Módulo Cada Primo (em paralelo, se houver mais de um primo):
+    residues = _map_determinant_mod_p(matrix, primes, workers)
+
+    # 3. Reconstrução pelo Teorema Chinês do Resto:
+    #    Combina os resíduos um a um: x ≡ r (mod m) e x ≡ r_p (mod p).
+    result, combined = 0, 1
+    for prime, residue in zip(primes, residues):
+        step = (residue - result) * pow(combined, -1, prime) % prime
+        result += combined * step
+        combined *= prime
+
+    # 4. Representante Simétrico (o determinante pode ser negativo):
+    return result - combined if result > combined // 2 else result
+
+
+def _map_determinant_mod_p(matrix, primes, workers):
+    """
+    (Função auxiliar interna) Calcula det(A) mod p para cada primo (ver finite_field).
+    Usa um ProcessPoolExecutor quando há mais de um primo e mais de um processo;
+    se o pool não puder ser criado (ex: ambiente sem multiprocessamento),
+    o cálculo é feito em série no próprio processo.
+    """
+    if len(primes) > 1 and workers != 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(determinant_mod, [matrix] * len(primes), primes))
+        except (OSError, NotImplementedError, RuntimeError):
+            pass
+    return [determinant_mod(matrix, prime) for prime in primes]
+
+
+def _primes_below(limit):
+    """(Função auxiliar interna) Gera os primos menores que 'limit', em ordem decrescente."""
+    candidate = limit - 1 if limit % 2 == 0 else limit - 2
+    while candidate > 2:
+        if is_prime(candidate):
+            yield candidate
+        candidate -= 2
+
@@ -0,0 +1,219 @@
+# calculadora_matrizes/logic/expression.py
+
+# Este módulo contém a API de expressões preguiçosas (lazy) sobre as operações de
+# matrizes. Em vez de calcular cada passo, expr(A) * 2 + (expr(B) - C) monta um
+# pequeno grafo, que só é avaliado em evaluate():
+#
+#   add_matrices(scalar_multiply(A, 2), subtract_matrices(B, C))
+#       -> 3 validações, 3 passadas e 2 matrizes intermediárias;
+#   (expr(A) * 2 + (expr(B) - C)).evaluate()
+#       -> cada matriz é validada uma vez (ao entrar na expressão) e o resultado
+#          2*A + B - C é produzido em UMA passada, sem intermediárias.
+#
+# Somas, subtrações e multiplicações por escalar formam sempre uma combinação
+# linear c1*M1 + c2*M2 + ... (os "termos" da expressão); a mesma matriz aparecendo
+# várias vezes tem os coeficientes somados. A avaliação é uma única compreensão
+# fundida sobre os elementos de todos os termos (coeficientes iguais a 1 dispensam
+# as multiplicações). Produtos de matrizes (expr(A) @ B) entram na combinação como
+# um termo avaliado sob demanda; produtos encadeados (expr(A) @ B @ C) são
+# executados na ordem de associação mais barata (ver multiply_chain).
+from numbers import Number
+from operator import mul
+from .validation_utils import validate_matrix_input
+from .multiply_matrices import _chain_order, _multiply_chain
+from .validation_utils import _shape
+from .matrix import Matrix, any_matrix
+
+def expr(matrix):
+    """
+    Inicia uma expressão preguiçosa a partir de uma matriz.
+
+    Ex: (expr(A) * 2 + (expr(B) - C)).evaluate() == 2*A + B - C, em uma passada.
+
+    Args:
+        matrix (list[list[float]] or Matrix or Expression): A matriz (ou uma expressão,
+                                                             devolvida sem alteração).
+
+    Returns:
+        Expression: A expressão que representa a matriz.
+
+    Raises:
+        ValueError: Se a matriz não for válida.
+    """
+    if isinstance(matrix, Expression):
+        return matrix
+    validate_matrix_input(matrix, "Matriz da expressão")
+    return Expression([(1, matrix)], (len(matrix), len(matrix[0])))
+
+
+class Expression:
+    """
+    Combinação linear preguiçosa de matrizes: soma de termos (coeficiente, matriz).
+    Operadores: +, - (binário e unário), * e / por escalar, @ (produto de matrizes).
+    Os operandos podem ser outras expressões ou matrizes (listas de listas ou Matrix).
+
+    Atributos:
+        terms (list[tuple]): Os termos (coeficiente, matriz ou produto adiado).
+        shape (tuple): As dimensões (linhas, colunas) do resultado.
+    """
+
+    __slots__ = ("terms", "shape")
+
+    def __init__(self, terms, shape):
+        self.terms = terms
+        self.shape = shape
+
+    def __add__(self, other):
+        other = _as_expression(other)
+        if other is NotImplemented:
+            return NotImplemented
+        _require_same_shape(self, other)
+        return Expression(self.terms + other.terms, self.shape)
+
+    def __radd__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is NotImplemented else other + self
+
+    def __sub__(self, other):
+        other = _as_expression(other)
+        if other is NotImplemented:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is NotImplemented else other - self
+
+    def __neg__(self):
+        return self * -1
+
+    def __mul__(self, scalar):
+        #    Apenas escalares: o produto de matrizes usa o operador @.
+        if not isinstance(scalar, Number):
+            return NotImplemented
+        return Expression([(coefficient * scalar, term) for coefficient, term in self.terms], self.shape)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        if not isinstance(scalar, Number):
+            return NotImplemented
+        return Expression([(coefficient / scalar, term) for coefficient, term in self.terms], self.shape)
+
+    def __matmul__(self, other):
+        other = _as_expression(other)
+        if other is NotImplemented:
+            return NotImplemented
+        if self.shape[1] != other.shape[0]:
+            raise ValueError("Número de colunas da Matriz A deve ser igual ao número de linhas da Matriz B para multiplicação.")
+        return Expression([(1, _Product(self, other))], (self.shape[0], other.shape[1]))
+
+    def __rmatmul__(self, other):
+        other = _as_expression(other)
+        return NotImplemented if other is NotImplemented else other @ self
+
+    def __repr__(self):
+        return f"Expression({self.shape[0]}x{self.shape[1]}, {len(self.terms)} termo(s))"
+
+    def evaluate(self):
+        """
+        Avalia a expressão em uma única passada pelos elementos.
+
+        Returns:
+            list[list[float]]: O resultado (um Matrix, se alguma matriz da expressão for Matrix).
+        """
+        # 1. Agrupamento dos Termos: a mesma matriz (mesmo objeto) soma os coeficientes,
+        #    e termos com coeficiente zero são descartados.
+        coefficients = {}
+        operands = {}
+        for coefficient, term in self.terms:
+            key = id(term)
+            coefficients[key] = coefficients.get(key, 0) + coefficient
+            operands[key] = term
+        terms = [(coefficients[key], operands[key]) for key in operands if coefficients[key] != 0]
+
+        rows, cols = self.shape
+
+        #    Todos os termos se cancelaram: zeros, no mesmo tipo dos operandos.
+        if not terms:
+            if _contains_matrix(self.terms):
+                return Matrix._from_flat(rows, cols, [0] * (rows * cols))
+            return [[0] * cols for _ in range(rows)]
+
+        # 2. Materialização dos Produtos Adiados (as demais matrizes são usadas como estão):
+        matrices = [term.evaluate() if isinstance(term, _Product) else term for _, term in terms]
+        scalars = [coefficient for coefficient, _ in terms]
+
+        # 3. Kernel Fundido: um Matrix usa os arrays planos; listas, linha a linha.
+        if any_matrix(*matrices):
+            flats = [Matrix._from_rows(matrix).data for matrix in matrices]
+            return Matrix._from_flat(rows, cols, _combine(scalars, flats))
+        return [_combine(scalars, row_group) for row_group in zip(*matrices)]
+
+
+class _Product:
+    """(Classe auxiliar interna) Produto de duas expressões, calculado apenas na avaliação."""
+
+    __slots__ = ("left", "right")
+
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+
+    def evaluate(self):
+        #    A cadeia inteira de produtos é reunida e executada na ordem mais barata.
+        factors = self._factors()
+        dimensions = [_shape(factors[0])[0]] + [_shape(factor)[1] for factor in factors]
+        _, split = _chain_order(dimensions)
+        return _multiply_chain(factors, split, 0, len(factors) - 1, "auto")
+
+    def _factors(self):
+        """Os fatores da cadeia: produtos aninhados são achatados e matrizes simples usadas sem cópia."""
+        factors = []
+        for side in (self.left, self.right):
+            if len(side.terms) == 1 and side.terms[0][0] == 1:
+                term = side.terms[0][1]
+                factors.extend(term._factors() if isinstance(term, _Product) else [term])
+            else:
+                factors.append(side.evaluate())
+        return factors
+
+
+def _as_expression(operand):
+    """
+    (Função auxiliar interna) Converte um operando (expressão ou matriz) para Expression.
+    Retorna NotImplemented para outros tipos, para que o Python produza o TypeError usual.
+    """
+    if isinstance(operand, Expression):
+        return operand
+    if isinstance(operand, (list, Matrix)):
+        return expr(operand)
+    return NotImplemented
+
+
+def _require_same_shape(left, right):
+    """(Função auxiliar interna) Soma e subtração exigem as mesmas dimensões."""
+    if left.shape != right.shape:
+        raise ValueError("Matrizes devem ter as mesmas dimensões para adição/subtração.")
+
+
+def _contains_matrix(terms):
+    """(Função auxiliar interna) True se algum operando dos termos (ou dos produtos adiados) for Matrix."""
+    for _, term in terms:
+        if isinstance(term, _Product):
+            if _contains_matrix(term.left.terms) or _contains_matrix(term.right.terms):
+                return True
+        elif isinstance(term, Matrix):
+            return True
+    return False
+
+
+def _combine(coefficients, sequences):
+    """
+    (Função auxiliar interna) Combinação linear elemento a elemento de sequências
+    paralelas (linhas ou arrays planos): c1*x1 + c2*x2 + ... em uma única passada.
+    Com todos os coeficientes iguais a 1 (inteiros), os valores são apenas somados.
+    """
+    if all(type(coefficient) is int and coefficient == 1 for coefficient in coefficients):
+        return [sum(values) for values in zip(*sequences)]
+    return [sum(map(mul, coefficients, values)) for values in zip(*sequences)]
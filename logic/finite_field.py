@@ -0,0 +1,224 @@
+# calculadora_matrizes/logic/finite_field.py
+
+# Este módulo contém a aritmética de matrizes sobre o corpo finito GF(p) (inteiros
+# módulo um primo p): determinante, posto, inversa e resolução de sistemas.
+# Os elementos são inteiros comuns, sempre reduzidos ao intervalo [0, p), e a
+# divisão é feita pelo inverso modular pow(x, -1, p): não há Fraction nem float.
+#
+# As operações públicas (determinant, inverse_matrix, solve_linear_system_*,
+# matrix_rank) aceitam o parâmetro 'modulus' e delegam às funções abaixo, que
+# assumem matrizes já validadas (assim como lu_decompose/lu_solve).
+from operator import add
+
+def is_prime(number):
+    """
+    Teste de primalidade de Miller-Rabin, determinístico para number < 3.3 * 10^24
+    (bases: os 12 primeiros primos), o que cobre qualquer primo de 64 bits.
+    """
+    if number < 2:
+        return False
+    bases = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+    if number in bases:
+        return True
+    if any(number % base == 0 for base in bases):
+        return False
+    d, s = number - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for base in bases:
+        x = pow(base, d, number)
+        if x in (1, number - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def validate_modulus(modulus):
+    """
+    Valida o módulo de GF(p): deve ser um inteiro primo.
+
+    Raises:
+        ValueError: Se 'modulus' não for um inteiro primo.
+    """
+    if type(modulus) is not int or not is_prime(modulus):
+        raise ValueError(f"O módulo deve ser um número primo para operações em GF(p) (recebido: {modulus!r}).")
+    return True
+
+
+def _reduce(matrix, modulus, matrix_name="Matriz"):
+    """
+    (Função auxiliar interna) Cópia da matriz com os elementos reduzidos a [0, p).
+
+    Raises:
+        ValueError: Se algum elemento não for inteiro.
+    """
+    if not all(type(value) is int for row in matrix for value in row):
+        raise ValueError(f"{matrix_name} deve conter apenas números inteiros para operações em GF({modulus}).")
+    return [[value % modulus for value in row] for row in matrix]
+
+
+def _pack(row, field_bytes):
+    """(Função auxiliar interna) Empacota uma linha de inteiros não negativos em um único inteiro."""
+    return int.from_bytes(b"".join(value.to_bytes(field_bytes, "little") for value in row), "little")
+
+
+def _unpack(packed, field_bytes, length, modulus):
+    """(Função auxiliar interna) Desempacota uma linha, reduzindo cada campo módulo p."""
+    data = packed.to_bytes(field_bytes * length, "little")
+    return [int.from_bytes(data[i:i + field_bytes], "little") % modulus
+            for i in range(0, field_bytes * length, field_bytes)]
+
+
+def _eliminate(work, modulus, pivot_columns, reduce_above=False, stop_when_singular=False):
+    """
+    (Função auxiliar interna) Eliminação de Gauss in-place sobre GF(p).
+
+    Percorre as 'pivot_columns' primeiras colunas; cada linha pivô é normalizada
+    (pivô = 1) e a coluna é zerada nas linhas abaixo (e acima, se reduce_above=True,
+    o que resulta na forma escalonada reduzida de Gauss-Jordan). As colunas seguintes
+    (ex: lados direitos de um sistema) são transformadas junto. Ao final, 'work'
+    contém a matriz transformada com elementos em [0, p).
+
+    Linhas empacotadas: cada linha é guardada como um único inteiro, com um campo
+    de largura fixa por coluna, de modo que "linha += (p - fator) * linha_pivô" é
+    UMA multiplicação e UMA soma de inteiros grandes (feitas em C), em vez de um
+    laço Python sobre as colunas. Como a linha pivô e o fator são reduzidos e as
+    parcelas somadas são não negativas, nenhum campo "empresta" do vizinho; cada
+    campo recebe no máximo uma parcela (< p²) por passo, então a largura é escolhida
+    para comportar p + n·p² sem transbordar, e a redução módulo p só acontece quando
+    a linha vira pivô e no final.
+
+    Returns:
+        tuple: (rank, det) — o número de pivôs encontrados e o produto dos pivôs
+               com o sinal das trocas de linhas (0 se faltar algum pivô).
+    """
+    rows = len(work)
+    length = len(work[0])
+    field_bytes = ((rows + 1) * modulus * modulus).bit_length() // 8 + 1
+    field_bits = 8 * field_bytes
+    mask = (1 << field_bits) - 1
+    packed = [_pack(row, field_bytes) for row in work]
+    rank = 0
+    det = 1
+
+    for c in range(pivot_columns):
+        shift = c * field_bits
+
+        # 1. Pivô Não Nulo na coluna c (qualquer elemento não nulo serve: a aritmética é exata):
+        pivot_row = next((r for r in range(rank, rows) if (packed[r] >> shift & mask) % modulus), None)
+        if pivot_row is None:
+            det = 0
+            if stop_when_singular:
+                break
+            continue
+        if pivot_row != rank:
+            packed[rank], packed[pivot_row] = packed[pivot_row], packed[rank]
+            det = -det
+
+        # 2. Normalização (e Redução) da Linha Pivô pelo inverso modular:
+        #    Os elementos antes da coluna c são nulos (mod p) nesta linha.
+        pivot_line = _unpack(packed[rank], field_bytes, length, modulus)
+        pivot = pivot_line[c]
+        det = det * pivot % modulus
+        inverse = pow(pivot, -1, modulus)
+        pivot_packed = _pack([value * inverse % modulus for value in pivot_line], field_bytes)
+        packed[rank] = pivot_packed
+
+        # 3. Eliminação da Coluna c nas Demais Linhas: linha += (p - fator) * linha_pivô.
+        for r in (range(rows) if reduce_above else range(rank + 1, rows)):
+            if r == rank:
+                continue
+            factor = (packed[r] >> shift & mask) % modulus
+            if factor:
+                packed[r] += (modulus - factor) * pivot_packed
+        rank += 1
+
+    # 4. Desempacotamento, com os elementos reduzidos a [0, p):
+    work[:] = [_unpack(row, field_bytes, length, modulus) for row in packed]
+    return rank, det % modulus
+
+
+def determinant_mod(matrix, modulus):
+    """
+    det(A) mod p por eliminação de Gauss em GF(p). Custo O(n³) com inteiros pequenos.
+    Pré-condição: 'matrix' quadrada e validada; 'modulus' primo.
+
+    Returns:
+        int: O determinante em [0, p).
+    """
+    work = _reduce(matrix, modulus, "Matriz para determinante")
+    _, det = _eliminate(work, modulus, len(work), stop_when_singular=True)
+    return det
+
+
+def rank_mod(matrix, modulus):
+    """
+    Posto de A sobre GF(p) (número de pivôs da forma escalonada).
+    Pré-condição: 'matrix' validada (não precisa ser quadrada); 'modulus' primo.
+
+    Returns:
+        int: O posto da matriz.
+    """
+    work = _reduce(matrix, modulus, "Matriz para posto")
+    rank, _ = _eliminate(work, modulus, len(work[0]))
+    return rank
+
+
+def inverse_mod(matrix, modulus):
+    """
+    A⁻¹ sobre GF(p), por Gauss-Jordan sobre a matriz aumentada [A | I].
+    Pré-condição: 'matrix' quadrada e validada; 'modulus' primo.
+
+    Returns:
+        list[list[int]]: A inversa, com elementos em [0, p).
+
+    Raises:
+        ValueError: Se A não for invertível em GF(p).
+    """
+    rows = len(matrix)
+    work = _reduce(matrix, modulus, "Matriz para inversão")
+    for r, row in enumerate(work):
+        row.extend(1 if c == r else 0 for c in range(rows))
+    rank, _ = _eliminate(work, modulus, rows, reduce_above=True, stop_when_singular=True)
+    if rank < rows:
+        raise ValueError(f"A matriz não é invertível em GF({modulus}) (determinante é zero).")
+    return [row[rows:] for row in work]
+
+
+def solve_mod(matrix_a, matrix_b, modulus):
+    """
+    Resolve A*X = B sobre GF(p): eliminação progressiva sobre [A | B] seguida de
+    substituição regressiva. B pode ter várias colunas (N x k).
+    Pré-condição: A quadrada, B com o mesmo número de linhas, ambas validadas; 'modulus' primo.
+
+    Returns:
+        list[list[int]]: A solução X (N x k), com elementos em [0, p).
+
+    Raises:
+        ValueError: Se A não for invertível em GF(p).
+    """
+    rows = len(matrix_a)
+    work = [row_a + row_b for row_a, row_b in zip(_reduce(matrix_a, modulus, "Matriz A (coeficientes)"),
+                                                  _reduce(matrix_b, modulus, "Vetor B (termos independentes)"))]
+    rank, _ = _eliminate(work, modulus, rows, stop_when_singular=True)
+    if rank < rows:
+        raise ValueError(f"A matriz não é invertível em GF({modulus}) (determinante é zero).")
+
+    # Substituição Regressiva (U tem diagonal unitária após a normalização):
+    # x_i = b'_i - soma(U[i][j] * x_j) para j > i, feita sobre as k colunas de uma vez.
+    solution = [None] * rows
+    for i in range(rows - 1, -1, -1):
+        row = work[i]
+        x = row[rows:]
+        for j in range(i + 1, rows):
+            factor = row[j]
+            if factor:
+                x = list(map(add, x, map((modulus - factor).__mul__, solution[j])))
+        solution[i] = [value % modulus for value in x]
+    return solution
@@ -1,8 +1,10 @@
 # calculadora_matrizes/logic/helper_utils.py
 
-# Importação de 'determinant' e 'transpose_matrix' é feita dentro das funções 
+# Importação de '_determinant' e '_transpose' é feita dentro das funções 
 # que as utilizam (get_cofactor, adjoint_matrix) para evitar importações circulares
 # caso este módulo helper_utils também fosse importado por eles no nível do módulo.
+import math
+from fractions import Fraction
 
 def print_matrix(matrix, name="Matrix"):
     """
@@ -83,7 +85,7 @@ def get_cofactor(matrix, r_idx, c_idx):
         float: O valor do cofator.
     """
     # Importação local para evitar dependência circular no nível do módulo.
-    from .determinant import determinant
+    from .determinant import _determinant
 
     # 1. Obtenção do Menor:
     #    Calcula a submatriz (menor) removendo a linha 'r_idx' e a coluna 'c_idx'.
@@ -95,8 +97,9 @@ def get_cofactor(matrix, r_idx, c_idx):
 
     # 3. Cálculo do Valor do Cofator:
     #    Multiplica o sinal pelo determinante da submatriz (menor).
-    #    A função 'determinant' é chamada recursivamente (ou diretamente se o menor for 2x2, 1x1, ou 0x0).
-    cofactor_value = sign * determinant(minor_matrix)
+    #    O menor é quadrado por construção, por isso usa-se a função interna '_determinant',
+    #    que não revalida a matriz (o menor 0x0 de uma matriz 1x1 tem determinante 1).
+    cofactor_value = sign * _determinant(minor_matrix)
     
     return cofactor_value
 
@@ -152,7 +155,7 @@ def adjoint_matrix(matrix):
         list[list[float]]: A matriz adjunta.
     """
     # Importação local para evitar dependência circular.
-    from .transpose_matrix import transpose_matrix
+    from .transpose_matrix import _transpose
 
     # 1. Cálculo da Matriz de Cofatores:
     #    Primeiro, calcula-se a matriz de cofatores da 'matrix' original.
@@ -160,7 +163,120 @@ def adjoint_matrix(matrix):
 
     # 2. Transposição da Matriz de Cofatores:
     #    A matriz adjunta é obtida transpondo a matriz de cofatores.
-    adj_matrix = transpose_matrix(cofactor_m)
+    #    A matriz de cofatores foi construída aqui, por isso não é revalidada.
+    adj_matrix = _transpose(cofactor_m)
     
     # 3. Retorno da Matriz Adjunta:
-    return adj_matrix
\ No newline at end of file
+    return adj_matrix
+
+# Tolerância relativa usada pelos algoritmos de eliminação (LU, Gauss-Jordan)
+# para decidir se um pivô em ponto flutuante deve ser tratado como zero.
+PIVOT_TOLERANCE = 1e-12
+
+def max_abs_per_column(matrix):
+    """
+    Retorna o maior valor absoluto de cada coluna de 'matrix'.
+    Usado como escala relativa de cada pivô: uma coluna inteira de valores
+    pequenos (ex: 1e-13) não é confundida com resíduo de arredondamento.
+
+    Args:
+        matrix (list[list[float]]): A matriz (assumida válida e não vazia).
+
+    Returns:
+        list[float]: O maior |a_ij| de cada coluna j.
+    """
+    return [max(abs(value) for value in column) for column in zip(*matrix)]
+
+
+def is_negligible_pivot(value, scale):
+    """
+    Decide se um pivô encontrado durante uma eliminação deve ser considerado nulo.
+
+    Para floats, o pivô é desprezível quando |pivô| <= PIVOT_TOLERANCE * escala,
+    o que absorve os resíduos de arredondamento de matrizes singulares
+    (ex: 1e-17 em vez de 0). Para tipos exatos (int, Fraction) a comparação
+    com zero é exata, preservando o comportamento da versão por cofatores.
+
+    Args:
+        value (float or int or Fraction): O pivô candidato.
+        scale (float): A escala da coluna do pivô na matriz original
+                       (ver max_abs_per_column).
+
+    Returns:
+        bool: True se o pivô deve ser tratado como zero.
+    """
+    if isinstance(value, float):
+        return abs(value) <= PIVOT_TOLERANCE * scale
+    return value == 0
+
+
+def _to_integer_rows(matrix_a, matrix_b, matrix_name):
+    """
+    (Função auxiliar interna) Monta a matriz aumentada [A | B] com entradas inteiras.
+    Cada linha é multiplicada pelo mínimo múltiplo comum dos denominadores de seus
+    elementos (Fraction, ou floats convertidos exatamente); escalar uma linha inteira
+    de [A | B] não altera a solução de A*X = B.
+    """
+    augmented = []
+    for row_a, row_b in zip(matrix_a, matrix_b):
+        row = []
+        for value in list(row_a) + list(row_b):
+            if type(value) is bool or not isinstance(value, (int, float, Fraction)):
+                raise ValueError(f"{matrix_name} deve conter apenas números inteiros, frações ou reais para o modo exato.")
+            if isinstance(value, float) and not math.isfinite(value):
+                raise ValueError(f"{matrix_name} contém valores não finitos (inf ou nan), incompatíveis com o modo exato.")
+            row.append(Fraction(value))
+        multiplier = math.lcm(*(value.denominator for value in row))
+        augmented.append([value.numerator * (multiplier // value.denominator) for value in row])
+    return augmented
+
+
+def fraction_free_solve(matrix_a, matrix_b, matrix_name="Matriz"):
+    """
+    Resolve A*X = B exatamente por eliminação de Gauss-Jordan sem frações.
+
+    A eliminação é feita sobre a matriz aumentada [A | B] em inteiros: a cada
+    passo, as linhas r != k recebem (pivô * a[r][c] - a[r][k] * a[k][c]) / pivô_anterior,
+    divisão que é sempre exata (como na eliminação de Bareiss). Ao final a parte A
+    é diagonal, com todos os elementos iguais a ±det(A), e a solução é obtida com
+    uma única Fraction por elemento de X, o que minimiza o trabalho com mdc.
+
+    Pré-condição: A quadrada (n x n) e B com n linhas, ambas já validadas.
+
+    Args:
+        matrix_a (list[list]): A matriz A, com elementos int, Fraction ou float.
+        matrix_b (list[list]): A matriz B (n x k); use a identidade para obter A⁻¹.
+        matrix_name (str): Nome usado nas mensagens de erro.
+
+    Returns:
+        list[list[Fraction]]: A solução X (n x k) exata.
+
+    Raises:
+        ValueError: Se A for singular ou se houver elementos de tipo não suportado.
+    """
+    rows = len(matrix_a)
+    work = _to_integer_rows(matrix_a, matrix_b, matrix_name)
+    previous_pivot = 1
+
+    for k in range(rows):
+        # 1. Pivô Não Nulo (comparação exata com zero):
+        pivot_row = next((r for r in range(k, rows) if work[r][k] != 0), None)
+        if pivot_row is None:
+            raise ValueError("A matriz não é invertível (determinante é zero).")
+        if pivot_row != k:
+            work[k], work[pivot_row] = work[pivot_row], work[k]
+
+        # 2. Eliminação Sem Frações acima e abaixo do pivô:
+        pivot_line = work[k]
+        pivot = pivot_line[k]
+        for r in range(rows):
+            if r == k:
+                continue
+            row = work[r]
+            factor = row[k]
+            row[:] = [(pivot * x - factor * y) // previous_pivot for x, y in zip(row, pivot_line)]
+        previous_pivot = pivot
+
+    # 3. Solução: X[r][c] = B'[r][c] / A'[r][r], com A' diagonal.
+    #    Só aqui as frações são formadas (e reduzidas).
+    return [[Fraction(value, work[r][r]) for value in work[r][rows:]] for r in range(rows)]
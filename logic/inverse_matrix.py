@@ -2,74 +2,222 @@
 
 # Importa as funções necessárias de outros módulos dentro do pacote 'logic'.
 # - validate_square_matrix: Garante que a matriz de entrada é quadrada.
-# - determinant: Calcula o determinante da matriz.
+# - _determinant: Calcula o determinante (sem revalidar a matriz) da matriz (usado apenas pelo método da adjunta).
 # - adjoint_matrix: Calcula a matriz adjunta (transposta da matriz de cofatores).
+# - max_abs_per_column / is_negligible_pivot: Critério de pivô nulo compartilhado pelas eliminações.
+# - fraction_free_solve: Gauss-Jordan sem frações, para o modo exato.
+# - inverse_mod / validate_modulus: Inversa em GF(p) (aritmética módulo um primo).
+# - _detect_structure / structured_inverse: Caminhos rápidos para matrizes com estrutura.
+# - cholesky_*: Fatoração de Cholesky para matrizes simétricas definidas positivas.
 from .validation_utils import validate_square_matrix
-from .determinant import determinant
-from .helper_utils import adjoint_matrix 
+from .determinant import _determinant
+from .helper_utils import adjoint_matrix, max_abs_per_column, is_negligible_pivot, fraction_free_solve
+from .finite_field import inverse_mod, validate_modulus
+from .matrix_structure import _detect_structure, structured_inverse
+from .cholesky import cholesky_decompose, cholesky_inverse, require_cholesky
+from .matrix import Matrix, to_nested_list
+from . import backend
 
-def inverse_matrix(matrix):
+def inverse_matrix(matrix, method="auto", exact=False, modulus=None):
     """
     Calcula a matriz inversa de uma dada 'matrix' quadrada.
-    A fórmula utilizada é: A⁻¹ = (1 / det(A)) * adj(A)
-    onde det(A) é o determinante de A e adj(A) é a matriz adjunta de A.
+    Por padrão utiliza a eliminação de Gauss-Jordan com pivoteamento parcial (O(n³)),
+    que detecta a singularidade durante a própria eliminação. Matrizes identidade,
+    de permutação, diagonais e triangulares usam caminhos rápidos (ver matrix_structure),
+    e matrizes simétricas definidas positivas usam a fatoração de Cholesky.
+    A fórmula clássica A⁻¹ = (1 / det(A)) * adj(A) continua disponível com
+    method="adjoint", apenas como referência para matrizes pequenas.
+
+    Com exact=True a inversa é calculada sem arredondamento: a eliminação de
+    Gauss-Jordan é feita sem frações sobre inteiros e os elementos são devolvidos
+    como fractions.Fraction (ex: [[2, 1], [1, 1]] -> [[1, -1], [-1, 2]] exatos).
 
     Args:
         matrix (list[list[float]]): A matriz quadrada para a qual a inversa será calculada.
+        method (str): "auto" ou "gauss_jordan" para a eliminação de Gauss-Jordan,
+                      "cholesky" para a fatoração de Cholesky (matriz simétrica definida positiva),
+                      "adjoint" para o método da matriz adjunta.
+        exact (bool): Se True, usa aritmética exata (ignora 'method').
+        modulus (int or None): Se informado (um primo p), calcula a inversa em GF(p)
+                               (ignora 'method'). A matriz deve ser de inteiros.
 
     Returns:
-        list[list[float]]: A matriz inversa.
+        list[list[float]]: A matriz inversa (um Matrix, se a entrada for Matrix).
+                           No modo exato, sempre uma lista de listas de Fraction.
+                           Em GF(p), elementos inteiros em [0, p).
 
     Raises:
-        ValueError: Se a matriz não for quadrada ou se for singular (determinante igual a zero),
-                    o que significa que a inversa não existe.
+        ValueError: Se a matriz não for quadrada, se for singular (determinante igual a zero),
+                    o que significa que a inversa não existe, se o método for desconhecido,
+                    se o módulo não for primo, se exact=True e modulus forem informados
+                    juntos ou se method="cholesky" e a matriz não for simétrica definida positiva.
     """
     # 1. Validação da Matriz de Entrada:
     #    Verifica se a 'matrix' fornecida é quadrada. Se não for,
     #    'validate_square_matrix' levantará um ValueError.
     #    O nome "Matriz para inversão" é usado para clareza nas mensagens de erro.
     validate_square_matrix(matrix, "Matriz para inversão")
+    if exact and modulus is not None:
+        raise ValueError("Os modos exact=True e modulus= não podem ser combinados: escolha aritmética exata ou GF(p).")
+
+    #    Modo exato: resolve A*X = I sem frações; um Matrix não armazena frações,
+    #    por isso o resultado é sempre uma lista de listas.
+    if exact:
+        return _inverse_exact(to_nested_list(matrix))
+
+    #    Aritmética em GF(p): Gauss-Jordan com inteiros módulo p (ver finite_field).
+    if modulus is not None:
+        validate_modulus(modulus)
+        inverse = inverse_mod(to_nested_list(matrix), modulus)
+        return Matrix._from_rows(inverse) if isinstance(matrix, Matrix) else inverse
+
+    # 2. Seleção do Algoritmo:
+    #    Feita pela função interna, que as operações compostas também usam sem revalidar.
+    return _inverse(matrix, method)
+
+
+def _inverse(matrix, method="auto"):
+    """
+    (Função auxiliar interna) Seleção do algoritmo de inversão, sem validação.
+    Usada por inverse_matrix e por solve_linear_system_inverse.
+    """
+    #    Um Matrix é convertido para listas (a eliminação O(n³) domina a conversão)
+    #    e o resultado é devolvido como Matrix.
+    if isinstance(matrix, Matrix):
+        return Matrix._from_rows(_inverse(to_nested_list(matrix), method))
+
+    #    No modo "auto", a estrutura é verificada primeiro (O(n²)): identidade e
+    #    permutações são invertidas sem aritmética, e triangulares por substituição.
+    if method == "auto":
+        structure = _detect_structure(matrix)
+        inverse = structured_inverse(matrix, structure)
+        if inverse is not None:
+            return inverse
+    #    Matrizes simétricas tentam Cholesky; se a fatoração falhar (a matriz não é
+    #    definida positiva), a inversão segue por Gauss-Jordan.
+    if method == "auto" and structure.symmetric:
+        lower = cholesky_decompose(matrix)
+        if lower is not None:
+            return cholesky_inverse(lower)
+    #    Matrizes grandes de floats vão para o backend NumPy (se disponível).
+    if method == "auto" and backend.should_use_numpy(matrix):
+        return backend.numpy_inverse(matrix)
+    if method in ("auto", "gauss_jordan"):
+        return _inverse_gauss_jordan(matrix)
+    if method == "cholesky":
+        return cholesky_inverse(require_cholesky(matrix))
+    if method == "adjoint":
+        return _inverse_adjoint(matrix)
+    raise ValueError(f"Método de inversão desconhecido: '{method}'.")
+
+
+def _inverse_gauss_jordan(matrix):
+    """
+    (Função auxiliar interna) Inversa por Gauss-Jordan com pivoteamento parcial, in-place.
+    A eliminação é feita sobre uma única cópia n x n da matriz (sem matriz aumentada):
+    a cada passo a coluna do pivô é substituída pela coluna correspondente da inversa.
+    As trocas de linhas são registradas e desfeitas no final como trocas de colunas.
+    """
+    rows = len(matrix)
+
+    # 1. Cópia de Trabalho e Escala de Cada Coluna (a referência de cada pivô):
+    #    A cópia é transformada, passo a passo, na inversa.
+    work = [list(row) for row in matrix]
+    scales = max_abs_per_column(work)
+    swaps = []
+
+    for k in range(rows):
+        # 2. Pivoteamento Parcial:
+        #    Escolhe, na coluna k (da linha k para baixo), o elemento de maior valor absoluto.
+        pivot_row = max(range(k, rows), key=lambda r: abs(work[r][k]))
+        pivot = work[pivot_row][k]
 
-    # 2. Cálculo do Determinante:
+        # 3. Detecção de Singularidade:
+        #    Se nem o melhor pivô é significativo (em relação à escala da coluna k), a
+        #    matriz é singular (mesmo critério de has_negligible_pivot).
+        #    A detecção ocorre durante a eliminação, sem calcular o determinante antes.
+        if is_negligible_pivot(pivot, scales[k]):
+            raise ValueError("A matriz não é invertível (determinante é zero).")
+
+        if pivot_row != k:
+            work[k], work[pivot_row] = work[pivot_row], work[k]
+        swaps.append(pivot_row)
+
+        # 4. Normalização da Linha do Pivô:
+        #    A posição do pivô passa a guardar 1, que após a divisão vira 1/pivô
+        #    (o elemento correspondente da inversa).
+        pivot_line = work[k]
+        pivot_line[k] = 1
+        pivot_line[:] = [x / pivot for x in pivot_line]
+
+        # 5. Eliminação nas Demais Linhas (acima e abaixo do pivô):
+        #    Para cada linha r != k, zera a coluna k (armazenando 0 antes da
+        #    combinação, que então produz o elemento da inversa nessa coluna).
+        for r in range(rows):
+            if r == k:
+                continue
+            row = work[r]
+            factor = row[k]
+            if factor:
+                row[k] = 0
+                row[:] = [x - factor * y for x, y in zip(row, pivot_line)]
+
+    # 6. Desfazendo as Trocas de Linhas:
+    #    A eliminação produziu a inversa de P*A. Como (P*A)⁻¹ = A⁻¹ * P⁻¹,
+    #    a inversa de A é obtida aplicando as trocas às colunas, em ordem inversa.
+    for k in range(rows - 1, -1, -1):
+        p = swaps[k]
+        if p != k:
+            for row in work:
+                row[k], row[p] = row[p], row[k]
+
+    # 7. Retorno da Matriz Inversa:
+    return work
+
+
+def _inverse_exact(matrix):
+    """
+    (Função auxiliar interna) Inversa exata: resolve A*X = I por Gauss-Jordan sem frações.
+    """
+    rows = len(matrix)
+    identity = [[1 if r == c else 0 for c in range(rows)] for r in range(rows)]
+    return fraction_free_solve(matrix, identity, "Matriz para inversão")
+
+
+def _inverse_adjoint(matrix):
+    """
+    (Função auxiliar interna) Inversa pela fórmula A⁻¹ = (1 / det(A)) * adj(A).
+    Custo O(n² · n!) devido aos cofatores: mantida apenas como referência.
+    """
+    # 1. Cálculo do Determinante:
     #    Calcula o determinante (det_a) da matriz. O determinante é essencial
     #    para encontrar a inversa e para verificar se a matriz é invertível.
-    det_a = determinant(matrix)
+    det_a = _determinant(matrix)
 
-    # 3. Verificação de Singularidade:
+    # 2. Verificação de Singularidade:
     #    Se o determinante for zero, a matriz é singular e não possui inversa.
     #    Nesse caso, uma exceção ValueError é levantada.
-    #    A comparação com zero deve ser exata para matemática com inteiros/racionais.
-    #    Para floats, uma pequena tolerância poderia ser considerada, mas aqui seguimos a exatidão.
     if det_a == 0:
         raise ValueError("A matriz não é invertível (determinante é zero).")
 
-    # 4. Cálculo da Matriz Adjunta:
+    # 3. Cálculo da Matriz Adjunta:
     #    Calcula a matriz adjunta (adj_a) da 'matrix'. A matriz adjunta é a
     #    transposta da matriz dos cofatores da 'matrix'.
     adj_a = adjoint_matrix(matrix)
-    
-    # 5. Obtenção das Dimensões da Matriz Adjunta:
+
+    # 4. Obtenção das Dimensões da Matriz Adjunta:
     #    A matriz adjunta terá as mesmas dimensões da matriz original (já que é quadrada).
-    #    Estas dimensões são usadas para criar a matriz inversa.
     rows = len(adj_a)
     cols = len(adj_a[0]) # Para uma matriz quadrada, rows == cols.
 
-    # 6. Inicialização da Matriz Inversa:
-    #    Cria uma nova matriz (inv_matrix) preenchida com zeros,
-    #    com as mesmas dimensões da matriz adjunta (e da original).
+    # 5. Inicialização da Matriz Inversa:
     inv_matrix = [[0 for _ in range(cols)] for _ in range(rows)]
 
-    # 7. Cálculo dos Elementos da Matriz Inversa:
-    #    Itera sobre cada elemento (r, c) da matriz adjunta.
+    # 6. Cálculo dos Elementos da Matriz Inversa:
+    #    A⁻¹[r][c] = adj(A)[r][c] / det(A)
     for r in range(rows):      # Para cada linha r...
         for c in range(cols):  # Para cada coluna c...
-            # Cada elemento da matriz inversa é o elemento correspondente
-            # da matriz adjunta dividido pelo determinante da matriz original.
-            # A⁻¹[r][c] = adj(A)[r][c] / det(A)
-            # A divisão aqui resultará em floats se det_a ou adj_a[r][c] forem floats,
-            # ou se a divisão não for exata.
-            inv_matrix[r][c] = adj_a[r][c] / det_a 
-            
-    # 8. Retorno da Matriz Inversa:
-    #    A matriz 'inv_matrix', agora contendo a inversa da matriz original, é retornada.
-    return inv_matrix
\ No newline at end of file
+            inv_matrix[r][c] = adj_a[r][c] / det_a
+
+    # 7. Retorno da Matriz Inversa:
+    return inv_matrix
@@ -0,0 +1,250 @@
+# calculadora_matrizes/logic/iterative_solvers.py
+
+# Este módulo contém resolvedores iterativos para A*x = b: Gradiente Conjugado
+# (A simétrica definida positiva), Jacobi e Gauss-Seidel (A diagonalmente dominante,
+# por exemplo). Diferentemente dos métodos diretos, A nunca é fatorada nem copiada:
+# cada iteração usa apenas produtos matriz-vetor, o que os torna adequados a sistemas
+# grandes e esparsos, e a uma solução anterior como ponto de partida (x0).
+#
+# A matriz A pode ser:
+#   - uma matriz densa (lista de listas ou Matrix);
+#   - uma função matvec(x) -> A*x sobre listas simples (apenas conjugate_gradient);
+#   - um operador: qualquer objeto com o método matvec(x). Jacobi também usa
+#     diagonal() (lista com A[i][i]) e Gauss-Seidel usa row_dot(i, x) (soma de
+#     A[i][j] * x[j]). Assim, tipos compactos ou esparsos podem ser usados sem
+#     conversão para a forma densa.
+#
+# Os três métodos devolvem um IterativeResult com a solução (vetor coluna Nx1) e o
+# relatório de convergência; a falta de convergência não é um erro, e sim
+# converged=False no relatório.
+import math
+from collections import namedtuple
+from operator import mul
+from .validation_utils import validate_matrix_input, validate_linear_system_inputs
+from .matrix import Matrix, to_nested_list
+
+IterativeResult = namedtuple("IterativeResult", ["solution", "converged", "iterations", "residual_norm"])
+IterativeResult.__doc__ = """
+Resultado de um resolvedor iterativo.
+    solution (list[list[float]]): A solução aproximada x (vetor coluna Nx1).
+    converged (bool): True se ||b - A*x|| <= tol * ||b|| foi atingido.
+    iterations (int): O número de iterações realizadas.
+    residual_norm (float): A norma euclidiana do resíduo final ||b - A*x||.
+"""
+
+# Número máximo de iterações quando 'max_iter' não é informado: max(1000, 10·n).
+DEFAULT_MAX_ITERATIONS = 1000
+
+def conjugate_gradient(matrix_a, vector_b, x0=None, tol=1e-10, max_iter=None):
+    """
+    Resolve A*x = b pelo método do Gradiente Conjugado, para A simétrica definida
+    positiva. Cada iteração custa um produto A*p; em aritmética exata, converge em
+    no máximo n iterações.
+
+    Args:
+        matrix_a: A matriz A (densa, função matvec ou operador; ver o topo do módulo).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos independentes (b).
+        x0 (list[list[float]] or None): Aproximação inicial (vetor coluna Nx1); padrão: zeros.
+        tol (float): Tolerância relativa do resíduo: ||b - A*x|| <= tol * ||b||.
+        max_iter (int or None): Número máximo de iterações (padrão: max(1000, 10·n)).
+
+    Returns:
+        IterativeResult: A solução e o relatório de convergência.
+
+    Raises:
+        ValueError: Se as entradas não forem válidas ou se A se mostrar não definida
+                    positiva durante as iterações (p·A·p <= 0).
+    """
+    # 1. Preparação: operador, b, x0 e resíduo inicial r = b - A*x.
+    matvec, _, rhs, x, max_iter = _prepare(matrix_a, vector_b, x0, tol, max_iter)
+    threshold = tol * _norm(rhs)
+    residual = [b - ax for b, ax in zip(rhs, matvec(x))]
+    direction = list(residual)
+    residual_squared = _dot(residual, residual)
+
+    iterations = 0
+    while math.sqrt(residual_squared) > threshold and iterations < max_iter:
+        # 2. Passo ao Longo da Direção Conjugada: alfa = (r·r) / (p·A·p).
+        a_direction = matvec(direction)
+        curvature = _dot(direction, a_direction)
+        if curvature <= 0:
+            raise ValueError("A matriz não é simétrica definida positiva (Gradiente Conjugado).")
+        alpha = residual_squared / curvature
+        x = [xi + alpha * pi for xi, pi in zip(x, direction)]
+        residual = [ri - alpha * api for ri, api in zip(residual, a_direction)]
+
+        # 3. Nova Direção: p = r + beta * p, com beta = (r_novo·r_novo) / (r·r).
+        new_residual_squared = _dot(residual, residual)
+        beta = new_residual_squared / residual_squared
+        direction = [ri + beta * pi for ri, pi in zip(residual, direction)]
+        residual_squared = new_residual_squared
+        iterations += 1
+
+    # 4. Relatório (o resíduo é recalculado para não acumular o erro da recorrência):
+    return _report(matvec, rhs, x, threshold, iterations)
+
+
+def jacobi(matrix_a, vector_b, x0=None, tol=1e-10, max_iter=None):
+    """
+    Resolve A*x = b pelo método de Jacobi: x_novo = x + D⁻¹ * (b - A*x), com D a
+    diagonal de A. Converge, por exemplo, para A estritamente diagonalmente dominante.
+
+    Args:
+        matrix_a: A matriz A (densa ou operador com matvec e diagonal).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos independentes (b).
+        x0 (list[list[float]] or None): Aproximação inicial (vetor coluna Nx1); padrão: zeros.
+        tol (float): Tolerância relativa do resíduo: ||b - A*x|| <= tol * ||b||.
+        max_iter (int or None): Número máximo de iterações (padrão: max(1000, 10·n)).
+
+    Returns:
+        IterativeResult: A solução e o relatório de convergência.
+
+    Raises:
+        ValueError: Se as entradas não forem válidas, se A não oferecer a diagonal
+                    ou se algum elemento da diagonal for zero.
+    """
+    matvec, operator, rhs, x, max_iter = _prepare(matrix_a, vector_b, x0, tol, max_iter)
+    diagonal = _require_diagonal(operator)
+    threshold = tol * _norm(rhs)
+
+    iterations = 0
+    residual = [b - ax for b, ax in zip(rhs, matvec(x))]
+    while _norm(residual) > threshold and iterations < max_iter:
+        # Atualização simultânea de todas as componentes (usa apenas o x anterior):
+        x = [xi + ri / di for xi, ri, di in zip(x, residual, diagonal)]
+        residual = [b - ax for b, ax in zip(rhs, matvec(x))]
+        iterations += 1
+
+    return _report(matvec, rhs, x, threshold, iterations)
+
+
+def gauss_seidel(matrix_a, vector_b, x0=None, tol=1e-10, max_iter=None):
+    """
+    Resolve A*x = b pelo método de Gauss-Seidel: cada componente é atualizada em
+    sequência, já usando as componentes novas das linhas anteriores
+    (x_i = (b_i - soma(A[i][j] * x_j) para j != i) / A[i][i]). Costuma convergir
+    em cerca de metade das iterações de Jacobi.
+
+    Args:
+        matrix_a: A matriz A (densa ou operador com matvec, diagonal e row_dot).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos independentes (b).
+        x0 (list[list[float]] or None): Aproximação inicial (vetor coluna Nx1); padrão: zeros.
+        tol (float): Tolerância relativa do resíduo: ||b - A*x|| <= tol * ||b||.
+        max_iter (int or None): Número máximo de varreduras (padrão: max(1000, 10·n)).
+
+    Returns:
+        IterativeResult: A solução e o relatório de convergência.
+
+    Raises:
+        ValueError: Se as entradas não forem válidas, se A não oferecer a diagonal
+                    e o acesso às linhas, ou se algum elemento da diagonal for zero.
+    """
+    matvec, operator, rhs, x, max_iter = _prepare(matrix_a, vector_b, x0, tol, max_iter)
+    diagonal = _require_diagonal(operator)
+    if not hasattr(operator, "row_dot"):
+        raise ValueError("Gauss-Seidel requer uma matriz densa ou um operador com row_dot(i, x).")
+    row_dot = operator.row_dot
+    threshold = tol * _norm(rhs)
+
+    iterations = 0
+    residual_norm = _norm([b - ax for b, ax in zip(rhs, matvec(x))])
+    while residual_norm > threshold and iterations < max_iter:
+        # Varredura in-place: x_i += (b_i - A[i]·x) / A[i][i].
+        for i in range(len(x)):
+            x[i] += (rhs[i] - row_dot(i, x)) / diagonal[i]
+        residual_norm = _norm([b - ax for b, ax in zip(rhs, matvec(x))])
+        iterations += 1
+
+    return _report(matvec, rhs, x, threshold, iterations)
+
+
+class _DenseOperator:
+    """(Classe auxiliar interna) Operador sobre uma matriz densa em listas."""
+
+    def __init__(self, matrix):
+        self.matrix = matrix
+
+    def matvec(self, x):
+        return [sum(map(mul, row, x)) for row in self.matrix]
+
+    def diagonal(self):
+        return [row[i] for i, row in enumerate(self.matrix)]
+
+    def row_dot(self, i, x):
+        return sum(map(mul, self.matrix[i], x))
+
+
+def _prepare(matrix_a, vector_b, x0, tol, max_iter):
+    """
+    (Função auxiliar interna) Valida as entradas e devolve
+    (matvec, operador, b, x inicial, max_iter) com b e x como listas simples.
+    """
+    # 1. Operador e Validação de A e b:
+    if isinstance(matrix_a, (list, Matrix)):
+        validate_linear_system_inputs(matrix_a, vector_b)
+        operator = _DenseOperator(to_nested_list(matrix_a))
+        matvec = operator.matvec
+    elif hasattr(matrix_a, "matvec") or callable(matrix_a):
+        validate_matrix_input(vector_b, "Vetor B (termos independentes)")
+        operator = matrix_a
+        matvec = matrix_a.matvec if hasattr(matrix_a, "matvec") else matrix_a
+        shape = getattr(matrix_a, "shape", None)
+        if shape is not None and tuple(shape) != (len(vector_b), len(vector_b)):
+            raise ValueError("Número de linhas da Matriz A (coeficientes) deve ser igual ao número de linhas do Vetor B.")
+    else:
+        raise ValueError("Matriz A deve ser uma matriz, uma função matvec(x) ou um objeto com o método matvec.")
+
+    rhs = _as_column(vector_b, "Vetor B (termos independentes)")
+    rows = len(rhs)
+
+    # 2. Aproximação Inicial (cópia, para não alterar o x0 do chamador):
+    if x0 is None:
+        x = [0.0] * rows
+    else:
+        validate_matrix_input(x0, "Aproximação inicial x0")
+        x = _as_column(x0, "Aproximação inicial x0")
+        if len(x) != rows:
+            raise ValueError("Aproximação inicial x0 deve ter o mesmo número de linhas do Vetor B.")
+
+    # 3. Parâmetros de Parada:
+    if not tol > 0:
+        raise ValueError("A tolerância deve ser um número positivo.")
+    if max_iter is None:
+        max_iter = max(DEFAULT_MAX_ITERATIONS, 10 * rows)
+    elif type(max_iter) is not int or max_iter < 0:
+        raise ValueError("O número máximo de iterações deve ser um inteiro não negativo.")
+    return matvec, operator, rhs, x, max_iter
+
+
+def _as_column(vector, vector_name):
+    """(Função auxiliar interna) Vetor coluna Nx1 (já validado) como lista simples."""
+    rows = to_nested_list(vector)
+    if len(rows[0]) != 1:
+        raise ValueError(f"{vector_name} deve ser um vetor coluna (ter uma única coluna).")
+    return [row[0] for row in rows]
+
+
+def _require_diagonal(operator):
+    """(Função auxiliar interna) A diagonal de A, sem elementos nulos."""
+    if not hasattr(operator, "diagonal"):
+        raise ValueError("Este método requer uma matriz densa ou um operador com diagonal().")
+    diagonal = list(operator.diagonal())
+    if any(value == 0 for value in diagonal):
+        raise ValueError("A diagonal da matriz contém zero: o método não se aplica.")
+    return diagonal
+
+
+def _report(matvec, rhs, x, threshold, iterations):
+    """(Função auxiliar interna) Monta o IterativeResult com o resíduo verdadeiro b - A*x."""
+    residual_norm = _norm([b - ax for b, ax in zip(rhs, matvec(x))])
+    return IterativeResult([[value] for value in x], residual_norm <= threshold, iterations, residual_norm)
+
+
+def _dot(u, v):
+    """(Função auxiliar interna) Produto interno de duas listas simples."""
+    return sum(map(mul, u, v))
+
+
+def _norm(vector):
+    """(Função auxiliar interna) Norma euclidiana de uma lista simples."""
+    return math.sqrt(_dot(vector, vector))
@@ -0,0 +1,270 @@
+# calculadora_matrizes/logic/lu_factorization.py
+
+# Este módulo contém a fatoração LU com pivoteamento parcial (P*A = L*U) e as
+# substituições progressiva/regressiva que a utilizam. A fatoração custa O(n³)
+# e cada resolução posterior custa apenas O(n²), sem nunca formar A⁻¹.
+#
+# A classe LUFactorization guarda o resultado da fatoração para que o mesmo A
+# possa ter determinante, inversa e várias resoluções calculados a partir de
+# uma única fatoração (ver 'factorize').
+from operator import mul
+from .validation_utils import validate_square_matrix, validate_matrix_input
+from .helper_utils import max_abs_per_column, is_negligible_pivot
+from .matrix import Matrix, to_nested_list
+
+def lu_decompose(matrix):
+    """
+    Fatora uma matriz quadrada na forma P*A = L*U com pivoteamento parcial.
+    L (triangular inferior com diagonal unitária) e U (triangular superior) são
+    armazenadas de forma compacta em uma única matriz: os multiplicadores de L
+    ficam abaixo da diagonal e U ocupa a diagonal e a parte de cima.
+
+    Pré-condição: 'matrix' deve ser quadrada e válida (validada pelo chamador).
+
+    Args:
+        matrix (list[list[float]]): A matriz quadrada A.
+
+    Returns:
+        tuple: (lu, perm, sign)
+            - lu (list[list[float]]): L e U compactadas.
+            - perm (list[int]): perm[i] é a linha de A que ocupa a linha i de P*A.
+            - sign (int): +1/-1 conforme a paridade das trocas de linhas, ou 0 se um
+              pivô for exatamente zero (nesse caso a fatoração é interrompida e 'lu'
+              fica incompleta).
+
+    O determinante é sempre o produto dos pivôs com esse sinal; para decidir se
+    o sistema pode ser resolvido, use 'has_negligible_pivot', que também rejeita
+    os pivôs que são apenas resíduo de arredondamento.
+    """
+    # 1. Cópia de Trabalho e Estado Inicial:
+    rows = len(matrix)
+    lu = [list(row) for row in matrix]
+    perm = list(range(rows))
+    sign = 1
+
+    for k in range(rows):
+        # 2. Pivoteamento Parcial:
+        #    Escolhe, na coluna k (da linha k para baixo), o elemento de maior valor absoluto.
+        pivot_row = max(range(k, rows), key=lambda r: abs(lu[r][k]))
+        pivot = lu[pivot_row][k]
+
+        #    Coluna nula da linha k para baixo: o determinante é exatamente zero.
+        if pivot == 0:
+            return lu, perm, 0
+
+        if pivot_row != k:
+            lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+            perm[k], perm[pivot_row] = perm[pivot_row], perm[k]
+            sign = -sign
+
+        # 3. Eliminação abaixo do Pivô:
+        #    O multiplicador de cada linha é guardado na própria coluna k (parte L)
+        #    e o restante da linha é atualizado (parte U).
+        pivot_line = lu[k]
+        for r in range(k + 1, rows):
+            row = lu[r]
+            factor = row[k] / pivot
+            row[k] = factor
+            if factor:
+                row[k + 1:] = [x - factor * y for x, y in zip(row[k + 1:], pivot_line[k + 1:])]
+
+    # 4. Retorno da Fatoração:
+    return lu, perm, sign
+
+
+def has_negligible_pivot(matrix, lu, sign):
+    """
+    Decide se uma fatoração produzida por 'lu_decompose' é de uma matriz singular.
+    Cada pivô é comparado com a escala da SUA coluna na matriz original (ver
+    is_negligible_pivot): resíduos de arredondamento (ex: 1e-17 em uma coluna de
+    ordem 1) são rejeitados, mas uma coluna inteira de valores pequenos, como
+    [0, 0, 1e-13], mantém o pivô 1e-13.
+
+    Args:
+        matrix (list[list[float]]): A matriz original A.
+        lu (list[list[float]]): L e U compactadas.
+        sign (int): O sinal devolvido pela fatoração (0 se houve pivô exatamente zero).
+
+    Returns:
+        bool: True se a matriz deve ser tratada como não invertível.
+    """
+    if sign == 0:
+        return True
+    scales = max_abs_per_column(matrix)
+    return any(is_negligible_pivot(lu[k][k], scales[k]) for k in range(len(lu)))
+
+
+def lu_solve(lu, perm, rhs):
+    """
+    Resolve A*x = b a partir de uma fatoração produzida por 'lu_decompose'.
+    Realiza a substituição progressiva (L*y = P*b) seguida da regressiva (U*x = y).
+    Custo O(n²) por vetor.
+
+    Pré-condição: a fatoração deve ser de uma matriz não singular (ver has_negligible_pivot).
+
+    Args:
+        lu (list[list[float]]): L e U compactadas.
+        perm (list[int]): A permutação de linhas da fatoração.
+        rhs (list[float]): O vetor b como lista simples de n números.
+
+    Returns:
+        list[float]: O vetor solução x como lista simples de n números.
+    """
+    rows = len(lu)
+
+    # 1. Substituição Progressiva (L tem diagonal unitária):
+    #    y[i] = b[perm[i]] - soma(L[i][j] * y[j]) para j < i
+    y = [0] * rows
+    for i in range(rows):
+        y[i] = rhs[perm[i]] - sum(map(mul, lu[i][:i], y[:i]))
+
+    # 2. Substituição Regressiva:
+    #    x[i] = (y[i] - soma(U[i][j] * x[j]) para j > i) / U[i][i]
+    x = [0] * rows
+    for i in range(rows - 1, -1, -1):
+        x[i] = (y[i] - sum(map(mul, lu[i][i + 1:], x[i + 1:]))) / lu[i][i]
+
+    # 3. Retorno da Solução:
+    return x
+
+
+class LUFactorization:
+    """
+    Resultado reutilizável de uma fatoração P*A = L*U.
+    A fatoração é feita uma única vez na construção; determinante, inversa e
+    resoluções de sistemas reaproveitam os mesmos fatores.
+
+    Uma matriz singular pode ser fatorada (det() retorna o produto dos pivôs,
+    zero ou um resíduo de arredondamento), mas inverse(), solve() e solve_many()
+    levantam ValueError nesse caso (ver has_negligible_pivot). Os fatores L e U só
+    não existem quando a fatoração foi interrompida por um pivô exatamente zero.
+
+    Se A (ou B) for um Matrix, solve(), solve_many() e inverse() devolvem um Matrix.
+    """
+
+    def __init__(self, matrix):
+        """
+        Fatora 'matrix'.
+
+        Args:
+            matrix (list[list[float]] or Matrix): A matriz quadrada A.
+
+        Raises:
+            ValueError: Se a matriz não for quadrada ou não for válida.
+        """
+        validate_square_matrix(matrix, "Matriz para fatoração LU")
+        self.size = len(matrix)
+        self._is_matrix = isinstance(matrix, Matrix)
+        matrix = to_nested_list(matrix)
+        self.lu, self.perm, self.sign = lu_decompose(matrix)
+        self._singular = has_negligible_pivot(matrix, self.lu, self.sign)
+
+    @property
+    def is_singular(self):
+        """True se algum pivô for desprezível em relação à escala da sua coluna."""
+        return self._singular
+
+    @property
+    def P(self):
+        """Matriz de permutação P (lista de listas) tal que P*A = L*U."""
+        return [[1 if c == self.perm[r] else 0 for c in range(self.size)] for r in range(self.size)]
+
+    @property
+    def L(self):
+        """Fator triangular inferior L, com diagonal unitária."""
+        self._require_complete()
+        return [[self.lu[r][c] if c < r else (1 if c == r else 0) for c in range(self.size)]
+                for r in range(self.size)]
+
+    @property
+    def U(self):
+        """Fator triangular superior U."""
+        self._require_complete()
+        return [[self.lu[r][c] if c >= r else 0 for c in range(self.size)] for r in range(self.size)]
+
+    def det(self):
+        """
+        Determinante de A: o produto da diagonal de U com o sinal das trocas de linhas.
+        Custo O(n) após a fatoração.
+        """
+        if self.sign == 0:
+            return 0
+        det = self.sign
+        for i in range(self.size):
+            det *= self.lu[i][i]
+        return det
+
+    def solve(self, vector_b):
+        """
+        Resolve A*X = B para um vetor coluna B (matriz Nx1). Custo O(n²).
+
+        Returns:
+            list[list[float]]: O vetor coluna (matriz Nx1) da solução (X); um Matrix,
+                               se A ou B for Matrix.
+        """
+        self._validate_rhs(vector_b)
+        list_b = to_nested_list(vector_b)
+        if len(list_b[0]) != 1:
+            raise ValueError("Vetor B (termos independentes) deve ser um vetor coluna (ter uma única coluna).")
+        self._require_nonsingular()
+        solution = lu_solve(self.lu, self.perm, [row[0] for row in list_b])
+        return self._as_result([[value] for value in solution], vector_b)
+
+    def solve_many(self, matrix_b):
+        """
+        Resolve A*X = B para uma matriz B (n x k), coluna a coluna,
+        reaproveitando a mesma fatoração. Custo O(k·n²).
+
+        Returns:
+            list[list[float]]: A matriz solução X (n x k); um Matrix, se A ou B for Matrix.
+        """
+        self._validate_rhs(matrix_b)
+        self._require_nonsingular()
+        columns = [lu_solve(self.lu, self.perm, column) for column in zip(*to_nested_list(matrix_b))]
+        return self._as_result([list(row) for row in zip(*columns)], matrix_b)
+
+    def inverse(self):
+        """
+        Inversa de A, obtida resolvendo A*X = I coluna a coluna. Custo O(n³).
+
+        Returns:
+            list[list[float]]: A matriz inversa (um Matrix, se A for Matrix).
+        """
+        self._require_nonsingular()
+        identity = [[1 if r == c else 0 for c in range(self.size)] for r in range(self.size)]
+        return self.solve_many(identity)
+
+    def _as_result(self, solution, matrix_b):
+        """(Método auxiliar interno) A solução como Matrix, se A ou B for Matrix."""
+        return Matrix._from_rows(solution) if self._is_matrix or isinstance(matrix_b, Matrix) else solution
+
+    def _require_complete(self):
+        """(Método auxiliar interno) Levanta ValueError se a fatoração foi interrompida (pivô exatamente zero)."""
+        if self.sign == 0:
+            raise ValueError("A matriz não é invertível (determinante é zero): a fatoração foi interrompida por um pivô nulo.")
+
+    def _require_nonsingular(self):
+        """(Método auxiliar interno) Levanta ValueError se a matriz fatorada for singular."""
+        if self._singular:
+            raise ValueError("A matriz não é invertível (determinante é zero).")
+
+    def _validate_rhs(self, matrix_b):
+        """(Método auxiliar interno) Valida B e a compatibilidade do número de linhas com A."""
+        validate_matrix_input(matrix_b, "Vetor B (termos independentes)")
+        if len(matrix_b) != self.size:
+            raise ValueError("Número de linhas da Matriz A (coeficientes) deve ser igual ao número de linhas do Vetor B.")
+
+
+def factorize(matrix):
+    """
+    Fatora uma matriz quadrada uma única vez para reutilização.
+
+    Ex: lu = factorize(A); lu.det(); lu.inverse(); lu.solve(b1); lu.solve(b2)
+
+    Args:
+        matrix (list[list[float]]): A matriz quadrada A.
+
+    Returns:
+        LUFactorization: O objeto com os fatores P, L e U.
+    """
+    return LUFactorization(matrix)
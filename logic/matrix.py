@@ -0,0 +1,220 @@
+# calculadora_matrizes/logic/matrix.py
+
+# Este módulo define o tipo Matrix: uma matriz compacta armazenada em um único
+# array plano ('array.array') em ordem de linhas (row-major), em vez de uma lista
+# de listas. Cada elemento ocupa 8 bytes (typecode 'q' para inteiros, 'd' para
+# floats), sem um objeto Python por elemento nem uma lista por linha.
+#
+# As operações do pacote 'logic' aceitam Matrix diretamente: quando algum operando
+# é um Matrix, o resultado também é devolvido como Matrix. Para obter um Matrix a
+# partir de um resultado em listas, use Matrix.from_list(...).
+from array import array
+
+class Matrix:
+    """
+    Matriz densa compacta, armazenada em um array plano row-major.
+    O elemento (i, j) fica em data[i * cols + j].
+
+    Atributos:
+        rows (int): Número de linhas.
+        cols (int): Número de colunas.
+        data (array.array): Os rows * cols elementos, typecode 'q' (inteiros de
+                            64 bits) ou 'd' (floats de 64 bits).
+
+    Um Matrix é validado na construção (via from_list) e tem formato garantido,
+    por isso as funções de validação o aceitam sem percorrer suas linhas.
+
+    Acesso aos elementos: m[i, j] lê e m[i, j] = valor altera o elemento (i, j).
+    Já m[i] (e a iteração sobre m) devolve uma CÓPIA da linha i como lista, apenas
+    para leitura: m[i][j] = valor altera a cópia, não o Matrix.
+    """
+
+    __slots__ = ("rows", "cols", "data")
+
+    def __init__(self, rows, cols, data):
+        """
+        Constrói um Matrix a partir de um array plano já pronto.
+        Prefira Matrix.from_list para construir a partir de listas de listas.
+
+        Raises:
+            ValueError: Se as dimensões forem inválidas ou incompatíveis com 'data'.
+        """
+        if rows < 1 or cols < 1 or len(data) != rows * cols:
+            raise ValueError("Dimensões do Matrix incompatíveis com o tamanho dos dados.")
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+
+    @classmethod
+    def from_list(cls, matrix, matrix_name="Matriz"):
+        """
+        Cria um Matrix a partir de uma lista de listas, validando sua estrutura.
+
+        Args:
+            matrix (list[list[float]]): A matriz em listas de listas.
+            matrix_name (str): Nome usado nas mensagens de erro.
+
+        Returns:
+            Matrix: A matriz compacta (typecode 'q' se todos os elementos forem
+                    inteiros que cabem em 64 bits, 'd' caso contrário).
+
+        Raises:
+            ValueError: Se a estrutura for inválida ou se houver elementos não numéricos.
+        """
+        # Importação local para evitar dependência circular (validation_utils reconhece Matrix).
+        from .validation_utils import validate_matrix_input
+
+        if isinstance(matrix, Matrix):
+            return matrix
+        validate_matrix_input(matrix, matrix_name)
+        return cls._from_rows(matrix, matrix_name)
+
+    @classmethod
+    def _from_rows(cls, matrix, matrix_name="Matriz"):
+        """
+        (Método auxiliar interno) Como from_list, mas sem validar a estrutura:
+        usado pelas operações para embrulhar resultados que já têm formato garantido.
+        """
+        if isinstance(matrix, Matrix):
+            return matrix
+        return cls._from_flat(len(matrix), len(matrix[0]),
+                              [value for row in matrix for value in row], matrix_name)
+
+    @classmethod
+    def _from_flat(cls, rows, cols, values, matrix_name="Matriz"):
+        """
+        (Método auxiliar interno) Cria um Matrix a partir de uma sequência plana de valores.
+        Tenta armazenar como inteiros de 64 bits; se algum valor for float (ou um
+        inteiro fora do intervalo de 64 bits), armazena tudo como float.
+        """
+        values = values if isinstance(values, (list, array)) else list(values)
+        try:
+            return cls(rows, cols, array("q", values))
+        except (TypeError, OverflowError):
+            pass
+        try:
+            return cls(rows, cols, array("d", values))
+        except TypeError:
+            raise ValueError(f"{matrix_name} deve conter apenas números inteiros ou reais para ser armazenada como Matrix.")
+
+    def _assign_flat(self, values):
+        """
+        (Método auxiliar interno) Substitui os elementos pelos 'values' (sequência plana
+        de rows * cols valores) no próprio objeto, para as variantes out=/in-place.
+        O array existente é reaproveitado; apenas se um Matrix de inteiros receber
+        floats (ou inteiros fora de 64 bits) o armazenamento passa a ser 'd'.
+        """
+        values = values if isinstance(values, (list, array)) else list(values)
+        try:
+            self.data[:] = array(self.data.typecode, values)
+        except (TypeError, OverflowError):
+            self.data = array("d", values)
+
+    @classmethod
+    def zeros(cls, rows, cols, typecode="d"):
+        """Cria um Matrix rows x cols preenchido com zeros."""
+        return cls(rows, cols, array(typecode, bytes(8 * rows * cols)))
+
+    @property
+    def typecode(self):
+        """O typecode do array de armazenamento ('q' ou 'd')."""
+        return self.data.typecode
+
+    @property
+    def shape(self):
+        """A tupla (rows, cols)."""
+        return (self.rows, self.cols)
+
+    def row(self, i):
+        """Retorna a linha i como um array (cópia)."""
+        start = i * self.cols
+        return self.data[start:start + self.cols]
+
+    def column(self, j):
+        """Retorna a coluna j como um array (cópia, por fatiamento com passo 'cols')."""
+        return self.data[j::self.cols]
+
+    def to_list(self):
+        """Converte para lista de listas (uma lista por linha)."""
+        cols = self.cols
+        return [self.data[start:start + cols].tolist() for start in range(0, len(self.data), cols)]
+
+    def copy(self):
+        """Retorna uma cópia independente do Matrix."""
+        return Matrix(self.rows, self.cols, array(self.data.typecode, self.data))
+
+    def __len__(self):
+        """Número de linhas, como em uma lista de listas."""
+        return self.rows
+
+    def __getitem__(self, index):
+        """
+        m[i] retorna uma cópia da linha i como lista (compatível com a leitura m[i][j]
+        de listas, mas alterar a cópia não altera o Matrix);
+        m[i, j] retorna diretamente o elemento (i, j).
+        """
+        if isinstance(index, tuple):
+            i, j = index
+            return self.data[i * self.cols + j]
+        if not -self.rows <= index < self.rows:
+            raise IndexError("Índice de linha fora do intervalo do Matrix.")
+        return self.row(index % self.rows).tolist()
+
+    def __setitem__(self, index, value):
+        """
+        m[i, j] = valor altera o elemento (i, j) no próprio array.
+
+        Raises:
+            TypeError: Se o índice não for um par (i, j) (ex: m[i] = linha).
+        """
+        if not isinstance(index, tuple):
+            raise TypeError("Use m[i, j] = valor para alterar um elemento do Matrix (m[i] é uma cópia da linha).")
+        i, j = index
+        self.data[i * self.cols + j] = value
+
+    def __iter__(self):
+        """Itera sobre as linhas (como listas, cópias apenas para leitura)."""
+        for i in range(self.rows):
+            yield self.row(i).tolist()
+
+    def __eq__(self, other):
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.rows == other.rows and self.cols == other.cols and self.data.tolist() == other.data.tolist()
+
+    def __repr__(self):
+        return f"Matrix({self.rows}x{self.cols}, typecode='{self.typecode}', {self.to_list()})"
+
+
+def to_nested_list(matrix):
+    """
+    Converte um Matrix em lista de listas; qualquer outro valor é devolvido sem alteração
+    (inclusive entradas inválidas, para que a validação produza a mensagem de erro usual).
+    """
+    return matrix.to_list() if isinstance(matrix, Matrix) else matrix
+
+
+def _write_into(out, operation, *operands):
+    """
+    (Função auxiliar interna) Escreve operation(x, y, ...) elemento a elemento dos
+    operandos em 'out' (lista de listas ou Matrix), reaproveitando o seu armazenamento:
+    as listas de linha de 'out' (ou o seu array plano) são preenchidas por atribuição
+    de fatia, sem criar uma nova matriz. 'out' pode ser um dos próprios operandos,
+    pois cada linha é calculada por inteiro antes de ser escrita.
+    Pré-condição: operandos e 'out' válidos e com as mesmas dimensões.
+
+    Returns:
+        A própria matriz 'out'.
+    """
+    if isinstance(out, Matrix):
+        flats = [Matrix._from_rows(operand).data for operand in operands]
+        out._assign_flat(list(map(operation, *flats)))
+    else:
+        for row_out, *rows in zip(out, *map(to_nested_list, operands)):
+            row_out[:] = map(operation, *rows)
+    return out
+
+
+def any_matrix(*operands):
+    """Retorna True se algum dos operandos for um Matrix."""
+    return any(isinstance(operand, Matrix) for operand in operands)
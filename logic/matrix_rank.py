@@ -0,0 +1,67 @@
+# calculadora_matrizes/logic/matrix_rank.py
+
+# Importa as funções necessárias de outros módulos dentro do pacote 'logic'.
+# - validate_matrix_input: Garante que a matriz de entrada é válida (não precisa ser quadrada).
+# - max_abs_per_column / is_negligible_pivot: Critério de pivô nulo compartilhado pelas eliminações.
+# - rank_mod / validate_modulus: Posto em GF(p) (aritmética módulo um primo).
+from .validation_utils import validate_matrix_input
+from .helper_utils import max_abs_per_column, is_negligible_pivot
+from .finite_field import rank_mod, validate_modulus
+from .matrix import to_nested_list
+
+def matrix_rank(matrix, modulus=None):
+    """
+    Calcula o posto de uma 'matrix' (o número máximo de linhas linearmente independentes),
+    por eliminação de Gauss com pivoteamento parcial. O posto é o número de pivôs
+    significativos encontrados na forma escalonada.
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz (m x n), não necessariamente quadrada.
+        modulus (int or None): Se informado (um primo p), calcula o posto em GF(p).
+                               A matriz deve ser de inteiros.
+
+    Returns:
+        int: O posto da matriz.
+
+    Raises:
+        ValueError: Se a matriz não for válida ou se o módulo não for primo.
+    """
+    # 1. Validação da Matriz de Entrada:
+    validate_matrix_input(matrix, "Matriz para posto")
+    matrix = to_nested_list(matrix)
+
+    #    Aritmética em GF(p): eliminação exata com inteiros módulo p (ver finite_field).
+    if modulus is not None:
+        validate_modulus(modulus)
+        return rank_mod(matrix, modulus)
+
+    # 2. Cópia de Trabalho e Escala de Cada Coluna (a referência de cada pivô em ponto flutuante):
+    work = [list(row) for row in matrix]
+    rows = len(work)
+    cols = len(work[0])
+    scales = max_abs_per_column(work)
+    rank = 0
+
+    for c in range(cols):
+        if rank == rows:
+            break
+
+        # 3. Pivoteamento Parcial na coluna c, a partir da linha 'rank':
+        #    Uma coluna sem pivô significativo não aumenta o posto.
+        pivot_row = max(range(rank, rows), key=lambda r: abs(work[r][c]))
+        pivot = work[pivot_row][c]
+        if is_negligible_pivot(pivot, scales[c]):
+            continue
+        work[rank], work[pivot_row] = work[pivot_row], work[rank]
+
+        # 4. Eliminação abaixo do Pivô (apenas as colunas à direita de c):
+        pivot_line = work[rank]
+        for r in range(rank + 1, rows):
+            row = work[r]
+            factor = row[c] / pivot
+            if factor:
+                row[c + 1:] = [x - factor * y for x, y in zip(row[c + 1:], pivot_line[c + 1:])]
+        rank += 1
+
+    # 5. Retorno do Posto:
+    return rank
@@ -0,0 +1,200 @@
+# calculadora_matrizes/logic/matrix_structure.py
+
+# Este módulo detecta a estrutura de uma matriz quadrada (diagonal, triangular
+# superior/inferior, permutação, identidade, simétrica) em uma única passada O(n²)
+# e oferece os caminhos rápidos correspondentes para determinante, inversa e
+# resolução de sistemas:
+#   - identidade:  det = 1, A⁻¹ = I, X = B;
+#   - permutação:  det = sinal da permutação, A⁻¹ = Aᵀ, X = B com as linhas permutadas;
+#   - triangular:  det = produto da diagonal (O(n)), resolução por substituição (O(n²)
+#                  por coluna de B) e inversa por substituição coluna a coluna (~n³/6).
+#
+# As operações públicas consultam a estrutura no modo "auto"; as funções abaixo
+# assumem matrizes quadradas já validadas (em listas) e retornam None quando a
+# estrutura não oferece um caminho rápido, deixando o caso geral para o chamador.
+from collections import namedtuple
+from operator import mul
+from .validation_utils import validate_square_matrix
+from .helper_utils import max_abs_per_column, is_negligible_pivot
+from .matrix import to_nested_list
+
+MatrixStructure = namedtuple("MatrixStructure", ["diagonal", "upper", "lower", "permutation", "identity", "symmetric"])
+MatrixStructure.__doc__ = """
+Estrutura de uma matriz quadrada (cada campo é um bool).
+Uma matriz diagonal é ao mesmo tempo triangular superior e inferior; a identidade
+é diagonal, de permutação e simétrica.
+"""
+
+def detect_structure(matrix):
+    """
+    Detecta a estrutura de uma matriz quadrada em uma única passada O(n²).
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz quadrada.
+
+    Returns:
+        MatrixStructure: Os campos diagonal, upper, lower, permutation, identity e symmetric.
+
+    Raises:
+        ValueError: Se a matriz não for quadrada/válida.
+    """
+    validate_square_matrix(matrix, "Matriz para detecção de estrutura")
+    return _detect_structure(to_nested_list(matrix))
+
+
+def _detect_structure(matrix):
+    """(Função auxiliar interna) Detecção de estrutura para matrizes já validadas (em listas)."""
+    rows = len(matrix)
+    upper = lower = symmetric = permutation = True
+    permutation_columns = set()
+
+    for i, row in enumerate(matrix):
+        # Triangular superior: nada abaixo da diagonal; inferior: nada acima.
+        if upper and any(row[:i]):
+            upper = False
+        if lower and any(row[i + 1:]):
+            lower = False
+        # Simetria: a parte da linha antes da diagonal é igual à parte da coluna acima dela.
+        if symmetric and any(row[j] != matrix[j][i] for j in range(i)):
+            symmetric = False
+        # Permutação: exatamente um 1 por linha (o resto zeros), em colunas distintas.
+        if permutation:
+            if row.count(1) == 1 and row.count(0) == rows - 1:
+                permutation_columns.add(row.index(1))
+            else:
+                permutation = False
+        if not (upper or lower or symmetric or permutation):
+            break
+
+    permutation = permutation and len(permutation_columns) == rows
+    diagonal = upper and lower
+    identity = diagonal and permutation
+    return MatrixStructure(diagonal, upper, lower, permutation, identity, symmetric)
+
+
+def structured_determinant(matrix, structure):
+    """
+    Determinante pelo caminho rápido da estrutura, ou None se a matriz for geral.
+    Triangular (inclusive diagonal): produto da diagonal, exato para inteiros.
+    """
+    if structure.identity:
+        return 1
+    if structure.permutation:
+        return _permutation_sign(matrix)
+    if structure.upper or structure.lower:
+        det = 1
+        for i, row in enumerate(matrix):
+            det *= row[i]
+        return det
+    return None
+
+
+def structured_inverse(matrix, structure):
+    """
+    Inversa pelo caminho rápido da estrutura, ou None se a matriz for geral.
+
+    Raises:
+        ValueError: Se a matriz triangular for singular (elemento diagonal nulo).
+    """
+    rows = len(matrix)
+    if structure.identity:
+        return [list(row) for row in matrix]
+    if structure.permutation:
+        # A inversa de uma matriz de permutação é a sua transposta.
+        return [list(column) for column in zip(*matrix)]
+    if not (structure.upper or structure.lower):
+        return None
+
+    _require_nonsingular_diagonal(matrix)
+    if structure.diagonal:
+        return [[1 / matrix[r][r] if r == c else 0 for c in range(rows)] for r in range(rows)]
+
+    # Triangular: a coluna j da inversa resolve T*x = e_j; como a inversa é triangular
+    # do mesmo tipo, a substituição começa (inferior) ou termina (superior) na linha j.
+    columns = []
+    for j in range(rows):
+        unit = [1 if r == j else 0 for r in range(rows)]
+        columns.append(_solve_lower(matrix, unit, j) if structure.lower else _solve_upper(matrix, unit, j))
+    return [list(row) for row in zip(*columns)]
+
+
+def structured_solve(matrix_a, matrix_b, structure):
+    """
+    Resolve A*X = B pelo caminho rápido da estrutura (B pode ter k colunas),
+    ou retorna None se A for geral. Custo O(n²) por coluna de B para triangulares.
+
+    Raises:
+        ValueError: Se A triangular for singular (elemento diagonal nulo).
+    """
+    if structure.identity:
+        return [list(row) for row in matrix_b]
+    if structure.permutation:
+        # A linha i de A tem o 1 na coluna c: a equação i diz x_c = b_i.
+        solution = [None] * len(matrix_a)
+        for row_a, row_b in zip(matrix_a, matrix_b):
+            solution[row_a.index(1)] = list(row_b)
+        return solution
+    if not (structure.upper or structure.lower):
+        return None
+
+    _require_nonsingular_diagonal(matrix_a)
+    substitute = _solve_lower if structure.lower else _solve_upper
+    columns = [substitute(matrix_a, list(column)) for column in zip(*matrix_b)]
+    return [list(row) for row in zip(*columns)]
+
+
+def _require_nonsingular_diagonal(matrix):
+    """
+    (Função auxiliar interna) Uma matriz triangular é singular se algum elemento da
+    diagonal for nulo (com a mesma tolerância das eliminações, para floats): cada
+    elemento da diagonal é comparado com a escala da sua coluna, como os pivôs da LU.
+    """
+    scales = max_abs_per_column(matrix)
+    if any(is_negligible_pivot(row[i], scales[i]) for i, row in enumerate(matrix)):
+        raise ValueError("A matriz não é invertível (determinante é zero).")
+
+
+def _solve_lower(matrix, rhs, start=0):
+    """
+    (Função auxiliar interna) Substituição progressiva para L*x = rhs (L triangular inferior).
+    As entradas de rhs antes de 'start' devem ser nulas (as de x também serão).
+    """
+    rows = len(matrix)
+    x = [0] * rows
+    for i in range(start, rows):
+        row = matrix[i]
+        x[i] = (rhs[i] - sum(map(mul, row[start:i], x[start:i]))) / row[i]
+    return x
+
+
+def _solve_upper(matrix, rhs, stop=None):
+    """
+    (Função auxiliar interna) Substituição regressiva para U*x = rhs (U triangular superior).
+    As entradas de rhs depois de 'stop' devem ser nulas (as de x também serão).
+    """
+    rows = len(matrix)
+    end = rows if stop is None else stop + 1
+    x = [0] * rows
+    for i in range(end - 1, -1, -1):
+        row = matrix[i]
+        x[i] = (rhs[i] - sum(map(mul, row[i + 1:end], x[i + 1:end]))) / row[i]
+    return x
+
+
+def _permutation_sign(matrix):
+    """(Função auxiliar interna) Sinal (+1/-1) de uma matriz de permutação, pela contagem de ciclos."""
+    target = [row.index(1) for row in matrix]
+    sign = 1
+    visited = [False] * len(target)
+    for start in range(len(target)):
+        if visited[start]:
+            continue
+        length = 0
+        position = start
+        while not visited[position]:
+            visited[position] = True
+            position = target[position]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
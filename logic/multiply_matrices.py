@@ -3,62 +3,305 @@
 # Importa a função de validação específica para a multiplicação de matrizes.
 # Esta função verifica se as matrizes são válidas e se o número de colunas de A
 # é igual ao número de linhas de B, uma condição necessária para a multiplicação.
-from .validation_utils import validate_matrix_for_mult
+# 'mul' (operator) é usado pelo kernel para calcular produtos escalares com map().
+from operator import mul
+from .validation_utils import validate_matrix_for_mult, validate_matrix_input, _shape
+from .matrix import Matrix, any_matrix, to_nested_list
+from .sparse import any_sparse, sparse_multiply
+from . import backend
 
-def multiply_matrices(matrix_a, matrix_b):
+def multiply_matrices(matrix_a, matrix_b, method="auto", cutoff=None):
     """
     Multiplica duas matrizes, matrix_a (A) e matrix_b (B), resultando em C = A * B.
     O elemento C[i][j] é o produto escalar da i-ésima linha de A com a j-ésima coluna de B.
+    As colunas de B são lidas como sequências contíguas (B transposta) e
+    processadas em blocos, o que é muito mais rápido que o laço i-j-k clássico.
+    Com method="strassen", usa o algoritmo recursivo de Strassen (O(n^2.81)),
+    voltando ao kernel clássico para blocos de tamanho menor ou igual a 'cutoff'.
 
     Args:
         matrix_a (list[list[float]]): A primeira matriz (operando esquerdo).
         matrix_b (list[list[float]]): A segunda matriz (operando direito).
+        method (str): "auto" ou "classic" para o kernel por blocos,
+                      "strassen" para a multiplicação recursiva de Strassen.
+        cutoff (int or None): Tamanho a partir do qual a recursão de Strassen
+                              usa o kernel clássico (padrão: STRASSEN_CUTOFF);
+                              deve ser um inteiro positivo.
 
     Returns:
-        list[list[float]]: A matriz resultante da multiplicação.
+        list[list[float]]: A matriz resultante da multiplicação (um Matrix, se algum
+                           operando for Matrix; uma CSRMatrix, se ambos forem esparsos).
 
     Raises:
-        ValueError: Se as matrizes não forem válidas ou se o número de colunas
-                    de matrix_a não for igual ao número de linhas de matrix_b.
+        ValueError: Se as matrizes não forem válidas, se o número de colunas
+                    de matrix_a não for igual ao número de linhas de matrix_b,
+                    se o método for desconhecido ou se 'cutoff' não for um inteiro positivo.
     """
     # 1. Validação das Matrizes de Entrada:
     #    Garante que A e B são matrizes válidas e que o número de colunas de A
     #    é igual ao número de linhas de B. Se não, uma exceção (ValueError) é lançada.
     validate_matrix_for_mult(matrix_a, matrix_b)
+    #    Um cutoff nulo ou negativo nunca seria alcançado pela divisão dos blocos de Strassen.
+    if cutoff is not None and (type(cutoff) is not int or cutoff <= 0):
+        raise ValueError(f"O cutoff de Strassen deve ser um inteiro positivo (recebido: {cutoff!r}).")
 
-    # 2. Obtenção das Dimensões Relevantes:
-    #    - rows_a: Número de linhas da matriz A.
-    #    - cols_a: Número de colunas da matriz A (que deve ser igual ao número de linhas da matriz B).
-    #    - cols_b: Número de colunas da matriz B.
-    #    A matriz resultante C terá dimensões rows_a x cols_b.
-    rows_a = len(matrix_a)
-    cols_a = len(matrix_a[0])  # Também é igual a len(matrix_b) (número de linhas de B)
-    cols_b = len(matrix_b[0])
-
-    # 3. Inicialização da Matriz de Resultado:
-    #    Cria uma nova matriz 'result' (representando C) preenchida com zeros.
-    #    As dimensões da matriz 'result' serão (rows_a x cols_b).
-    #    Ex: Se A é 2x3 e B é 3x4, result será 2x4: [[0,0,0,0], [0,0,0,0]].
-    result = [[0 for _ in range(cols_b)] for _ in range(rows_a)]
-
-    # 4. Processo de Multiplicação (Cálculo de cada elemento C[i][j]):
-    #    Itera sobre cada linha 'i' da matriz A (que será a linha 'i' da matriz resultado).
-    for i in range(rows_a):
-        #    Itera sobre cada coluna 'j' da matriz B (que será a coluna 'j' da matriz resultado).
-        for j in range(cols_b):
-            #       Para calcular o elemento result[i][j], é realizado o produto escalar
-            #       da linha 'i' de matrix_a com a coluna 'j' de matrix_b.
-            #       'sum_val' acumulará este produto escalar.
-            sum_val = 0
-            #       O índice 'k' itera sobre as colunas de A e, correspondentemente, sobre as linhas de B.
-            #       Este loop interno realiza a soma dos produtos:
-            #       sum_val = A[i][0]*B[0][j] + A[i][1]*B[1][j] + ... + A[i][cols_a-1]*B[cols_a-1][j]
-            for k in range(cols_a): # Ou range(len(matrix_b)) que é o número de linhas de B
-                sum_val += matrix_a[i][k] * matrix_b[k][j]
-            
-            #       Após o loop interno, 'sum_val' contém o valor do elemento C[i][j].
-            result[i][j] = sum_val
-
-    # 5. Retorno da Matriz Resultante:
-    #    A matriz 'result', agora contendo o produto de matrix_a e matrix_b, é retornada.
-    return result
\ No newline at end of file
+    # 2. Cálculo do Produto:
+    #    A matriz resultante C terá dimensões (linhas de A) x (colunas de B).
+    #    O produto é delegado aos kernels internos, que não revalidam as entradas.
+    return _multiply(matrix_a, matrix_b, method, cutoff)
+
+
+def _multiply(matrix_a, matrix_b, method="auto", cutoff=None):
+    """
+    (Função auxiliar interna) Seleção do algoritmo de multiplicação, sem validação.
+    Usada por multiply_matrices e pelas operações compostas (ex: resolução de
+    sistemas), que já validaram os operandos na sua própria fronteira pública.
+    """
+    #    Com algum operando esparso, usa o kernel esparso (ver sparse.py), cujo custo
+    #    acompanha o número de não nulos: esparsa * esparsa resulta em CSR; com densa, em densa.
+    if any_sparse(matrix_a, matrix_b):
+        return sparse_multiply(matrix_a, matrix_b)
+
+    #    Operandos Matrix usam o kernel sobre arrays planos (ou, no caso de Strassen,
+    #    são convertidos para listas); o resultado é devolvido como Matrix.
+    if any_matrix(matrix_a, matrix_b):
+        if method in ("auto", "classic"):
+            return _multiply_flat(Matrix._from_rows(matrix_a), Matrix._from_rows(matrix_b))
+        return Matrix._from_rows(_multiply(to_nested_list(matrix_a), to_nested_list(matrix_b), method, cutoff))
+
+    #    No modo "auto", matrizes grandes de floats vão para o backend NumPy (se disponível).
+    if method == "auto" and backend.should_use_numpy(matrix_a, matrix_b):
+        return backend.numpy_multiply(matrix_a, matrix_b)
+    if method in ("auto", "classic"):
+        return _multiply_kernel(matrix_a, matrix_b)
+    if method == "strassen":
+        return _multiply_strassen(matrix_a, matrix_b, STRASSEN_CUTOFF if cutoff is None else cutoff)
+    raise ValueError(f"Método de multiplicação desconhecido: '{method}'.")
+
+
+def multiply_chain(matrices, method="auto"):
+    """
+    Multiplica uma cadeia de matrizes A1 * A2 * ... * Ak na ordem de associação mais
+    barata. O produto é o mesmo em qualquer ordem, mas o custo não: com A (10x1000),
+    B (1000x10) e C (10x1000), (A*B)*C custa 200 mil multiplicações escalares e
+    A*(B*C), 20 milhões. A ordem ótima é escolhida pela programação dinâmica clássica
+    da cadeia de matrizes (O(k³) sobre as dimensões) e então executada.
+
+    Args:
+        matrices (list): As matrizes da cadeia, na ordem do produto (ao menos uma).
+        method (str): O método usado em cada produto (ver multiply_matrices).
+
+    Returns:
+        list[list[float]]: O produto da cadeia (um Matrix ou uma CSRMatrix nos mesmos
+                           casos de multiply_matrices). Com uma única matriz, ela
+                           própria é devolvida.
+
+    Raises:
+        ValueError: Se a cadeia estiver vazia, se alguma matriz não for válida ou se
+                    matrizes vizinhas tiverem dimensões incompatíveis.
+    """
+    # 1. Validação da Cadeia (uma vez por matriz, não a cada produto):
+    if not isinstance(matrices, (list, tuple)) or not matrices:
+        raise ValueError("A cadeia de multiplicação deve ser uma lista com ao menos uma matriz.")
+    for position, matrix in enumerate(matrices, start=1):
+        validate_matrix_input(matrix, f"Matriz {position} da cadeia", allow_sparse=True)
+
+    # 2. Dimensões: a matriz k tem dimensões dimensions[k] x dimensions[k + 1].
+    dimensions = [_shape(matrices[0])[0]]
+    for position, matrix in enumerate(matrices, start=1):
+        rows, cols = _shape(matrix)
+        if rows != dimensions[-1]:
+            raise ValueError(f"Número de colunas da Matriz {position - 1} deve ser igual ao número de linhas "
+                             f"da Matriz {position} da cadeia para multiplicação.")
+        dimensions.append(cols)
+
+    # 3. Escolha da Ordem e Execução:
+    _, split = _chain_order(dimensions)
+    return _multiply_chain(matrices, split, 0, len(matrices) - 1, method)
+
+
+def _chain_order(dimensions):
+    """
+    (Função auxiliar interna) Programação dinâmica da cadeia de matrizes.
+    'cost[i][j]' é o menor número de multiplicações escalares para Ai * ... * Aj e
+    'split[i][j]' o índice s da melhor divisão (Ai...As) * (As+1...Aj).
+
+    Returns:
+        tuple: (custo mínimo da cadeia inteira, tabela 'split').
+    """
+    count = len(dimensions) - 1
+    cost = [[0] * count for _ in range(count)]
+    split = [[0] * count for _ in range(count)]
+    for length in range(2, count + 1):
+        for i in range(count - length + 1):
+            j = i + length - 1
+            outer = dimensions[i] * dimensions[j + 1]
+            cost_i, best, best_split = cost[i], None, i
+            for s in range(i, j):
+                candidate = cost_i[s] + cost[s + 1][j] + outer * dimensions[s + 1]
+                if best is None or candidate < best:
+                    best, best_split = candidate, s
+            cost_i[j] = best
+            split[i][j] = best_split
+    return cost[0][count - 1], split
+
+
+def _multiply_chain(matrices, split, i, j, method):
+    """(Função auxiliar interna) Executa Ai * ... * Aj na ordem da tabela 'split', sem validação."""
+    if i == j:
+        return matrices[i]
+    s = split[i][j]
+    return _multiply(_multiply_chain(matrices, split, i, s, method),
+                     _multiply_chain(matrices, split, s + 1, j, method), method)
+
+
+# Número de colunas de B processadas por bloco no kernel de multiplicação.
+# Um bloco de colunas é reutilizado por todas as linhas de A antes de passar
+# ao próximo, mantendo os dados recentemente lidos em cache.
+_BLOCK_SIZE = 64
+
+def _multiply_kernel(matrix_a, matrix_b):
+    """
+    (Função auxiliar interna) Kernel de multiplicação C = A * B, sem validação.
+
+    Em vez do laço i-j-k clássico, que lê B coluna a coluna (matrix_b[k][j],
+    um acesso a uma lista diferente a cada passo), B é transposta uma única vez:
+    cada coluna de B vira uma sequência contígua e cada C[i][j] é o produto
+    escalar de duas sequências, calculado com sum(map(mul, ...)) em velocidade de C.
+    As colunas de B são percorridas em blocos de '_BLOCK_SIZE' para matrizes grandes.
+    A ordem das somas é a mesma do laço clássico, então os resultados são idênticos.
+    """
+    # 1. Transposição de B:
+    #    'columns_b[j]' é a coluna j de B, como uma tupla.
+    columns_b = list(zip(*matrix_b))
+    cols_b = len(columns_b)
+
+    # 2. Inicialização da Matriz de Resultado (linhas preenchidas por blocos abaixo):
+    result = [[] for _ in matrix_a]
+
+    # 3. Processo de Multiplicação por Blocos:
+    #    Para cada bloco de colunas de B, percorre todas as linhas de A e
+    #    estende a linha correspondente do resultado com os produtos escalares.
+    #    C[i][j] = A[i][0]*B[0][j] + A[i][1]*B[1][j] + ... + A[i][n-1]*B[n-1][j]
+    for block_start in range(0, cols_b, _BLOCK_SIZE):
+        block = columns_b[block_start:block_start + _BLOCK_SIZE]
+        for row_a, result_row in zip(matrix_a, result):
+            result_row.extend([sum(map(mul, row_a, column_b)) for column_b in block])
+
+    # 4. Retorno da Matriz Resultante:
+    return result
+
+
+def _multiply_flat(matrix_a, matrix_b):
+    """
+    (Função auxiliar interna) Kernel de multiplicação para operandos Matrix.
+    As linhas de A são fatias contíguas do array plano e as colunas de B são
+    obtidas por fatiamento com passo (data[j::cols]), sem passar por listas de listas.
+    """
+    cols_a, cols_b = matrix_a.cols, matrix_b.cols
+    data_a, data_b = matrix_a.data, matrix_b.data
+    columns_b = [data_b[j::cols_b] for j in range(cols_b)]
+    values = []
+    for start in range(0, len(data_a), cols_a):
+        row_a = data_a[start:start + cols_a]
+        values.extend([sum(map(mul, row_a, column_b)) for column_b in columns_b])
+    return Matrix._from_flat(matrix_a.rows, cols_b, values)
+
+
+# Tamanho de bloco abaixo do qual (inclusive) a recursão de Strassen usa o kernel
+# clássico. Em Python puro as somas de blocos da recursão custam caro, então o
+# ponto de equilíbrio é bem mais alto que em implementações compiladas.
+STRASSEN_CUTOFF = 64
+
+def _multiply_strassen(matrix_a, matrix_b, cutoff):
+    """
+    (Função auxiliar interna) Multiplicação de Strassen com preenchimento por zeros.
+    As matrizes são completadas com zeros até um tamanho quadrado 'padded' da forma
+    bloco * 2^níveis (com bloco <= cutoff), o menor possível; o resultado é então
+    recortado para (linhas de A) x (colunas de B).
+    """
+    # 1. Dimensões e Caso Pequeno:
+    rows_a, inner, cols_b = len(matrix_a), len(matrix_b), len(matrix_b[0])
+    size = max(rows_a, inner, cols_b)
+    if size <= cutoff:
+        return _multiply_kernel(matrix_a, matrix_b)
+
+    # 2. Cálculo do Tamanho com Preenchimento:
+    #    Divide 'size' ao meio (arredondando para cima) até caber no cutoff;
+    #    'padded' é o tamanho do bloco final multiplicado de volta por 2^níveis.
+    levels = 0
+    block = size
+    while block > cutoff:
+        block = (block + 1) // 2
+        levels += 1
+    padded = block << levels
+
+    # 3. Preenchimento com Zeros (apenas se necessário):
+    a = _pad(matrix_a, padded)
+    b = _pad(matrix_b, padded)
+
+    # 4. Recursão e Recorte do Resultado:
+    product = _strassen(a, b, cutoff)
+    return [row[:cols_b] for row in product[:rows_a]]
+
+
+def _pad(matrix, size):
+    """(Função auxiliar interna) Completa 'matrix' com zeros até ficar size x size."""
+    rows, cols = len(matrix), len(matrix[0])
+    if rows == size and cols == size:
+        return matrix
+    padded = [row + [0] * (size - cols) for row in matrix]
+    padded.extend([0] * size for _ in range(size - rows))
+    return padded
+
+
+def _add(a, b):
+    """(Função auxiliar interna) Soma de blocos quadrados, sem validação."""
+    return [[x + y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+
+
+def _sub(a, b):
+    """(Função auxiliar interna) Subtração de blocos quadrados, sem validação."""
+    return [[x - y for x, y in zip(row_a, row_b)] for row_a, row_b in zip(a, b)]
+
+
+def _strassen(a, b, cutoff):
+    """
+    (Função auxiliar interna) Recursão de Strassen para matrizes n x n.
+    Pré-condição: n <= cutoff, ou n é par e n/2 satisfaz a mesma condição.
+    Usa 7 produtos de blocos (em vez de 8) e 18 somas/subtrações por nível.
+    """
+    n = len(a)
+    if n <= cutoff:
+        return _multiply_kernel(a, b)
+
+    # 1. Divisão em Quadrantes:
+    h = n // 2
+    a11 = [row[:h] for row in a[:h]]
+    a12 = [row[h:] for row in a[:h]]
+    a21 = [row[:h] for row in a[h:]]
+    a22 = [row[h:] for row in a[h:]]
+    b11 = [row[:h] for row in b[:h]]
+    b12 = [row[h:] for row in b[:h]]
+    b21 = [row[:h] for row in b[h:]]
+    b22 = [row[h:] for row in b[h:]]
+
+    # 2. Os Sete Produtos de Strassen:
+    m1 = _strassen(_add(a11, a22), _add(b11, b22), cutoff)
+    m2 = _strassen(_add(a21, a22), b11, cutoff)
+    m3 = _strassen(a11, _sub(b12, b22), cutoff)
+    m4 = _strassen(a22, _sub(b21, b11), cutoff)
+    m5 = _strassen(_add(a11, a12), b22, cutoff)
+    m6 = _strassen(_sub(a21, a11), _add(b11, b12), cutoff)
+    m7 = _strassen(_sub(a12, a22), _add(b21, b22), cutoff)
+
+    # 3. Combinação dos Quadrantes do Resultado:
+    #    C11 = M1 + M4 - M5 + M7    C12 = M3 + M5
+    #    C21 = M2 + M4              C22 = M1 - M2 + M3 + M6
+    c11 = _add(_sub(_add(m1, m4), m5), m7)
+    c12 = _add(m3, m5)
+    c21 = _add(m2, m4)
+    c22 = _add(_add(_sub(m1, m2), m3), m6)
+
+    # 4. Montagem da Matriz n x n:
+    return [left + right for left, right in zip(c11, c12)] + [left + right for left, right in zip(c21, c22)]
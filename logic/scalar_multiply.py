@@ -2,22 +2,32 @@
 
 # Importa a função de validação genérica para uma única matriz.
 # Esta função garante que a 'matrix' de entrada é uma estrutura de lista de listas válida.
-from .validation_utils import validate_matrix_input
+from functools import partial
+from operator import mul
+from .validation_utils import validate_matrix_input, validate_output_matrix, _shape
+from .matrix import Matrix, _write_into
+from .sparse import is_sparse, sparse_scalar_multiply
+from . import backend
 
-def scalar_multiply(matrix, scalar):
+def scalar_multiply(matrix, scalar, out=None):
     """
     Multiplica cada elemento de uma 'matrix' por um valor 'scalar'.
 
     Args:
         matrix (list[list[float]]): A matriz cujos elementos serão multiplicados.
         scalar (float or int): O valor escalar pelo qual multiplicar cada elemento.
+        out (list[list[float]] or Matrix or None): Matriz densa, com as mesmas dimensões,
+                                                   na qual escrever o resultado (pode ser a própria 'matrix').
 
     Returns:
-        list[list[float]]: Uma nova matriz resultante da multiplicação escalar.
+        list[list[float]]: Uma nova matriz resultante da multiplicação escalar
+                           (um Matrix, se a entrada for Matrix; esparsa, se a entrada for esparsa),
+                           ou a própria 'out'.
 
     Raises:
         ValueError: Se a 'matrix' de entrada não for uma estrutura válida
-                    (essa exceção é levantada por validate_matrix_input).
+                    (essa exceção é levantada por validate_matrix_input), ou se 'out'
+                    não for uma matriz densa com as dimensões do resultado.
         TypeError: Se 'scalar' não for um tipo numérico compatível com multiplicação
                    (esta exceção seria levantada nativamente pelo Python durante a operação).
     """
@@ -25,28 +35,49 @@ def scalar_multiply(matrix, scalar):
     #    Verifica se 'matrix' é uma lista de listas bem formada e não vazia.
     #    Se a validação falhar, 'validate_matrix_input' levantará um ValueError.
     #    O nome "Matriz para multiplicação por escalar" é para mensagens de erro claras.
-    validate_matrix_input(matrix, "Matriz para multiplicação por escalar")
-
-    # 2. Obtenção das Dimensões da Matriz:
-    #    A matriz resultante terá as mesmas dimensões da matriz original.
-    rows = len(matrix)      # Número de linhas.
-    cols = len(matrix[0])   # Número de colunas (a validação garante que matrix[0] existe).
-
-    # 3. Inicialização da Matriz de Resultado:
-    #    Cria uma nova matriz 'result' preenchida com zeros,
-    #    com as mesmas dimensões da matriz de entrada.
-    result = [[0 for _ in range(cols)] for _ in range(rows)]
-
-    # 4. Processo de Multiplicação Escalar:
-    #    Itera sobre cada elemento (i, j) da matriz de entrada.
-    for i in range(rows):          # Para cada linha i...
-        for j in range(cols):      # Para cada coluna j...
-            # Multiplica o elemento matrix[i][j] pelo 'scalar'
-            # e armazena o resultado na posição correspondente da matriz 'result'.
-            # Ex: result[0][0] = matrix[0][0] * scalar
-            result[i][j] = matrix[i][j] * scalar
-
-    # 5. Retorno da Matriz Resultante:
+    validate_matrix_input(matrix, "Matriz para multiplicação por escalar", allow_sparse=True)
+
+    #    Com 'out', o resultado é escrito na matriz do chamador (sem nova alocação).
+    if out is not None:
+        validate_output_matrix(out, _shape(matrix), matrix)
+        return _write_into(out, partial(mul, scalar), matrix)
+
+    #    Uma matriz esparsa é escalada no próprio formato (custo O(nnz)).
+    if is_sparse(matrix):
+        return sparse_scalar_multiply(matrix, scalar)
+
+    #    Um Matrix é escalado diretamente sobre o array plano e devolvido como Matrix.
+    if isinstance(matrix, Matrix):
+        return Matrix._from_flat(matrix.rows, matrix.cols, [value * scalar for value in matrix.data])
+
+    #    Para matrizes grandes de floats (e escalar real), delega ao backend NumPy.
+    if type(scalar) in (int, float) and backend.should_use_numpy(matrix):
+        return backend.numpy_scalar_multiply(matrix, scalar)
+
+    # 2. Processo de Multiplicação Escalar:
+    #    Cada linha do resultado é produzida diretamente, em uma única passada,
+    #    multiplicando cada elemento pelo 'scalar': result[i][j] = matrix[i][j] * scalar.
+    #    (Não há uma matriz de zeros preenchida depois.)
+    result = [[value * scalar for value in row] for row in matrix]
+
+    # 3. Retorno da Matriz Resultante:
     #    A matriz 'result', agora contendo cada elemento da 'matrix' original
     #    multiplicado pelo 'scalar', é retornada.
-    return result
\ No newline at end of file
+    return result
+
+
+def iscale(matrix, scalar):
+    """
+    Multiplica a matriz pelo escalar no próprio objeto (A *= k), sem alocar uma nova matriz.
+
+    Args:
+        matrix (list[list[float]] or Matrix): A matriz atualizada (densa).
+        scalar (float or int): O valor escalar.
+
+    Returns:
+        list[list[float]] or Matrix: A própria 'matrix', já atualizada.
+
+    Raises:
+        ValueError: Se a matriz não for válida ou for esparsa.
+    """
+    return scalar_multiply(matrix, scalar, out=matrix)
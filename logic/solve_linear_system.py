@@ -2,42 +2,91 @@
 
 # Importa as funções necessárias:
 # - validate_linear_system_inputs: Para validar as dimensões e propriedades de A e B.
-# - inverse_matrix: Para calcular a inversa da matriz A.
-# - multiply_matrices: Para multiplicar A_inversa por B.
+# - _inverse: Para calcular a inversa da matriz A (sem revalidá-la).
+# - _multiply: Para multiplicar A_inversa por B (sem revalidar os operandos).
+# - fraction_free_solve: Para a resolução exata (Gauss-Jordan sem frações).
+# - solve_mod / validate_modulus: Para a resolução em GF(p) (aritmética módulo um primo).
+# - _detect_structure / structured_solve: Para os caminhos rápidos de A triangular,
+#   diagonal, de permutação ou identidade (substituição direta, O(n²) por coluna).
+# - banded: Para A em banda estreita (LU em banda, O(n·p·(p+q))).
+# - cholesky_*: Para a resolução de sistemas simétricos definidos positivos (A = L*Lᵀ).
+# - lu_decompose / lu_solve / has_negligible_pivot: Para a resolução direta por fatoração LU.
+# As entradas são validadas uma única vez, aqui; as funções internas não repetem a validação.
 from .validation_utils import validate_linear_system_inputs
-from .inverse_matrix import inverse_matrix
-from .multiply_matrices import multiply_matrices
+from .inverse_matrix import _inverse
+from .helper_utils import fraction_free_solve
+from .finite_field import solve_mod, validate_modulus
+from .matrix_structure import _detect_structure, structured_solve
+from .multiply_matrices import _multiply
+from .banded import _detect_bandwidth, _to_band_storage, _solve_band, is_narrow_band
+from .cholesky import cholesky_decompose, cholesky_solve, require_cholesky
+from .lu_factorization import lu_decompose, lu_solve, has_negligible_pivot
+from .matrix import Matrix, any_matrix, to_nested_list
+from . import backend
 
-def solve_linear_system_inverse(matrix_a, vector_b):
+def solve_linear_system_inverse(matrix_a, vector_b, exact=False, modulus=None):
     """
     Resolve um sistema de equações lineares da forma AX = B,
     utilizando o método da matriz inversa: X = A⁻¹ * B.
+    B pode ter várias colunas (N x k): a inversa é calculada uma única vez
+    e cada coluna de X é a solução para a coluna correspondente de B.
+
+    Com exact=True a solução é exata: a matriz aumentada [A | B] é reduzida por
+    Gauss-Jordan sem frações (equivalente a aplicar A⁻¹ sem formá-la) e X é
+    devolvida como fractions.Fraction.
 
     Args:
         matrix_a (list[list[float]]): A matriz quadrada dos coeficientes (A).
         vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos 
-                                      independentes (B).
+                                      independentes (B), ou uma matriz N x k.
+        exact (bool): Se True, usa aritmética exata.
+        modulus (int or None): Se informado (um primo p), resolve o sistema em GF(p).
 
     Returns:
-        list[list[float]]: O vetor coluna (matriz Nx1) da solução (X).
+        list[list[float]]: A solução (X), com as mesmas dimensões de B.
+                           No modo exato, sempre uma lista de listas de Fraction;
+                           em GF(p), inteiros em [0, p).
 
     Raises:
         ValueError: Se as entradas não forem válidas (ex: A não quadrada, dimensões
-                    incompatíveis, A singular), ou se ocorrer um erro durante o
-                    cálculo da inversa.
+                    incompatíveis, A singular), se exact=True e modulus forem
+                    informados juntos, ou se ocorrer um erro durante o cálculo da inversa.
     """
     # 1. Validação das Entradas do Sistema:
-    #    Verifica se 'matrix_a' é quadrada, se 'vector_b' é um vetor coluna,
+    #    Verifica se 'matrix_a' é quadrada, se 'vector_b' é uma matriz válida,
     #    e se as dimensões são compatíveis para um sistema AX=B.
     #    Levanta ValueError se a validação falhar.
     validate_linear_system_inputs(matrix_a, vector_b)
+    if exact and modulus is not None:
+        raise ValueError("Os modos exact=True e modulus= não podem ser combinados: escolha aritmética exata ou GF(p).")
+
+    #    Modo exato: elimina diretamente sobre [A | B], sem frações intermediárias.
+    if exact:
+        try:
+            return fraction_free_solve(to_nested_list(matrix_a), to_nested_list(vector_b),
+                                       "Sistema AX = B")
+        except ValueError as e:
+            raise ValueError(f"Não é possível resolver o sistema: {e}")
+
+    #    Aritmética em GF(p): a eliminação sobre [A | B] substitui a inversa explícita.
+    if modulus is not None:
+        return _solve_modular(matrix_a, vector_b, modulus)
+
+    #    A com estrutura (triangular, diagonal, permutação, identidade): resolve
+    #    por substituição direta, sem formar a inversa; A em banda estreita: LU em
+    #    banda; A simétrica definida positiva: Cholesky, também sem formar a inversa.
+    solution_x = _solve_structured(matrix_a, vector_b)
+    if solution_x is not None:
+        return solution_x
 
     # 2. Cálculo da Matriz Inversa de A (A⁻¹):
-    #    Tenta calcular a inversa de 'matrix_a'.
+    #    Tenta calcular a inversa de 'matrix_a' (já validada, por isso a função interna).
+    #    Operandos Matrix são tratados pelas próprias funções internas: se A ou B
+    #    for um Matrix, o produto final também é um Matrix.
     try:
-        inv_a = inverse_matrix(matrix_a)
+        inv_a = _inverse(matrix_a)
     except ValueError as e: 
-        # Se 'inverse_matrix' levantar um ValueError (ex: matriz singular, det(A)=0),
+        # Se '_inverse' levantar um ValueError (ex: matriz singular, det(A)=0),
         # a exceção é capturada e relançada com uma mensagem mais contextualizada
         # para a resolução do sistema.
         raise ValueError(f"Não é possível resolver o sistema: {e}")
@@ -45,10 +94,157 @@ def solve_linear_system_inverse(matrix_a, vector_b):
     # 3. Cálculo da Solução (X = A⁻¹ * B):
     #    Multiplica a matriz inversa de A (inv_a) pelo vetor B (vector_b).
     #    O resultado desta multiplicação é o vetor solução X.
-    #    A função 'multiply_matrices' lida com a multiplicação de uma matriz NxN (inv_a)
-    #    por uma matriz Nx1 (vector_b), resultando em uma matriz Nx1 (solution_x).
-    solution_x = multiply_matrices(inv_a, vector_b)
+    #    A função '_multiply' lida com a multiplicação de uma matriz NxN (inv_a)
+    #    por uma matriz N x k (vector_b), resultando em uma matriz N x k (solution_x).
+    solution_x = _multiply(inv_a, vector_b)
 
     # 4. Retorno da Solução:
-    #    Devolve o vetor coluna 'solution_x'.
-    return solution_x
\ No newline at end of file
+    #    Devolve 'solution_x' (vetor coluna, ou matriz N x k para vários lados direitos).
+    return solution_x
+
+
+def solve_linear_system_lu(matrix_a, vector_b, modulus=None):
+    """
+    Resolve um sistema de equações lineares da forma AX = B por fatoração LU
+    com pivoteamento parcial (P*A = L*U), seguida de substituição progressiva
+    e regressiva. A inversa de A nunca é formada: o custo é O(n³) para a
+    fatoração e O(n²) por coluna de B, e o resultado é mais preciso que X = A⁻¹ * B.
+    B pode ter várias colunas (N x k): todas são resolvidas com a mesma fatoração.
+    Se A for simétrica definida positiva, a fatoração de Cholesky substitui a LU.
+
+    Args:
+        matrix_a (list[list[float]]): A matriz quadrada dos coeficientes (A).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos
+                                      independentes (B), ou uma matriz N x k.
+        modulus (int or None): Se informado (um primo p), resolve o sistema em GF(p).
+
+    Returns:
+        list[list[float]]: A solução (X), com as mesmas dimensões de B
+                           (em GF(p), inteiros em [0, p)).
+
+    Raises:
+        ValueError: Se as entradas não forem válidas (ex: A não quadrada, dimensões
+                    incompatíveis), se A for singular ou se o módulo não for primo.
+    """
+    # 1. Validação das Entradas do Sistema:
+    validate_linear_system_inputs(matrix_a, vector_b)
+
+    #    Aritmética em GF(p): eliminação progressiva e substituição regressiva módulo p.
+    if modulus is not None:
+        return _solve_modular(matrix_a, vector_b, modulus)
+
+    #    Operandos Matrix: resolve com listas e devolve a solução como Matrix.
+    if any_matrix(matrix_a, vector_b):
+        return Matrix._from_rows(_solve_lu(to_nested_list(matrix_a), to_nested_list(vector_b)))
+    return _solve_lu(matrix_a, vector_b)
+
+
+def _solve_lu(matrix_a, vector_b):
+    """
+    (Função auxiliar interna) Resolução por fatoração LU para entradas já validadas (em listas).
+    """
+    #    A com estrutura: substituição direta, sem fatorar (ou LU em banda / Cholesky).
+    solution_x = _solve_structured(matrix_a, vector_b)
+    if solution_x is not None:
+        return solution_x
+
+    #    Para sistemas grandes em ponto flutuante, delega ao backend NumPy (se disponível).
+    if backend.should_use_numpy(matrix_a, vector_b):
+        return backend.numpy_solve(matrix_a, vector_b)
+
+    # 2. Fatoração LU de A (feita uma única vez para todas as colunas de B):
+    #    A é singular se algum pivô for desprezível em relação à escala da sua coluna.
+    lu, perm, sign = lu_decompose(matrix_a)
+    if has_negligible_pivot(matrix_a, lu, sign):
+        raise ValueError("Não é possível resolver o sistema: A matriz não é invertível (determinante é zero).")
+
+    # 3. Substituições Progressiva e Regressiva, coluna a coluna:
+    #    'zip(*vector_b)' percorre as colunas de B; as colunas solução são
+    #    transpostas de volta para o formato N x k.
+    solution_columns = [lu_solve(lu, perm, column) for column in zip(*vector_b)]
+
+    # 4. Retorno da Solução (mesmas dimensões de B):
+    return [list(row) for row in zip(*solution_columns)]
+
+
+def solve_linear_system_cholesky(matrix_a, vector_b):
+    """
+    Resolve um sistema de equações lineares AX = B com A simétrica definida positiva,
+    pela fatoração de Cholesky A = L*Lᵀ seguida de substituição progressiva (L*y = b)
+    e regressiva (Lᵀ*x = y). Usa cerca de metade das operações da LU e não precisa
+    de pivoteamento. B pode ter várias colunas (N x k).
+
+    Os métodos "auto" já escolhem Cholesky para A simétrica; esta função é a
+    escolha explícita, que falha em vez de recorrer à LU.
+
+    Args:
+        matrix_a (list[list[float]]): A matriz simétrica definida positiva (A).
+        vector_b (list[list[float]]): O vetor coluna (matriz Nx1) dos termos
+                                      independentes (B), ou uma matriz N x k.
+
+    Returns:
+        list[list[float]]: A solução (X), com as mesmas dimensões de B.
+
+    Raises:
+        ValueError: Se as entradas não forem válidas ou se A não for simétrica
+                    definida positiva.
+    """
+    # 1. Validação das Entradas do Sistema:
+    validate_linear_system_inputs(matrix_a, vector_b)
+
+    # 2. Fatoração de Cholesky de A:
+    try:
+        lower = require_cholesky(to_nested_list(matrix_a))
+    except ValueError as e:
+        raise ValueError(f"Não é possível resolver o sistema: {e}")
+
+    # 3. Substituições e Retorno da Solução (Matrix, se algum operando for Matrix):
+    solution = _solve_cholesky_columns(lower, to_nested_list(vector_b))
+    return Matrix._from_rows(solution) if any_matrix(matrix_a, vector_b) else solution
+
+
+def _solve_cholesky_columns(lower, matrix_b):
+    """(Função auxiliar interna) Resolve L*Lᵀ*X = B coluna a coluna, com o mesmo fator L."""
+    solution_columns = [cholesky_solve(lower, column) for column in zip(*matrix_b)]
+    return [list(row) for row in zip(*solution_columns)]
+
+
+def _solve_modular(matrix_a, vector_b, modulus):
+    """
+    (Função auxiliar interna) Resolução em GF(p) para entradas já validadas
+    (ver finite_field.solve_mod). Operandos Matrix produzem um Matrix.
+    """
+    validate_modulus(modulus)
+    try:
+        solution = solve_mod(to_nested_list(matrix_a), to_nested_list(vector_b), modulus)
+    except ValueError as e:
+        raise ValueError(f"Não é possível resolver o sistema: {e}")
+    return Matrix._from_rows(solution) if any_matrix(matrix_a, vector_b) else solution
+
+
+def _solve_structured(matrix_a, vector_b):
+    """
+    (Função auxiliar interna) Resolve A*X = B pelo caminho rápido da estrutura de A
+    (ver matrix_structure), por LU em banda se A tiver banda estreita (ver banded)
+    ou, para A simétrica definida positiva, por Cholesky. Retorna None se A for geral
+    (ou simétrica indefinida), deixando a LU densa para o chamador.
+    Operandos Matrix produzem um Matrix.
+    """
+    list_a = to_nested_list(matrix_a)
+    list_b = to_nested_list(vector_b)
+    structure = _detect_structure(list_a)
+    try:
+        solution = structured_solve(list_a, list_b, structure)
+        if solution is None:
+            lower, upper = _detect_bandwidth(list_a)
+            if is_narrow_band(lower, upper, len(list_a)):
+                solution = _solve_band(_to_band_storage(list_a, lower, upper), lower, upper, list_b)
+    except ValueError as e:
+        raise ValueError(f"Não é possível resolver o sistema: {e}")
+    if solution is None and structure.symmetric:
+        lower = cholesky_decompose(list_a)
+        if lower is not None:
+            solution = _solve_cholesky_columns(lower, list_b)
+    if solution is not None and any_matrix(matrix_a, vector_b):
+        return Matrix._from_rows(solution)
+    return solution
@@ -0,0 +1,413 @@
+# calculadora_matrizes/logic/sparse.py
+
+# Este módulo define as matrizes esparsas CSRMatrix e CSCMatrix, que armazenam
+# apenas os elementos não nulos, e os kernels esparsos usados por add_matrices,
+# subtract_matrices, scalar_multiply, transpose_matrix e multiply_matrices.
+# O custo de memória e de cada operação é proporcional ao número de não nulos
+# (nnz), e não a linhas * colunas: uma matriz 50 000 x 50 000 com 200 000 não
+# nulos ocupa alguns megabytes, contra bilhões de elementos na forma densa.
+#
+# Formato comprimido (CSR, por linhas; CSC, por colunas):
+#   - data[k]:    o k-ésimo valor não nulo;
+#   - indices[k]: a coluna (CSR) ou a linha (CSC) de data[k];
+#   - indptr[i]:  início, em data/indices, da linha (CSR) ou coluna (CSC) i;
+#                 o fim é indptr[i + 1] (len(indptr) = linhas + 1 ou colunas + 1).
+# Os índices de cada linha (coluna) ficam em ordem crescente, sem repetições.
+#
+# As conversões de e para a forma densa são explícitas (from_dense / to_list):
+# as operações que não têm versão esparsa (determinante, inversa, ...) recusam
+# matrizes esparsas em vez de convertê-las silenciosamente. Os resultados seguem
+# a regra: esparsa com esparsa -> esparsa; esparsa com densa -> densa (lista de
+# listas, ou Matrix se o operando denso for Matrix).
+from bisect import bisect_left
+from operator import add, sub
+from .matrix import Matrix, to_nested_list
+
+class SparseMatrix:
+    """
+    Base comum de CSRMatrix e CSCMatrix: as linhas (CSR) ou colunas (CSC) são os
+    "eixos principais" do formato comprimido. Cada subclasse define
+    _major_size(rows, cols), o tamanho do seu eixo principal.
+
+    Atributos:
+        rows (int): Número de linhas.
+        cols (int): Número de colunas.
+        data (list): Os valores não nulos.
+        indices (list[int]): O índice secundário (coluna em CSR, linha em CSC) de cada valor.
+        indptr (list[int]): Os inícios de cada linha (CSR) ou coluna (CSC) em data/indices.
+    """
+
+    __slots__ = ("rows", "cols", "data", "indices", "indptr")
+
+    def __init__(self, rows, cols, data, indices, indptr):
+        """
+        Constrói a matriz a partir dos arrays do formato comprimido, já prontos.
+        Prefira from_dense ou from_triplets.
+
+        Raises:
+            ValueError: Se as dimensões forem inválidas ou os arrays incompatíveis.
+        """
+        if rows < 1 or cols < 1 or len(indptr) != self._major_size(rows, cols) + 1 \
+                or len(data) != len(indices) or indptr[-1] != len(data):
+            raise ValueError("Dimensões da matriz esparsa incompatíveis com os arrays do formato comprimido.")
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+        self.indices = indices
+        self.indptr = indptr
+
+    @property
+    def shape(self):
+        """A tupla (rows, cols)."""
+        return (self.rows, self.cols)
+
+    @property
+    def nnz(self):
+        """Número de elementos armazenados (não nulos)."""
+        return len(self.data)
+
+    def __len__(self):
+        """Número de linhas, como em uma lista de listas."""
+        return self.rows
+
+    def __getitem__(self, index):
+        """
+        m[i, j] retorna o elemento (i, j) (busca binária, O(log nnz da linha));
+        m[i] retorna a linha i como lista densa (compatível com m[i][j] de listas).
+        """
+        if isinstance(index, tuple):
+            return self._element(*index)
+        if not -self.rows <= index < self.rows:
+            raise IndexError("Índice de linha fora do intervalo da matriz esparsa.")
+        return self._dense_row(index % self.rows)
+
+    def __eq__(self, other):
+        if not isinstance(other, SparseMatrix):
+            return NotImplemented
+        mine, theirs = self.to_csr(), other.to_csr()
+        return (mine.shape == theirs.shape and mine.indptr == theirs.indptr
+                and mine.indices == theirs.indices and mine.data == theirs.data)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.rows}x{self.cols}, nnz={self.nnz})"
+
+    def _major(self, major, secondary):
+        """(Método auxiliar interno) Busca binária do índice secundário no eixo principal 'major'."""
+        start, end = self.indptr[major], self.indptr[major + 1]
+        k = bisect_left(self.indices, secondary, start, end)
+        return self.data[k] if k < end and self.indices[k] == secondary else 0
+
+
+class CSRMatrix(SparseMatrix):
+    """Matriz esparsa comprimida por linhas (Compressed Sparse Row)."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _major_size(rows, cols):
+        """(Método auxiliar interno) Tamanho do eixo principal: as linhas."""
+        return rows
+
+    @classmethod
+    def from_dense(cls, matrix, matrix_name="Matriz"):
+        """
+        Cria uma CSRMatrix a partir de uma matriz densa (lista de listas ou Matrix),
+        guardando apenas os elementos não nulos.
+
+        Raises:
+            ValueError: Se a estrutura da matriz densa for inválida.
+        """
+        # Importação local para evitar dependência circular (validation_utils reconhece SparseMatrix).
+        from .validation_utils import validate_matrix_input
+
+        validate_matrix_input(matrix, matrix_name)
+        matrix = to_nested_list(matrix)
+        data, indices, indptr = [], [], [0]
+        for row in matrix:
+            for j, value in enumerate(row):
+                if value:
+                    indices.append(j)
+                    data.append(value)
+            indptr.append(len(data))
+        return cls(len(matrix), len(matrix[0]), data, indices, indptr)
+
+    @classmethod
+    def from_triplets(cls, rows, cols, row_indices, col_indices, values):
+        """
+        Cria uma CSRMatrix rows x cols a partir de triplas (i, j, valor), sem
+        passar pela forma densa. Valores repetidos na mesma posição são somados
+        e os zeros resultantes descartados. Custo O(nnz log nnz).
+
+        Raises:
+            ValueError: Se as listas tiverem tamanhos diferentes ou algum índice
+                        estiver fora das dimensões.
+        """
+        if not len(row_indices) == len(col_indices) == len(values):
+            raise ValueError("As listas de linhas, colunas e valores devem ter o mesmo tamanho.")
+        if type(rows) is not int or type(cols) is not int or rows < 1 or cols < 1:
+            raise ValueError("As dimensões da matriz esparsa devem ser inteiros positivos.")
+        entries = {}
+        for i, j, value in zip(row_indices, col_indices, values):
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise ValueError(f"Índice ({i}, {j}) fora das dimensões {rows}x{cols} da matriz esparsa.")
+            entries[i, j] = entries.get((i, j), 0) + value
+        return cls._from_entries(rows, cols, entries)
+
+    @classmethod
+    def _from_entries(cls, rows, cols, entries):
+        """(Método auxiliar interno) CSRMatrix a partir de um dicionário {(i, j): valor}."""
+        data, indices, indptr = [], [], [0] * (rows + 1)
+        for (i, j) in sorted(entries):
+            value = entries[i, j]
+            if value:
+                indices.append(j)
+                data.append(value)
+                indptr[i + 1] += 1
+        for i in range(rows):
+            indptr[i + 1] += indptr[i]
+        return cls(rows, cols, data, indices, indptr)
+
+    def to_list(self):
+        """Converte para a forma densa (lista de listas)."""
+        return [self._dense_row(i) for i in range(self.rows)]
+
+    def to_csr(self):
+        """Retorna a própria matriz (já em CSR)."""
+        return self
+
+    def to_csc(self):
+        """Converte para CSC (mesma matriz, comprimida por colunas). Custo O(nnz + colunas)."""
+        return CSCMatrix(self.rows, self.cols, *_recompress(self.data, self.indices, self.indptr, self.cols))
+
+    def _element(self, i, j):
+        return self._major(i, j)
+
+    def _dense_row(self, i):
+        row = [0] * self.cols
+        for k in range(self.indptr[i], self.indptr[i + 1]):
+            row[self.indices[k]] = self.data[k]
+        return row
+
+    # Protocolo de operador dos resolvedores iterativos (ver iterative_solvers).
+    def matvec(self, x):
+        """Produto A*x com x como lista simples. Custo O(nnz)."""
+        data, indices, indptr = self.data, self.indices, self.indptr
+        return [sum(data[k] * x[indices[k]] for k in range(indptr[i], indptr[i + 1])) for i in range(self.rows)]
+
+    def diagonal(self):
+        """Os elementos A[i][i] (0 onde não houver elemento armazenado)."""
+        return [self._major(i, i) for i in range(min(self.rows, self.cols))]
+
+    def row_dot(self, i, x):
+        """Soma de A[i][j] * x[j] sobre os não nulos da linha i."""
+        data, indices = self.data, self.indices
+        return sum(data[k] * x[indices[k]] for k in range(self.indptr[i], self.indptr[i + 1]))
+
+
+class CSCMatrix(SparseMatrix):
+    """Matriz esparsa comprimida por colunas (Compressed Sparse Column)."""
+
+    __slots__ = ()
+
+    @staticmethod
+    def _major_size(rows, cols):
+        """(Método auxiliar interno) Tamanho do eixo principal: as colunas."""
+        return cols
+
+    @classmethod
+    def from_dense(cls, matrix, matrix_name="Matriz"):
+        """Cria uma CSCMatrix a partir de uma matriz densa (ver CSRMatrix.from_dense)."""
+        return CSRMatrix.from_dense(matrix, matrix_name).to_csc()
+
+    def to_list(self):
+        """Converte para a forma densa (lista de listas)."""
+        return self.to_csr().to_list()
+
+    def to_csr(self):
+        """Converte para CSR (mesma matriz, comprimida por linhas). Custo O(nnz + linhas)."""
+        return CSRMatrix(self.rows, self.cols, *_recompress(self.data, self.indices, self.indptr, self.rows))
+
+    def to_csc(self):
+        """Retorna a própria matriz (já em CSC)."""
+        return self
+
+    def _element(self, i, j):
+        return self._major(j, i)
+
+    def _dense_row(self, i):
+        return [self._major(j, i) for j in range(self.cols)]
+
+    # Protocolo de operador dos resolvedores iterativos (ver iterative_solvers).
+    def matvec(self, x):
+        """Produto A*x com x como lista simples: soma das colunas j escaladas por x[j]. Custo O(nnz)."""
+        data, indices, indptr = self.data, self.indices, self.indptr
+        result = [0] * self.rows
+        for j in range(self.cols):
+            value = x[j]
+            if value:
+                for k in range(indptr[j], indptr[j + 1]):
+                    result[indices[k]] += data[k] * value
+        return result
+
+    def diagonal(self):
+        """Os elementos A[i][i] (0 onde não houver elemento armazenado)."""
+        return [self._major(i, i) for i in range(min(self.rows, self.cols))]
+
+
+def is_sparse(matrix):
+    """Retorna True se 'matrix' for uma matriz esparsa (CSRMatrix ou CSCMatrix)."""
+    return isinstance(matrix, SparseMatrix)
+
+
+def any_sparse(*operands):
+    """Retorna True se algum dos operandos for uma matriz esparsa."""
+    return any(isinstance(operand, SparseMatrix) for operand in operands)
+
+
+def _recompress(data, indices, indptr, secondary_size):
+    """
+    (Função auxiliar interna) Troca o eixo principal do formato comprimido
+    (CSR <-> CSC) por contagem: O(nnz + tamanho do eixo secundário).
+    Como os eixos principais são percorridos em ordem, os novos índices já saem ordenados.
+
+    Returns:
+        tuple: (data, indices, indptr) no outro formato.
+    """
+    # 1. Contagem de elementos por índice secundário (o novo eixo principal):
+    new_indptr = [0] * (secondary_size + 1)
+    for index in indices:
+        new_indptr[index + 1] += 1
+    for i in range(secondary_size):
+        new_indptr[i + 1] += new_indptr[i]
+
+    # 2. Distribuição dos elementos nas novas posições:
+    position = new_indptr[:-1]
+    new_data = [0] * len(data)
+    new_indices = [0] * len(data)
+    for major in range(len(indptr) - 1):
+        for k in range(indptr[major], indptr[major + 1]):
+            target = position[indices[k]]
+            new_data[target] = data[k]
+            new_indices[target] = major
+            position[indices[k]] = target + 1
+    return new_data, new_indices, new_indptr
+
+
+def sparse_add(matrix_a, matrix_b, operation=add):
+    """
+    Soma (ou, com operation=sub, subtração) elemento a elemento com ao menos um
+    operando esparso. Pré-condição: dimensões já validadas.
+    Esparsa com esparsa: resultado esparso (no formato de A), custo O(nnz(A) + nnz(B)).
+    Esparsa com densa: resultado denso, custo O(linhas * colunas).
+    """
+    # 1. Esparsa com Densa: parte da cópia densa e aplica os não nulos.
+    #    Com A esparsa, o ponto de partida é 0 (op) B; como a (op) b = a + (0 (op) b)
+    #    para soma e subtração, basta somar os não nulos de A.
+    if not (is_sparse(matrix_a) and is_sparse(matrix_b)):
+        dense_operand = matrix_b if is_sparse(matrix_a) else matrix_a
+        if is_sparse(matrix_a):
+            result = [[operation(0, value) for value in row] for row in to_nested_list(matrix_b)]
+            _scatter(matrix_a, result, add)
+        else:
+            result = [list(row) for row in to_nested_list(matrix_a)]
+            _scatter(matrix_b, result, operation)
+        return Matrix._from_rows(result) if isinstance(dense_operand, Matrix) else result
+
+    # 2. Esparsa com Esparsa: combina os eixos principais no formato de A.
+    fmt = type(matrix_a)
+    a = matrix_a
+    b = matrix_b.to_csr() if fmt is CSRMatrix else matrix_b.to_csc()
+    data, indices, indptr = [], [], [0]
+    for major in range(len(a.indptr) - 1):
+        merged = dict(zip(a.indices[a.indptr[major]:a.indptr[major + 1]], a.data[a.indptr[major]:a.indptr[major + 1]]))
+        for k in range(b.indptr[major], b.indptr[major + 1]):
+            index = b.indices[k]
+            merged[index] = operation(merged.get(index, 0), b.data[k])
+        for index in sorted(merged):
+            value = merged[index]
+            if value:
+                indices.append(index)
+                data.append(value)
+        indptr.append(len(data))
+    return fmt(a.rows, a.cols, data, indices, indptr)
+
+
+def sparse_subtract(matrix_a, matrix_b):
+    """Subtração A - B com ao menos um operando esparso (ver sparse_add)."""
+    return sparse_add(matrix_a, matrix_b, sub)
+
+
+def _scatter(matrix, dense, combine):
+    """(Função auxiliar interna) dense[i][j] = combine(dense[i][j], A[i][j]) para os não nulos de A."""
+    csr = matrix.to_csr()
+    for i in range(csr.rows):
+        row = dense[i]
+        for k in range(csr.indptr[i], csr.indptr[i + 1]):
+            j = csr.indices[k]
+            row[j] = combine(row[j], csr.data[k])
+
+
+def sparse_scalar_multiply(matrix, scalar):
+    """Multiplicação por escalar no próprio formato esparso. Custo O(nnz)."""
+    if not scalar:
+        return type(matrix)(matrix.rows, matrix.cols, [], [], [0] * len(matrix.indptr))
+    return type(matrix)(matrix.rows, matrix.cols, [value * scalar for value in matrix.data],
+                        list(matrix.indices), list(matrix.indptr))
+
+
+def sparse_transpose(matrix):
+    """
+    Transposta sem copiar os arrays: a CSR de A é exatamente a CSC de Aᵀ (e vice-versa),
+    então basta trocar o tipo e as dimensões. Custo O(1).
+    """
+    transposed_type = CSCMatrix if isinstance(matrix, CSRMatrix) else CSRMatrix
+    return transposed_type(matrix.cols, matrix.rows, matrix.data, matrix.indices, matrix.indptr)
+
+
+def sparse_multiply(matrix_a, matrix_b):
+    """
+    Produto A*B com ao menos um operando esparso. Pré-condição: dimensões já validadas.
+      - esparsa * esparsa: algoritmo de Gustavson (linha a linha, acumulando em um
+        dicionário), resultado CSR, custo proporcional às multiplicações não nulas;
+      - esparsa * densa:   cada linha de C combina as linhas de B indicadas pelos
+        não nulos da linha de A, custo O(nnz(A) * colunas de B);
+      - densa * esparsa:   (Bᵀ * Aᵀ)ᵀ, pelo caso anterior.
+    """
+    # 1. Esparsa * Esparsa (Gustavson):
+    if is_sparse(matrix_a) and is_sparse(matrix_b):
+        a, b = matrix_a.to_csr(), matrix_b.to_csr()
+        data, indices, indptr = [], [], [0]
+        for i in range(a.rows):
+            accumulator = {}
+            for k in range(a.indptr[i], a.indptr[i + 1]):
+                row_b, value_a = a.indices[k], a.data[k]
+                for t in range(b.indptr[row_b], b.indptr[row_b + 1]):
+                    column = b.indices[t]
+                    accumulator[column] = accumulator.get(column, 0) + value_a * b.data[t]
+            for column in sorted(accumulator):
+                value = accumulator[column]
+                if value:
+                    indices.append(column)
+                    data.append(value)
+            indptr.append(len(data))
+        return CSRMatrix(a.rows, b.cols, data, indices, indptr)
+
+    # 2. Esparsa * Densa: C[i] = soma(A[i][k] * B[k]) sobre os não nulos da linha i de A.
+    if is_sparse(matrix_a):
+        a = matrix_a.to_csr()
+        dense_b = to_nested_list(matrix_b)
+        cols_b = len(dense_b[0])
+        result = []
+        for i in range(a.rows):
+            row = [0] * cols_b
+            for k in range(a.indptr[i], a.indptr[i + 1]):
+                value = a.data[k]
+                row = [x + value * y for x, y in zip(row, dense_b[a.indices[k]])]
+            result.append(row)
+        return Matrix._from_rows(result) if isinstance(matrix_b, Matrix) else result
+
+    # 3. Densa * Esparsa: C = (Bᵀ * Aᵀ)ᵀ, com Bᵀ esparsa obtida sem cópia.
+    dense_a = to_nested_list(matrix_a)
+    transposed = sparse_multiply(sparse_transpose(matrix_b), [list(column) for column in zip(*dense_a)])
+    result = [list(row) for row in zip(*transposed)]
+    return Matrix._from_rows(result) if isinstance(matrix_a, Matrix) else result
@@ -2,50 +2,92 @@
 
 # Importa a função de validação específica para operações de adição e subtração de matrizes.
 # Esta função garante que ambas as matrizes são válidas e têm dimensões compatíveis.
-from .validation_utils import validate_matrices_for_add_sub
+from operator import sub
+from .validation_utils import validate_matrices_for_broadcast, validate_output_matrix
+from .matrix import Matrix, any_matrix, _write_into
+from .sparse import any_sparse, sparse_subtract
+from .broadcasting import _needs_broadcast, _broadcast_apply
+from . import backend
 
-def subtract_matrices(matrix_a, matrix_b):
+def subtract_matrices(matrix_a, matrix_b, out=None):
     """
     Subtrai a matriz B da matriz A (A - B), elemento a elemento.
+    Com broadcasting, A ou B pode ser um escalar, um vetor linha (1 x n) ou um vetor
+    coluna (m x 1), aplicado a cada linha/coluna do outro operando sem ser expandido
+    (ex: subtrair as médias das colunas, 1 x n, de uma matriz m x n).
 
     Args:
-        matrix_a (list[list[float]]): A primeira matriz (minuendo).
-        matrix_b (list[list[float]]): A segunda matriz (subtraendo).
+        matrix_a (list[list[float]] or float): A primeira matriz (minuendo).
+        matrix_b (list[list[float]] or float): A segunda matriz (subtraendo).
+        out (list[list[float]] or Matrix or None): Matriz densa, com as mesmas dimensões,
+                                                   na qual escrever o resultado (pode ser A ou B).
 
     Returns:
-        list[list[float]]: A matriz resultante da subtração.
+        list[list[float]]: A matriz resultante da subtração (um Matrix, se algum operando for Matrix;
+                           uma matriz esparsa, se ambos forem esparsos), ou a própria 'out'.
 
     Raises:
         ValueError: Se as matrizes não forem válidas ou não tiverem dimensões compatíveis
-                    para a subtração (essa exceção é levantada por validate_matrices_for_add_sub).
+                    para a subtração (essa exceção é levantada por validate_matrices_for_add_sub),
+                    ou se 'out' não for uma matriz densa com as dimensões do resultado.
     """
     # 1. Validação das Matrizes de Entrada:
-    #    Assegura que A e B são matrizes válidas e possuem dimensões idênticas,
-    #    uma condição necessária para a subtração elemento a elemento.
+    #    Assegura que A e B são matrizes válidas e possuem dimensões idênticas (ou
+    #    compatíveis por broadcasting); 'shape' são as dimensões do resultado.
     #    Se a validação falhar, uma exceção ValueError é interrompe a função.
-    validate_matrices_for_add_sub(matrix_a, matrix_b)
-
-    # 2. Obtenção das Dimensões:
-    #    As dimensões da matriz resultado serão as mesmas das matrizes de entrada (A e B),
-    #    pois a validação já confirmou que são iguais.
-    rows = len(matrix_a)      # Número de linhas.
-    cols = len(matrix_a[0])   # Número de colunas.
-
-    # 3. Criação da Matriz Resultado:
-    #    Inicializa uma nova matriz (result) com zeros, do mesmo tamanho de A e B.
-    #    Esta matriz armazenará a diferença.
-    #    Ex: Para A e B 2x2, result = [[0, 0], [0, 0]].
-    result = [[0 for _ in range(cols)] for _ in range(rows)]
-
-    # 4. Processo de Subtração:
-    #    Itera sobre cada posição (i, j) das matrizes.
-    for i in range(rows):          # Para cada linha i...
-        for j in range(cols):      # Para cada coluna j...
-            # Subtrai o elemento B[i][j] do elemento A[i][j]
-            # e armazena a diferença em result[i][j].
-            # Ex: result[0][0] = matrix_a[0][0] - matrix_b[0][0]
-            result[i][j] = matrix_a[i][j] - matrix_b[i][j]
-
-    # 5. Retorno do Resultado:
+    shape = validate_matrices_for_broadcast(matrix_a, matrix_b)
+
+    #    Com 'out', o resultado é escrito na matriz do chamador (sem nova alocação).
+    if out is not None:
+        validate_output_matrix(out, shape, matrix_a, matrix_b)
+        if _needs_broadcast(matrix_a, matrix_b):
+            return _broadcast_apply(sub, matrix_a, matrix_b, shape, out)
+        return _write_into(out, sub, matrix_a, matrix_b)
+
+    #    Broadcasting: um escalar, vetor linha (1 x n) ou vetor coluna (m x 1) é
+    #    combinado com cada linha/coluna do outro operando sem ser expandido (ver broadcasting.py).
+    if _needs_broadcast(matrix_a, matrix_b):
+        return _broadcast_apply(sub, matrix_a, matrix_b, shape)
+
+    #    Com algum operando esparso, usa o kernel esparso (ver sparse.py):
+    #    esparsa com esparsa resulta em esparsa; com densa, em densa.
+    if any_sparse(matrix_a, matrix_b):
+        return sparse_subtract(matrix_a, matrix_b)
+
+    #    Se algum operando for um Matrix, subtrai diretamente os arrays planos
+    #    e devolve um Matrix.
+    if any_matrix(matrix_a, matrix_b):
+        flat_a = Matrix._from_rows(matrix_a).data
+        flat_b = Matrix._from_rows(matrix_b).data
+        return Matrix._from_flat(len(matrix_a), len(matrix_a[0]), list(map(sub, flat_a, flat_b)))
+
+    #    Para matrizes grandes de floats, delega ao backend NumPy (se disponível).
+    if backend.should_use_numpy(matrix_a, matrix_b):
+        return backend.numpy_subtract(matrix_a, matrix_b)
+
+    # 2. Processo de Subtração:
+    #    Cada linha do resultado é produzida diretamente, em uma única passada,
+    #    subtraindo os elementos correspondentes: result[i][j] = A[i][j] - B[i][j].
+    #    (Não há uma matriz de zeros preenchida depois.)
+    result = [list(map(sub, row_a, row_b)) for row_a, row_b in zip(matrix_a, matrix_b)]
+
+    # 3. Retorno do Resultado:
     #    Devolve a matriz 'result' contendo a diferença A - B.
-    return result
\ No newline at end of file
+    return result
+
+
+def isub(matrix_a, matrix_b):
+    """
+    Subtrai B de A no próprio A (A -= B), sem alocar uma nova matriz.
+
+    Args:
+        matrix_a (list[list[float]] or Matrix): A matriz atualizada (densa).
+        matrix_b (list[list[float]] or Matrix): A matriz subtraída.
+
+    Returns:
+        list[list[float]] or Matrix: A própria matrix_a, já atualizada.
+
+    Raises:
+        ValueError: Se as matrizes não forem válidas, forem esparsas ou tiverem dimensões diferentes.
+    """
+    return subtract_matrices(matrix_a, matrix_b, out=matrix_a)
@@ -2,7 +2,10 @@
 
 # Importa a função de validação genérica para uma única matriz.
 # Garante que a 'matrix' de entrada é uma estrutura de lista de listas válida.
+from array import array
 from .validation_utils import validate_matrix_input
+from .matrix import Matrix
+from .sparse import is_sparse, sparse_transpose
 
 def transpose_matrix(matrix):
     """
@@ -14,7 +17,8 @@ def transpose_matrix(matrix):
         matrix (list[list[float]]): A matriz a ser transposta.
 
     Returns:
-        list[list[float]]: A matriz transposta.
+        list[list[float]]: A matriz transposta (um Matrix, se a entrada for Matrix;
+                           uma CSCMatrix para uma CSRMatrix, e vice-versa).
 
     Raises:
         ValueError: Se a 'matrix' de entrada não for uma estrutura válida
@@ -24,7 +28,26 @@ def transpose_matrix(matrix):
     #    Verifica se 'matrix' é uma lista de listas bem formada e não vazia.
     #    Se a validação falhar, 'validate_matrix_input' levantará um ValueError.
     #    O nome "Matriz para transposição" é para mensagens de erro claras.
-    validate_matrix_input(matrix, "Matriz para transposição")
+    validate_matrix_input(matrix, "Matriz para transposição", allow_sparse=True)
+    return _transpose(matrix)
+
+
+def _transpose(matrix):
+    """
+    (Função auxiliar interna) Transposição sem validação, para matrizes já
+    validadas (usada também pelo cálculo da matriz adjunta).
+    """
+    #    A transposta de uma CSR é a CSC com os mesmos arrays (e vice-versa): O(1).
+    if is_sparse(matrix):
+        return sparse_transpose(matrix)
+
+    #    Um Matrix é transposto lendo cada coluna por fatiamento com passo (data[j::cols]),
+    #    que vira uma linha contígua do resultado.
+    if isinstance(matrix, Matrix):
+        transposed = array(matrix.typecode)
+        for j in range(matrix.cols):
+            transposed.extend(matrix.column(j))
+        return Matrix(matrix.cols, matrix.rows, transposed)
 
     # 2. Obtenção das Dimensões Originais:
     #    - 'rows': Número de linhas da matriz original.
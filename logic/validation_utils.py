@@ -3,6 +3,31 @@
 # Este módulo contém funções de utilidade para validar a estrutura e as
 # dimensões das matrizes antes de realizar operações matemáticas sobre elas.
 # O objetivo é garantir a integridade dos dados e fornecer mensagens de erro claras.
+#
+# Instâncias de Matrix (ver matrix.py) são validadas na construção e têm formato
+# garantido; as funções abaixo as aceitam sem percorrer suas linhas.
+#
+# A validação acontece uma única vez, na fronteira pública de cada operação: as
+# operações compostas (ex: resolução de sistemas, que usa inversa e multiplicação)
+# chamam as implementações internas, que não revalidam. O contador abaixo registra
+# quantas matrizes em listas foram percorridas, para que os testes possam verificar isso.
+from numbers import Number
+from .matrix import Matrix
+from .sparse import SparseMatrix
+
+# Número de matrizes (em listas de listas) percorridas por validate_matrix_input.
+_validation_count = 0
+
+def get_validation_count():
+    """Retorna quantas matrizes em listas foram validadas desde o último reset."""
+    return _validation_count
+
+
+def reset_validation_count():
+    """Zera o contador de validações (usado pelos testes)."""
+    global _validation_count
+    _validation_count = 0
+
 
 def _is_valid_matrix_structure(matrix, matrix_name="Matriz"):
     """
@@ -52,11 +77,22 @@ def _has_consistent_column_count(matrix, matrix_name="Matriz"):
         raise ValueError(f"Todas as linhas da {matrix_name} devem ter o mesmo número de colunas.")
     return True
 
-def validate_matrix_input(matrix, matrix_name="Matriz"):
+def validate_matrix_input(matrix, matrix_name="Matriz", allow_sparse=False):
     """
     Validação compreensiva para uma única matriz.
     Chama as funções auxiliares para verificar estrutura e consistência de colunas.
+    Matrizes esparsas (ver sparse.py) só são aceitas com allow_sparse=True, pelas
+    operações que têm versão esparsa; as demais exigem a conversão explícita (to_list()).
     """
+    global _validation_count
+    # 0. Um Matrix (ou uma matriz esparsa) já foi validado na construção: nada a verificar.
+    if isinstance(matrix, Matrix):
+        return True
+    if isinstance(matrix, SparseMatrix):
+        if not allow_sparse:
+            raise ValueError(f"{matrix_name} é esparsa: esta operação requer uma matriz densa (converta com to_list()).")
+        return True
+    _validation_count += 1
     # 1. Valida a estrutura básica: se é uma lista de listas, não vazia, e a primeira linha não é vazia.
     _is_valid_matrix_structure(matrix, matrix_name)
     # 2. Valida se todas as linhas têm o mesmo número de colunas.
@@ -72,15 +108,15 @@ def validate_matrices_for_add_sub(matrix_a, matrix_b):
     """
     # 1. Validação Individual:
     #    Primeiro, cada matriz (A e B) é validada independentemente usando 'validate_matrix_input'.
-    validate_matrix_input(matrix_a, "Matriz A")
-    validate_matrix_input(matrix_b, "Matriz B")
+    validate_matrix_input(matrix_a, "Matriz A", allow_sparse=True)
+    validate_matrix_input(matrix_b, "Matriz B", allow_sparse=True)
     
     # 2. Verificação de Dimensões Iguais:
     #    - 'len(matrix_a) != len(matrix_b)': Compara o número de linhas.
     #    - 'len(matrix_a[0]) != len(matrix_b[0])': Compara o número de colunas (da primeira linha,
     #      assumindo que a consistência interna de cada matriz já foi validada).
     #    Se as dimensões não forem idênticas, uma exceção é levantada.
-    if len(matrix_a) != len(matrix_b) or len(matrix_a[0]) != len(matrix_b[0]):
+    if _shape(matrix_a) != _shape(matrix_b):
         raise ValueError("Matrizes devem ter as mesmas dimensões para adição/subtração.")
     return True
 
@@ -92,18 +128,78 @@ def validate_matrix_for_mult(matrix_a, matrix_b):
     """
     # 1. Validação Individual:
     #    Valida cada matriz separadamente.
-    validate_matrix_input(matrix_a, "Matriz A")
-    validate_matrix_input(matrix_b, "Matriz B")
+    validate_matrix_input(matrix_a, "Matriz A", allow_sparse=True)
+    validate_matrix_input(matrix_b, "Matriz B", allow_sparse=True)
     
     # 2. Verificação da Condição de Multiplicação:
     #    Para multiplicar A (m x n) por B (p x q), é necessário que n == p.
     #    - 'len(matrix_a[0])': Número de colunas da matriz A.
     #    - 'len(matrix_b)': Número de linhas da matriz B.
     #    Se esta condição não for satisfeita, a multiplicação não é definida.
-    if len(matrix_a[0]) != len(matrix_b):
+    if _shape(matrix_a)[1] != _shape(matrix_b)[0]:
         raise ValueError("Número de colunas da Matriz A deve ser igual ao número de linhas da Matriz B para multiplicação.")
     return True
 
+
+def validate_matrices_for_broadcast(matrix_a, matrix_b):
+    """
+    Valida dois operandos (A e B) para adição ou subtração com broadcasting (como no NumPy):
+    cada operando é uma matriz ou um escalar (tratado como 1x1), e em cada eixo as
+    dimensões devem ser iguais ou uma delas igual a 1. Ex: (m x n) com (1 x n), (m x 1),
+    (1 x 1) ou um escalar resulta em m x n; (m x 1) com (1 x n) também resulta em m x n.
+
+    Returns:
+        tuple: As dimensões (linhas, colunas) do resultado.
+    """
+    # 1. Validação Individual (escalares dispensam a validação de estrutura):
+    if _is_scalar(matrix_a) and _is_scalar(matrix_b):
+        raise ValueError("Ao menos um dos operandos da adição/subtração deve ser uma matriz.")
+    if not _is_scalar(matrix_a):
+        validate_matrix_input(matrix_a, "Matriz A", allow_sparse=True)
+    if not _is_scalar(matrix_b):
+        validate_matrix_input(matrix_b, "Matriz B", allow_sparse=True)
+
+    # 2. Regras de Broadcasting, eixo a eixo:
+    shape_a = (1, 1) if _is_scalar(matrix_a) else _shape(matrix_a)
+    shape_b = (1, 1) if _is_scalar(matrix_b) else _shape(matrix_b)
+    if any(size_a != size_b and 1 not in (size_a, size_b) for size_a, size_b in zip(shape_a, shape_b)):
+        raise ValueError("Matrizes devem ter as mesmas dimensões para adição/subtração "
+                         "(ou dimensões compatíveis por broadcasting: escalar, 1 x n ou m x 1).")
+    broadcasting = shape_a != shape_b or _is_scalar(matrix_a) or _is_scalar(matrix_b)
+    if broadcasting and (isinstance(matrix_a, SparseMatrix) or isinstance(matrix_b, SparseMatrix)):
+        raise ValueError("Broadcasting não é suportado com matrizes esparsas: as dimensões devem ser iguais.")
+    return max(shape_a[0], shape_b[0]), max(shape_a[1], shape_b[1])
+
+
+def validate_output_matrix(out, shape, *operands):
+    """
+    Valida a matriz de destino dos parâmetros out= e das operações in-place:
+    os operandos (já validados) devem ser densos, e 'out' deve ser uma matriz densa
+    válida (lista de listas ou Matrix) com as dimensões 'shape' (linhas, colunas) do resultado.
+    """
+    if any(isinstance(operand, SparseMatrix) for operand in operands):
+        raise ValueError("O parâmetro out (e as operações in-place) requer matrizes densas (converta com to_list()).")
+    validate_matrix_input(out, "Matriz de saída (out)")
+    rows, cols = shape
+    if _shape(out) != (rows, cols):
+        raise ValueError(f"Matriz de saída (out) deve ter as mesmas dimensões do resultado ({rows}x{cols}).")
+    return True
+
+
+def _is_scalar(operand):
+    """(Função auxiliar interna) True para um número usado como operando (escalar)."""
+    return isinstance(operand, Number)
+
+
+def _shape(matrix):
+    """
+    (Função auxiliar interna) Dimensões (linhas, colunas) de uma matriz já validada.
+    Uma matriz esparsa informa as suas sem montar nenhuma linha densa.
+    """
+    if isinstance(matrix, SparseMatrix):
+        return matrix.shape
+    return len(matrix), len(matrix[0])
+
 def validate_square_matrix(matrix, matrix_name="Matriz"):
     """
     Valida se uma matriz é quadrada (número de linhas igual ao número de colunas).
@@ -135,24 +231,20 @@ def validate_square_matrix(matrix, matrix_name="Matriz"):
 def validate_linear_system_inputs(matrix_a, vector_b):
     """
     Valida as entradas para resolver um sistema linear AX = B.
-    Verifica se A é quadrada, B é um vetor coluna, e suas dimensões são compatíveis.
+    Verifica se A é quadrada, B é uma matriz válida (vetor coluna Nx1 ou, para
+    vários lados direitos, uma matriz N x k) e se suas dimensões são compatíveis.
     """
     # 1. Validação da Matriz de Coeficientes (A):
     #    'matrix_a' deve ser uma matriz quadrada válida.
     validate_square_matrix(matrix_a, "Matriz A (coeficientes)")
     
     # 2. Validação do Vetor de Termos Independentes (B):
-    #    'vector_b' deve ser uma matriz válida (que representará um vetor coluna).
+    #    'vector_b' deve ser uma matriz válida. Cada uma de suas k colunas é um
+    #    lado direito independente; com k = 1 temos o vetor coluna usual.
     validate_matrix_input(vector_b, "Vetor B (termos independentes)")
 
     # 3. Verificação de Compatibilidade de Linhas:
-    #    O número de equações (linhas de A) deve ser igual ao número de elementos
-    #    no vetor B (linhas de B, já que B é um vetor coluna).
+    #    O número de equações (linhas de A) deve ser igual ao número de linhas de B.
     if len(matrix_a) != len(vector_b):
         raise ValueError("Número de linhas da Matriz A (coeficientes) deve ser igual ao número de linhas do Vetor B.")
-    
-    # 4. Verificação de Vetor Coluna para B:
-    #    'vector_b' deve ter exatamente uma coluna para ser um vetor coluna.
-    if len(vector_b[0]) != 1:
-        raise ValueError("Vetor B (termos independentes) deve ser um vetor coluna (ter uma única coluna).")
-    return True
\ No newline at end of file
+    return True
@@ -7,14 +7,15 @@
 # - print_test_header/footer: Para formatar o output do conjunto de testes.
 from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
 # Importa a função específica que este arquivo de teste se destina a verificar.
-from logic.add_matrices import add_matrices 
+from logic.add_matrices import add_matrices, iadd
 
 # Contadores globais para rastrear o número total de casos de teste executados
 # e o número de casos que passaram.
 test_count = 0
 passed_count = 0
 
-def run_add_test_case(m_a, m_b, expected_result, description, expect_error=False, error_message_contains=None):
+def run_add_test_case(m_a, m_b, expected_result, description, expect_error=False, error_message_contains=None,
+                      out=None, in_place=False):
     """
     Executa um único caso de teste para a função add_matrices.
 
@@ -34,6 +35,8 @@ def run_add_test_case(m_a, m_b, expected_result, description, expect_error=False
         error_message_contains (str or None): Se expect_error é True, esta string (ou parte dela,
                                               ignorando maiúsculas/minúsculas) deve estar contida na
                                               mensagem da exceção ValueError para o teste passar.
+        out (list[list[float]] or None): Matriz de destino repassada como 'out=' (o resultado deve ser ela própria).
+        in_place (bool): True para chamar 'iadd' (o resultado deve ser a própria 'm_a').
     """
     global test_count, passed_count # Permite modificar os contadores globais
     test_count += 1 # Incrementa o contador total de testes
@@ -49,7 +52,8 @@ def run_add_test_case(m_a, m_b, expected_result, description, expect_error=False
     try:
         # 1. Execução da Função Testada:
         #    Chama a função add_matrices com as matrizes fornecidas.
-        result = add_matrices(m_a, m_b)
+        result = iadd(m_a, m_b) if in_place else add_matrices(m_a, m_b, out=out)
+        target = m_a if in_place else out
         
         # 2. Verificação Pós-Execução:
         if expect_error:
@@ -59,7 +63,7 @@ def run_add_test_case(m_a, m_b, expected_result, description, expect_error=False
             log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
             if error_message_contains:
                  log_details.append(f"  Detalhe do Erro Esperado: A mensagem deveria conter '{error_message_contains}'")
-        elif are_matrices_equal(result, expected_result):
+        elif are_matrices_equal(result, expected_result) and (target is None or result is target):
             # Se nenhum erro era esperado e o resultado obtido é igual ao esperado (com tolerância), o teste passa.
             print(f"[OK] - {description}")
             passed_count += 1 # Incrementa o contador de testes que passaram
@@ -187,12 +191,38 @@ def test_soma_matrizes():
     exp_10x10 = generate_matrix(10, 10, lambda r, c: r + c + 1)
     run_add_test_case(m_a_10x10, m_b_10x10, exp_10x10, "Soma de matrizes 10x10 (geradas com padrão r+c)")
 
+    # --- Seção: Broadcasting (escalar, vetor linha 1 x n e vetor coluna m x 1) ---
+    run_add_test_case([[1, 2], [3, 4]], [[10, 20]], [[11, 22], [13, 24]], "Broadcasting: matriz 2x2 + vetor linha 1x2")
+    run_add_test_case([[1, 2], [3, 4]], [[10], [20]], [[11, 12], [23, 24]], "Broadcasting: matriz 2x2 + vetor coluna 2x1")
+    run_add_test_case([[1, 2]], [[1], [2]], [[2, 3], [3, 4]], "Broadcasting: vetor linha 1x2 + vetor coluna 2x1 (resultado 2x2)")
+    run_add_test_case(5, [[1, 2], [3, 4]], [[6, 7], [8, 9]], "Broadcasting: escalar + matriz")
+    run_add_test_case([[1, 2], [3, 4]], [[0.5]], [[1.5, 2.5], [3.5, 4.5]], "Broadcasting: matriz + matriz 1x1")
+    run_add_test_case([[1, 2], [3, 4]], [[1, 1]], [[2, 3], [4, 5]], "Broadcasting com iadd (vetor linha somado em A)",
+                      in_place=True)
+    run_add_test_case([[1, 2]], [[1, 1], [2, 2]], None, "Broadcasting: iadd não pode expandir a própria A",
+                      in_place=True, expect_error=True, error_message_contains="Matriz de saída (out)")
+    run_add_test_case(1, 2, None, "Soma de dois escalares (nenhuma matriz)",
+                      expect_error=True, error_message_contains="Ao menos um dos operandos")
+
+    # --- Seção: Variantes out= e In-place (o resultado é escrito em uma matriz existente) ---
+    run_add_test_case([[1, 2], [3, 4]], [[5, 6], [7, 8]], [[6, 8], [10, 12]], "Soma escrita em 'out'",
+                      out=[[0, 0], [0, 0]])
+    m_b_alias = [[1, 1], [1, 1]]
+    run_add_test_case([[1, 2], [3, 4]], m_b_alias, [[2, 3], [4, 5]], "Soma escrita no próprio operando B (out=B)",
+                      out=m_b_alias)
+    run_add_test_case([[1, 2], [3, 4]], [[0.5, 0], [0, 0.5]], [[1.5, 2], [3, 4.5]], "iadd altera a própria Matriz A",
+                      in_place=True)
+    run_add_test_case([[1, 2], [3, 4]], [[1, 1], [1, 1]], None, "Soma com 'out' de dimensões diferentes",
+                      out=[[0, 0, 0], [0, 0, 0]], expect_error=True,
+                      error_message_contains="Matriz de saída (out) deve ter as mesmas dimensões")
+
     # --- Seção: Casos de Teste de Erro (onde a função deve levantar um ValueError) ---
 
     # Teste 10: Tentativa de somar matrizes com número de linhas incompatível
+    #   (2 e 3 linhas: nenhuma delas é 1, então não há broadcasting)
     run_add_test_case(
-        m_a=[[1,2]],             # Matriz 1x2
-        m_b=[[1],[2]],           # Matriz 2x1
+        m_a=[[1,2],[3,4]],       # Matriz 2x2
+        m_b=[[1,2],[3,4],[5,6]], # Matriz 3x2
         expected_result=None,    # Nenhum resultado esperado, pois um erro é esperado
         description="Soma com dimensões incompatíveis (erro: linhas diferentes)", 
         expect_error=True,       # Indica que um erro é esperado
@@ -202,7 +232,7 @@ def test_soma_matrizes():
     # Teste 11: Tentativa de somar matrizes com número de colunas incompatível
     run_add_test_case(
         m_a=[[1,2],[3,4]],       # Matriz 2x2
-        m_b=[[1,2]],             # Matriz 1x2
+        m_b=[[1,2,3]],           # Matriz 1x3 (vetor linha com colunas diferentes)
         expected_result=None,
         description="Soma com dimensões incompatíveis (erro: colunas diferentes)", 
         expect_error=True,
@@ -0,0 +1,191 @@
+# calculadora_matrizes/tests/test_backend.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores que o limiar do backend.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa a camada de backend e as operações que despacham para ela.
+from logic import backend
+from logic.add_matrices import add_matrices
+from logic.multiply_matrices import multiply_matrices
+from logic.determinant import determinant
+from logic.inverse_matrix import inverse_matrix
+from logic.solve_linear_system import solve_linear_system_lu
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_backend_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste envolvendo a seleção de backend.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se um erro é esperado (expect_error=True):
+        a. Verificar se um ValueError foi levantado.
+        b. Se sim, verificar se a mensagem de erro contém 'error_message_contains'.
+    3. Se nenhum erro é esperado:
+        a. Comparar o resultado obtido com 'expected_result' usando 'are_matrices_equal'.
+    4. Restaurar o backend "auto" e imprimir o status ([OK] ou [FALHA]).
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado (escalar, booleano ou matriz). None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    finally:
+        # O backend é global: cada caso termina restaurando o modo padrão.
+        backend.set_backend("auto")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def with_backend(name, operation):
+    """Executa 'operation()' com o backend 'name' ativo (restaurado pelo executor do teste)."""
+    backend.set_backend(name)
+    return operation()
+
+
+def singular_or_result(operation):
+    """Executa 'operation()' e devolve o resultado, ou "singular" se a matriz for recusada."""
+    try:
+        return operation()
+    except ValueError as ve:
+        if "determinante é zero" in str(ve):
+            return "singular"
+        raise
+
+
+def same_on_both_backends(operation):
+    """True se 'operation()' tiver o mesmo desfecho (resultado ou "singular") nos backends 'numpy' e 'python'."""
+    numpy_result = with_backend("numpy", lambda: singular_or_result(operation))
+    python_result = with_backend("python", lambda: singular_or_result(operation))
+    if isinstance(numpy_result, str) or isinstance(python_result, str):
+        return numpy_result == python_result
+    return are_matrices_equal(numpy_result, python_result)
+
+
+def test_backend():
+    """
+    Define e executa uma suíte de casos de teste para a camada de backend.
+    Sem NumPy, verifica que o caminho em Python puro é sempre usado; com NumPy,
+    verifica que os dois backends produzem os mesmos resultados e mensagens de erro.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("backend.py")
+
+    # Matrizes de floats acima do limiar do modo "auto" (40x40 = 1600 elementos).
+    m_float = generate_matrix(40, 40, lambda r, c: 50.0 if r == c else float((r * 7 + c * 3) % 11 - 5) / 2)
+    m_ints = generate_matrix(40, 40, lambda r, c: 50 if r == c else (r + c) % 3)
+    v_float = generate_matrix(40, 2, lambda r, c: float(r - c))
+    m_singular = generate_matrix(40, 40, lambda r, c: float(r + c))
+
+    # --- Seção: Seleção do Backend ---
+    run_backend_test_case(lambda: backend.get_backend(), "auto", "Backend padrão é 'auto'")
+    run_backend_test_case(lambda: backend.set_backend("fortran"), None, "Backend desconhecido",
+                          expect_error=True, error_message_contains="Backend desconhecido")
+    run_backend_test_case(lambda: with_backend("python", lambda: backend.should_use_numpy(m_float)), False,
+                          "Backend 'python' nunca despacha para o NumPy")
+    run_backend_test_case(lambda: backend.should_use_numpy(m_ints), False,
+                          "Modo 'auto' mantém matrizes só de inteiros em Python puro (resultados exatos)")
+    run_backend_test_case(lambda: backend.should_use_numpy([[1.5, 2.0], [3.0, 4.0]]), False,
+                          "Modo 'auto' mantém matrizes pequenas em Python puro")
+    run_backend_test_case(lambda: backend.should_use_numpy(m_float), backend.numpy_available(),
+                          "Modo 'auto' despacha matrizes grandes de floats apenas se o NumPy estiver disponível")
+
+    if not backend.numpy_available():
+        run_backend_test_case(lambda: backend.set_backend("numpy"), None,
+                              "Backend 'numpy' sem NumPy instalado",
+                              expect_error=True, error_message_contains="NumPy não está instalado")
+
+    # --- Seção: Mesmos Resultados nos Dois Caminhos ---
+    # Os resultados do modo "auto" (NumPy, se disponível) devem coincidir com o Python puro.
+    python_result = with_backend("python", lambda: add_matrices(m_float, m_float))
+    run_backend_test_case(lambda: add_matrices(m_float, m_float), python_result, "Soma 40x40: auto == python")
+    python_result = with_backend("python", lambda: multiply_matrices(m_float, m_float))
+    run_backend_test_case(lambda: multiply_matrices(m_float, m_float), python_result,
+                          "Multiplicação 40x40: auto == python")
+    python_result = with_backend("python", lambda: inverse_matrix(m_float))
+    run_backend_test_case(lambda: inverse_matrix(m_float), python_result, "Inversa 40x40: auto == python")
+    python_result = with_backend("python", lambda: solve_linear_system_lu(m_float, v_float))
+    run_backend_test_case(lambda: solve_linear_system_lu(m_float, v_float), python_result,
+                          "Sistema 40x40 com B 40x2: auto == python")
+    python_result = with_backend("python", lambda: determinant(m_float))
+    run_backend_test_case(lambda: determinant(m_float) / python_result, 1.0, "Determinante 40x40: auto == python")
+
+    # --- Seção: Mesmas Mensagens de Erro ---
+    run_backend_test_case(lambda: inverse_matrix(m_singular), None, "Inversa 40x40 singular (modo auto)",
+                          expect_error=True, error_message_contains="determinante é zero")
+    run_backend_test_case(lambda: solve_linear_system_lu(m_singular, v_float), None,
+                          "Sistema 40x40 singular (modo auto)",
+                          expect_error=True, error_message_contains="Não é possível resolver o sistema")
+
+    # --- Seção: Mesmo Critério de Singularidade nos Dois Backends ---
+    # Matrizes pequenas (abaixo do limiar) com o backend forçado: a quase singular é
+    # recusada pelos dois, e a de coluna pequena [0, 0, 1e-13] é aceita pelos dois.
+    if backend.numpy_available():
+        m_near_singular = [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0 + 1e-14]]
+        m_small_column = [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0], [0.0, 0.0, 1e-13]]
+        v_3x1 = [[1.0], [2.0], [3.0]]
+        for name, matrix in (("quase singular", m_near_singular), ("com coluna pequena", m_small_column),
+                             ("40x40 singular", m_singular)):
+            rhs = v_3x1 if len(matrix) == 3 else v_float
+            run_backend_test_case(lambda matrix=matrix: same_on_both_backends(lambda: inverse_matrix(matrix)), True,
+                                  f"Inversa de matriz {name}: numpy e python concordam")
+            run_backend_test_case(lambda matrix=matrix, rhs=rhs: same_on_both_backends(lambda: solve_linear_system_lu(matrix, rhs)),
+                                  True, f"Sistema com matriz {name}: numpy e python concordam")
+            run_backend_test_case(lambda matrix=matrix: same_on_both_backends(lambda: [[determinant(matrix) * 1e13]]), True,
+                                  f"Determinante de matriz {name}: numpy e python concordam")
+
+    print_test_footer("backend.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_backend()
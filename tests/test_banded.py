@@ -0,0 +1,163 @@
+# calculadora_matrizes/tests/test_banded.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa os resolvedores em banda e as operações que os escolhem no modo "auto".
+from logic.matrix import Matrix
+from logic.banded import solve_tridiagonal, solve_banded, detect_bandwidth, to_band_storage
+from logic.solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu
+from logic.multiply_matrices import multiply_matrices
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_banded_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de um resolvedor em banda.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_banded():
+    """
+    Define e executa uma suíte de casos de teste para a detecção de banda, o
+    formato compacto, o algoritmo de Thomas e a LU em banda.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("banded.py")
+
+    tridiagonal_4 = [[2.0, -1.0, 0.0, 0.0], [-1.0, 2.0, -1.0, 0.0], [0.0, -1.0, 2.0, -1.0], [0.0, 0.0, -1.0, 2.0]]
+    v_b = [[1.0], [0.0], [0.0], [1.0]]
+    #    Banda p = 2, q = 1 com pivô nulo na diagonal (exige pivoteamento).
+    banded_5 = [[0.0, 3.0, 0.0, 0.0, 0.0],
+                [1.0, 2.0, 1.0, 0.0, 0.0],
+                [4.0, 1.0, 5.0, 2.0, 0.0],
+                [0.0, 2.0, 1.0, 3.0, 1.0],
+                [0.0, 0.0, 1.0, 2.0, 6.0]]
+    v_b_5 = [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0], [4.0, 1.0], [5.0, 0.0]]
+
+    # --- Seção: Detecção de Banda e Formato Compacto ---
+    run_banded_test_case(lambda: detect_bandwidth(tridiagonal_4), (1, 1), "Banda de uma tridiagonal")
+    run_banded_test_case(lambda: detect_bandwidth(Matrix.from_list(banded_5)), (2, 1), "Banda (2, 1) de um Matrix")
+    run_banded_test_case(lambda: detect_bandwidth([[1, 0, 7], [0, 1, 0], [0, 0, 1]]), (0, 2), "Banda de uma triangular superior")
+    run_banded_test_case(lambda: to_band_storage([[2, 1, 0], [1, 2, 1], [0, 1, 2]], 1, 1), [[0, 2, 1], [1, 2, 1], [1, 2, 0]],
+                         "Formato compacto de uma tridiagonal 3x3")
+    run_banded_test_case(lambda: to_band_storage(tridiagonal_4, -1, 1), None, "Largura de banda negativa",
+                         expect_error=True, error_message_contains="inteiros não negativos")
+
+    # --- Seção: Algoritmo de Thomas ---
+    run_banded_test_case(lambda: solve_tridiagonal([-1.0] * 3, [2.0] * 4, [-1.0] * 3, v_b), [[1.0], [1.0], [1.0], [1.0]],
+                         "Thomas: tridiagonal 4x4 (-1, 2, -1)")
+    run_banded_test_case(lambda: solve_tridiagonal([], [4.0], [], Matrix.from_list([[2.0, 8.0]])), [[0.5, 2.0]],
+                         "Thomas: sistema 1x1 com B de 2 colunas (Matrix)")
+    run_banded_test_case(lambda: solve_tridiagonal([1.0], [0.0, 1.0], [1.0], [[1.0], [1.0]]), None, "Thomas: pivô nulo",
+                         expect_error=True, error_message_contains="Pivô nulo")
+    run_banded_test_case(lambda: solve_tridiagonal([1.0, 1.0], [2.0, 2.0], [1.0], [[1.0], [1.0]]), None,
+                         "Thomas: diagonais de tamanhos incompatíveis", expect_error=True, error_message_contains="n - 1, n e n - 1")
+
+    # --- Seção: LU em Banda ---
+    run_banded_test_case(lambda: solve_banded(tridiagonal_4, v_b), [[1.0], [1.0], [1.0], [1.0]], "LU em banda com A densa (banda detectada)")
+    run_banded_test_case(lambda: multiply_matrices(banded_5, solve_banded(banded_5, v_b_5)), v_b_5,
+                         "LU em banda com pivoteamento (pivô nulo na diagonal, B com 2 colunas)")
+    run_banded_test_case(lambda: multiply_matrices(banded_5, solve_banded(to_band_storage(banded_5, 2, 1), v_b_5, bandwidth=(2, 1))),
+                         v_b_5, "LU em banda no formato compacto")
+    run_banded_test_case(lambda: solve_banded([[0, 1, 1], [1, 1, 1], [1, 1, 0]], [[1], [1], [1]], bandwidth=(2, 1)), None,
+                         "Formato compacto com largura incompatível", expect_error=True, error_message_contains="p + q + 1")
+    run_banded_test_case(lambda: solve_banded([[1.0, 1.0, 0.0], [1.0, 1.0, 0.0], [0.0, 0.0, 1.0]], [[1.0], [1.0], [1.0]]), None,
+                         "LU em banda com A singular", expect_error=True, error_message_contains="Não é possível resolver o sistema")
+    # Linha nula em uma matriz em banda: a linha sem fator de eliminação também precisa
+    # ser estendida, senão os passos seguintes leem além do seu fim (IndexError).
+    singular_band_5 = [[2.0, 1, 0, 0, 0], [0, 0, 0, 0, 0], [0, 1, 2, 0, 0], [0, 0, 1, 2, 0], [0, 0, 0, 1, 2]]
+    for solver, name in ((solve_banded, "solve_banded"), (solve_linear_system_lu, "solve_linear_system_lu"),
+                         (solve_linear_system_inverse, "solve_linear_system_inverse")):
+        run_banded_test_case(lambda solver=solver: solver(singular_band_5, [[1]] * 5), None,
+                             f"{name} com A em banda singular (linha nula)",
+                             expect_error=True, error_message_contains="determinante é zero")
+
+    # --- Seção: Seleção Automática ---
+    pentadiagonal_60 = generate_matrix(60, 60, lambda r, c: {0: 6.0, 1: -2.0, 2: 0.5}.get(abs(r - c), 0.0) + (0.25 if c - r == 1 else 0.0))
+    v_b_60 = generate_matrix(60, 1, lambda r, c: float(r % 3))
+    run_banded_test_case(lambda: multiply_matrices(pentadiagonal_60, solve_linear_system_lu(pentadiagonal_60, v_b_60)), v_b_60,
+                         "solve_linear_system_lu com A pentadiagonal 60x60 (LU em banda)")
+    run_banded_test_case(lambda: multiply_matrices(pentadiagonal_60, solve_linear_system_inverse(Matrix.from_list(pentadiagonal_60), v_b_60)),
+                         v_b_60, "solve_linear_system_inverse com A pentadiagonal (Matrix)")
+
+    # --- Seção: Sistemas Grandes (apenas no formato compacto) ---
+    #    Diferenças finitas 1D com 100 000 incógnitas: -u'' = 1 com u(0) = u(1) = 0.
+    n = 100000
+    h = 1.0 / (n + 1)
+    expected_middle = 0.5 * (n // 2 + 1) * h * (1 - (n // 2 + 1) * h)
+    rhs = [[h * h]] * n
+    run_banded_test_case(lambda: solve_tridiagonal([-1.0] * (n - 1), [2.0] * n, [-1.0] * (n - 1), rhs)[n // 2][0], expected_middle,
+                         "Thomas com 100 000 incógnitas (u(x) = x(1 - x)/2 no ponto médio)")
+    band = [[0.0 if i == 0 else -1.0, 2.0, 0.0 if i == n - 1 else -1.0] for i in range(n)]
+    run_banded_test_case(lambda: solve_banded(band, rhs, bandwidth=(1, 1))[n // 2][0], expected_middle,
+                         "LU em banda com 100 000 incógnitas no formato compacto")
+
+    print_test_footer("banded.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_banded()
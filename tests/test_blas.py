@@ -0,0 +1,141 @@
+# calculadora_matrizes/tests/test_blas.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer
+# Importa as primitivas axpy/gemm e as operações separadas, usadas como referência.
+from logic.matrix import Matrix
+from logic.sparse import CSRMatrix
+from logic.blas import axpy, gemm
+from logic.add_matrices import add_matrices
+from logic.scalar_multiply import scalar_multiply
+from logic.multiply_matrices import multiply_matrices
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_blas_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de axpy/gemm.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_blas():
+    """
+    Define e executa uma suíte de casos de teste para axpy (Y <- alpha*X + Y) e
+    gemm (C <- alpha*A*B + beta*C): resultados, atualização no próprio destino e erros.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("blas.py")
+
+    a = [[1, 2, 3], [4, 5, 6]]
+    b = [[1, 0], [0, 1], [2, -1]]
+    c = [[1, 1], [1, 1]]
+
+    def reference(alpha, matrix_a, matrix_b, beta, matrix_c):
+        return add_matrices(scalar_multiply(multiply_matrices(matrix_a, matrix_b), alpha), scalar_multiply(matrix_c, beta))
+
+    # --- Seção: axpy ---
+    run_blas_test_case(lambda: axpy(2, [[1, 2], [3, 4]], [[1, 1], [1, 1]]), [[3, 5], [7, 9]], "axpy com alpha inteiro")
+    run_blas_test_case(lambda: axpy(-0.5, [[2, 4]], [[1, 1]]), [[0.0, -1.0]], "axpy com alpha negativo (vetor linha)")
+    y = [[1], [2], [3]]
+    y_row = y[0]
+    run_blas_test_case(lambda: (axpy(3, [[1], [1], [1]], y) is y, y[0] is y_row, y), (True, True, [[4], [5], [6]]),
+                       "axpy atualiza Y no próprio objeto (vetor coluna)")
+    m_y = Matrix.from_list([[1, 2], [3, 4]])
+    run_blas_test_case(lambda: axpy(0.5, [[2, 2], [2, 2]], m_y), [[2.0, 3.0], [4.0, 5.0]], "axpy com Y do tipo Matrix")
+    run_blas_test_case(lambda: axpy(1, [[1, 2]], [[1, 2], [3, 4]]), None, "axpy com dimensões diferentes",
+                       expect_error=True, error_message_contains="mesmas dimensões")
+    run_blas_test_case(lambda: axpy(1, CSRMatrix.from_dense(c), [[1, 1], [1, 1]]), None, "axpy recusa matriz esparsa",
+                       expect_error=True, error_message_contains="requer matrizes densas")
+
+    # --- Seção: gemm ---
+    run_blas_test_case(lambda: gemm(2, a, b, 3, [row[:] for row in c]), reference(2, a, b, 3, c), "gemm com alpha e beta quaisquer")
+    run_blas_test_case(lambda: gemm(1, a, b, 1, [row[:] for row in c]), add_matrices(multiply_matrices(a, b), c), "gemm com alpha = beta = 1")
+    run_blas_test_case(lambda: gemm(1, a, b, 0, [[float("nan")] * 2 for _ in range(2)]), multiply_matrices(a, b),
+                       "gemm com beta = 0 ignora o conteúdo anterior de C")
+    c_target = [row[:] for row in c]
+    c_row = c_target[1]
+    run_blas_test_case(lambda: (gemm(2, a, b, -1, c_target) is c_target, c_target[1] is c_row), (True, True),
+                       "gemm atualiza C no próprio objeto")
+    square = [[1, 2], [3, 4]]
+    run_blas_test_case(lambda: gemm(1, square, [[1, 2], [3, 4]], 1, square), [[8, 12], [18, 26]], "gemm com C sendo a própria A")
+    run_blas_test_case(lambda: gemm(0.5, Matrix.from_list(a), b, 2, Matrix.from_list(c)), reference(0.5, a, b, 2, c), "gemm com Matrix")
+    run_blas_test_case(lambda: gemm(2, CSRMatrix.from_dense(a), b, 3, [row[:] for row in c]), reference(2, a, b, 3, c),
+                       "gemm com A esparsa")
+    n = 150
+    big_a = [[float((i * j) % 7 - 3) for j in range(n)] for i in range(n)]
+    big_c = [[float(i - j) for j in range(n)] for i in range(n)]
+    run_blas_test_case(lambda: gemm(2, big_a, big_a, -1, [row[:] for row in big_c]), reference(2, big_a, big_a, -1, big_c),
+                       "gemm 150x150 (vários blocos de colunas)")
+    run_blas_test_case(lambda: gemm(1, a, b, 1, [[1, 1, 1], [1, 1, 1]]), None, "gemm com C de dimensões erradas",
+                       expect_error=True, error_message_contains="Matriz C deve ter dimensões")
+    run_blas_test_case(lambda: gemm(1, a, a, 1, c), None, "gemm com A e B incompatíveis",
+                       expect_error=True, error_message_contains="Número de colunas")
+
+    print_test_footer("blas.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_blas()
@@ -0,0 +1,155 @@
+# calculadora_matrizes/tests/test_cholesky.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa a fatoração de Cholesky e as operações que a escolhem no modo "auto".
+from logic.matrix import Matrix
+from logic.cholesky import cholesky_decompose
+from logic.determinant import determinant
+from logic.inverse_matrix import inverse_matrix
+from logic.solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu, solve_linear_system_cholesky
+from logic.multiply_matrices import multiply_matrices
+from logic.transpose_matrix import transpose_matrix
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_cholesky_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste da fatoração de Cholesky ou de uma operação que a utiliza.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_cholesky():
+    """
+    Define e executa uma suíte de casos de teste para a fatoração de Cholesky
+    e para a sua seleção automática em determinante, inversa e sistemas.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("cholesky.py")
+
+    spd_3 = [[4.0, 2.0, 0.4], [2.0, 5.0, 1.0], [0.4, 1.0, 3.0]]
+    indefinite_3 = [[1.0, 2.0, 0.0], [2.0, 1.0, 0.5], [0.0, 0.5, 2.0]]
+    general_3 = [[2.0, 1.0, 0.0], [0.5, 3.0, 1.0], [0.0, 1.0, 4.0]]
+    v_b = [[1.0], [2.0], [3.0]]
+
+    # --- Seção: Fatoração A = L*Lᵀ ---
+    run_cholesky_test_case(lambda: cholesky_decompose([[4.0, 2.0], [2.0, 3.0]]), [[2.0, 0.0], [1.0, 2.0 ** 0.5]],
+                           "Fator L de uma matriz 2x2")
+    lower = cholesky_decompose(spd_3)
+    run_cholesky_test_case(lambda: multiply_matrices(lower, transpose_matrix(lower)), spd_3, "L*Lᵀ reconstrói A (3x3)")
+    run_cholesky_test_case(lambda: cholesky_decompose(indefinite_3), None, "Matriz simétrica indefinida: fatoração falha (None)")
+    run_cholesky_test_case(lambda: cholesky_decompose([[1.0, 1.0], [1.0, 1.0]]), None, "Matriz semidefinida (singular): fatoração falha (None)")
+    run_cholesky_test_case(lambda: cholesky_decompose([[1.0, 0.0], [0.0, 1e-13]]) is not None, True,
+                           "Pivô pequeno na escala da sua coluna: diag(1, 1e-13) é fatorada")
+
+    # --- Seção: Determinante ---
+    run_cholesky_test_case(lambda: determinant(spd_3), determinant(spd_3, method="lu"), "Determinante 'auto' de SPD concorda com LU")
+    run_cholesky_test_case(lambda: determinant(spd_3, method="cholesky"), 44.8, "Determinante com method='cholesky'")
+    run_cholesky_test_case(lambda: determinant(indefinite_3), -6.25, "Determinante de simétrica indefinida recorre à LU")
+    run_cholesky_test_case(lambda: determinant(indefinite_3, method="cholesky"), None, "method='cholesky' com matriz indefinida",
+                           expect_error=True, error_message_contains="simétrica definida positiva")
+    run_cholesky_test_case(lambda: determinant(general_3, method="cholesky"), None, "method='cholesky' com matriz não simétrica",
+                           expect_error=True, error_message_contains="simétrica definida positiva")
+
+    # --- Seção: Inversa ---
+    run_cholesky_test_case(lambda: inverse_matrix(spd_3), inverse_matrix(spd_3, method="gauss_jordan"),
+                           "Inversa 'auto' de SPD concorda com Gauss-Jordan")
+    run_cholesky_test_case(lambda: inverse_matrix(Matrix.from_list(spd_3), method="cholesky"), inverse_matrix(spd_3, method="gauss_jordan"),
+                           "Inversa com method='cholesky' (Matrix)")
+    run_cholesky_test_case(lambda: inverse_matrix(indefinite_3), inverse_matrix(indefinite_3, method="gauss_jordan"),
+                           "Inversa de simétrica indefinida recorre a Gauss-Jordan")
+
+    # --- Seção: Sistemas ---
+    run_cholesky_test_case(lambda: multiply_matrices(spd_3, solve_linear_system_lu(spd_3, v_b)), v_b,
+                           "solve_linear_system_lu com A SPD (A*X = B)")
+    run_cholesky_test_case(lambda: multiply_matrices(spd_3, solve_linear_system_inverse(spd_3, [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]])),
+                           [[1.0, 0.0], [2.0, 1.0], [3.0, 0.0]], "solve_linear_system_inverse com A SPD e B de 2 colunas")
+    run_cholesky_test_case(lambda: multiply_matrices(indefinite_3, solve_linear_system_lu(indefinite_3, v_b)), v_b,
+                           "Sistema com A simétrica indefinida recorre à LU")
+    run_cholesky_test_case(lambda: multiply_matrices(spd_3, solve_linear_system_cholesky(Matrix.from_list(spd_3), v_b)), v_b,
+                           "solve_linear_system_cholesky (A Matrix)")
+    run_cholesky_test_case(lambda: solve_linear_system_cholesky(indefinite_3, v_b), None, "solve_linear_system_cholesky com A indefinida",
+                           expect_error=True, error_message_contains="Não é possível resolver o sistema")
+    run_cholesky_test_case(lambda: solve_linear_system_cholesky(spd_3, [[1.0], [2.0]]), None, "solve_linear_system_cholesky com dimensões incompatíveis",
+                           expect_error=True)
+
+    # --- Seção: Matriz Maior ---
+    #    Covariância densa 200x200: 200*I + c_ij com c_ij = 1 / (1 + |i - j|), simétrica definida positiva.
+    spd_200 = generate_matrix(200, 200, lambda r, c: (200.0 if r == c else 0.0) + 1.0 / (1 + abs(r - c)))
+    v_b_200 = generate_matrix(200, 1, lambda r, c: float(r % 5))
+    run_cholesky_test_case(lambda: multiply_matrices(spd_200, solve_linear_system_lu(spd_200, v_b_200)), v_b_200,
+                           "Sistema 200x200 SPD por Cholesky (A*X = B)")
+    #    Para o determinante, I + c_ij (det representável como float, sem transbordar).
+    spd_det_200 = generate_matrix(200, 200, lambda r, c: (1.0 if r == c else 0.0) + 1.0 / (1 + abs(r - c)))
+    run_cholesky_test_case(lambda: determinant(spd_det_200) / determinant(spd_det_200, method="lu"), 1.0,
+                           "Determinante 200x200: Cholesky concorda com LU")
+
+    print_test_footer("cholesky.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_cholesky()
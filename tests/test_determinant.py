@@ -9,7 +9,7 @@
 # - TOLERANCE: Constante para comparação de floats.
 from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer, TOLERANCE
 # Importa a função de cálculo de determinante que será testada.
-from logic.determinant import determinant
+from logic.determinant import determinant, slogdet
 # Importa 'math' para usar 'math.isclose' na comparação direta de determinantes (floats).
 import math
 
@@ -17,7 +17,7 @@ import math
 test_count = 0
 passed_count = 0
 
-def run_determinant_test_case(matrix, expected_determinant, description, expect_error=False, error_message_contains=None):
+def run_determinant_test_case(matrix, expected_determinant, description, expect_error=False, error_message_contains=None, method="auto", exact=False, abs_tol=TOLERANCE):
     """
     Executa um único caso de teste para a função determinant.
 
@@ -28,7 +28,7 @@ def run_determinant_test_case(matrix, expected_determinant, description, expect_
         b. Se sim, verificar se a mensagem de erro contém 'error_message_contains'.
     3. Se nenhum erro é esperado:
         a. Verificar se o resultado do determinante é numericamente próximo ao 'expected_determinant'
-           usando math.isclose com a TOLERANCE definida.
+           usando math.isclose com a TOLERANCE definida (ou exatamente igual, se exact=True).
     4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
 
     Args:
@@ -38,6 +38,10 @@ def run_determinant_test_case(matrix, expected_determinant, description, expect_
         description (str): Descrição do caso de teste.
         expect_error (bool): True se uma exceção ValueError é esperada.
         error_message_contains (str or None): Substring esperada na mensagem de erro.
+        method (str): Algoritmo repassado para 'determinant' ("auto", "lu", "bareiss", "cofactor").
+        exact (bool): Se True, exige igualdade exata (resultado inteiro sem arredondamento).
+        abs_tol (float): Tolerância absoluta da comparação (0 para determinantes muito
+                         pequenos, que não podem ser confundidos com zero).
     """
     global test_count, passed_count
     test_count += 1
@@ -50,7 +54,7 @@ def run_determinant_test_case(matrix, expected_determinant, description, expect_
 
     try:
         # 1. Execução da Função: Calcula o determinante.
-        result = determinant(matrix)
+        result = determinant(matrix, method=method)
         
         # 2. Verificação Pós-Execução (se nenhum erro ocorreu durante a execução):
         if expect_error:
@@ -61,7 +65,8 @@ def run_determinant_test_case(matrix, expected_determinant, description, expect_
             if error_message_contains:
                  log_details.append(f"  Detalhe do Erro Esperado: A mensagem deveria conter '{error_message_contains}'")
         # Compara o resultado com o esperado usando math.isclose para lidar com a precisão de floats.
-        elif expected_determinant is not None and math.isclose(result, expected_determinant, rel_tol=TOLERANCE, abs_tol=TOLERANCE):
+        elif expected_determinant is not None and (result == expected_determinant if exact else
+                                                   math.isclose(result, expected_determinant, rel_tol=TOLERANCE, abs_tol=abs_tol)):
             # Se o resultado é próximo o suficiente do esperado, o teste PASSA.
             print(f"[OK] - {description}")
             passed_count += 1
@@ -117,6 +122,30 @@ def run_determinant_test_case(matrix, expected_determinant, description, expect_
     for detail in log_details:
         print(detail)
 
+def run_slogdet_test_case(matrix, expected_sign, expected_logabsdet, description):
+    """
+    Executa um único caso de teste para a função slogdet: o sinal deve ser igual
+    a 'expected_sign' e log|det| próximo de 'expected_logabsdet' (ou ambos -inf).
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    try:
+        sign, logabsdet = slogdet(matrix)
+        if sign == expected_sign and (logabsdet == expected_logabsdet or
+                                      math.isclose(logabsdet, expected_logabsdet, rel_tol=TOLERANCE, abs_tol=TOLERANCE)):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        print("  Log Detalhado da Operação:")
+        print(f"  Resultado Esperado: ({expected_sign}, {expected_logabsdet})")
+        print(f"  Resultado Obtido: ({sign}, {logabsdet})")
+    except Exception as e:
+        print(f"[FALHA] - {description}")
+        print("  Log Detalhado da Operação:")
+        print(f"  Detalhe do Erro: {type(e).__name__}: {e}")
+
 def test_determinantes():
     """
     Define e executa uma suíte de casos de teste para a função determinant.
@@ -160,7 +189,100 @@ def test_determinantes():
     ident_10x10 = generate_matrix(10, 10, lambda r,c: 1 if r==c else 0)
     run_determinant_test_case(ident_10x10, 1, "Determinante de matriz identidade 10x10 (det=1)")
     
+    # Matriz bem condicionada com uma coluna inteira de valores pequenos: o pivô 1e-13 é
+    # legítimo (relativo à sua coluna) e o determinante é o produto dos pivôs, não zero.
+    m_3x3_small_column = [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0], [0.0, 0.0, 1e-13]]
+    run_determinant_test_case(m_3x3_small_column, -2e-13, "Determinante 3x3 com pivô pequeno não nulo (det=-2e-13)",
+                              abs_tol=0)
+    run_determinant_test_case(m_3x3_small_column, -2e-13, "Determinante 3x3 com pivô pequeno não nulo (método LU)",
+                              method="lu", abs_tol=0)
+
+    # --- Seção: Eliminação com Pivoteamento (LU) vs. Cofatores ---
+    # Matriz que exige troca de linhas (pivô zero na posição [0][0]):
+    # a troca inverte o sinal do determinante.
+    m_3x3_pivot = [[0, 2, 1], [1, 1, 1], [2, 1, 0]]
+    # Det = 0(0-1) - 2(0-2) + 1(1-2) = 4 - 1 = 3
+    run_determinant_test_case(m_3x3_pivot, 3, "Determinante 3x3 com pivô inicial zero (troca de linhas)")
+    run_determinant_test_case(m_3x3_pivot, 3, "Determinante 3x3 com pivô inicial zero (método cofatores)", method="cofactor")
+
+    # Matriz 5x5 densa: LU e cofatores devem concordar.
+    m_5x5 = generate_matrix(5, 5, lambda r, c: (r * 7 + c * 3) % 11 - 5 + (4 if r == c else 0))
+    run_determinant_test_case(m_5x5, determinant(m_5x5, method="cofactor"),
+                              "Determinante 5x5: eliminação LU concorda com cofatores", method="lu")
+
+    # Matriz 12x12 triangular superior: inviável por cofatores, imediata por LU.
+    m_12x12_triangular = generate_matrix(12, 12, lambda r, c: (2 if r == c else 1) if c >= r else 0)
+    run_determinant_test_case(m_12x12_triangular, 2 ** 12, "Determinante 12x12 triangular (produto da diagonal = 4096)")
+
+    # Matriz 12x12 densa com diagonal dominante (11*I + matriz de uns).
+    m_12x12_dominant = generate_matrix(12, 12, lambda r, c: 12.0 if r == c else 1.0)
+    # Autovalores: 11 (multiplicidade 11) e 11 + 12 = 23 => det = 11^11 * 23
+    run_determinant_test_case(m_12x12_dominant, 11 ** 11 * 23, "Determinante 12x12 denso (diagonal dominante)")
+
+    # --- Seção: Eliminação de Bareiss (inteiros exatos) ---
+    run_determinant_test_case(m_3x3_pivot, 3, "Bareiss: 3x3 com pivô inicial zero (troca de linhas)",
+                              method="bareiss", exact=True)
+    run_determinant_test_case(m_5x5, determinant(m_5x5, method="cofactor"),
+                              "Bareiss: 5x5 inteira concorda exatamente com cofatores", exact=True)
+    run_determinant_test_case([[1, 2], [1, 2]], 0, "Bareiss: 2x2 singular (det=0)", method="bareiss", exact=True)
+
+    # A = L*U com L unitária triangular inferior e U triangular superior inteiras:
+    # det(A) = produto da diagonal de U, um inteiro de ~150 dígitos que os floats
+    # não representam exatamente. O modo "auto" escolhe Bareiss para entradas inteiras.
+    size = 25
+    l_25 = generate_matrix(size, size, lambda r, c: 1 if r == c else ((r * 3 + c) % 7 - 3 if c < r else 0))
+    u_25 = generate_matrix(size, size, lambda r, c: 10 ** 6 + r if r == c else ((r + c * 5) % 9 - 4 if c > r else 0))
+    m_25 = [[sum(l_25[r][k] * u_25[k][c] for k in range(size)) for c in range(size)] for r in range(size)]
+    exp_det_25 = 1
+    for r in range(size):
+        exp_det_25 *= 10 ** 6 + r
+    run_determinant_test_case(m_25, exp_det_25, "Bareiss: 25x25 inteira com determinante exato de ~150 dígitos", exact=True)
+
+    # --- Seção: Determinante Multimodular (primos + Teorema Chinês do Resto) ---
+    # Matriz pequena: a cota de Hadamard exige um único primo (cálculo em série).
+    run_determinant_test_case(m_5x5, determinant(m_5x5, method="cofactor"),
+                              "Modular: 5x5 inteira concorda com cofatores (um único primo)", method="modular", exact=True)
+    run_determinant_test_case([[0, 2], [3, 4]], -6, "Modular: determinante negativo (representante simétrico)",
+                              method="modular", exact=True)
+    run_determinant_test_case(m_3x3_singular, 0, "Modular: 3x3 singular (det=0)", method="modular", exact=True)
+    # Matriz 25x25: vários primos, calculados no pool de processos e combinados pelo CRT.
+    run_determinant_test_case(m_25, exp_det_25, "Modular: 25x25 inteira com determinante de ~150 dígitos (vários primos)",
+                              method="modular", exact=True)
+    run_determinant_test_case(
+        matrix=[[1.5, 2], [3, 4]],
+        expected_determinant=None,
+        description="Modular: matriz com elemento não inteiro",
+        expect_error=True,
+        error_message_contains="apenas números inteiros",
+        method="modular"
+    )
+
+    # --- Seção: Log-Determinante (slogdet) ---
+    run_slogdet_test_case([[1, 2], [3, 4]], -1, math.log(2), "slogdet 2x2 (det = -2)")
+    run_slogdet_test_case(m_3x3_pivot, 1, math.log(3), "slogdet 3x3 com troca de linhas (det = 3)")
+    run_slogdet_test_case(m_3x3_singular, 0, -math.inf, "slogdet de matriz singular: (0, -inf)")
+    # Pivô pequeno não nulo (det = -2e-13): log|det| = log(2e-13) ≈ -29.24, e não -inf.
+    run_slogdet_test_case(m_3x3_small_column, -1, math.log(2e-13), "slogdet 3x3 com pivô pequeno não nulo (det=-2e-13)")
+    # Matriz 200x200 densa do tipo covariância (99*I + matriz de uns): autovalores 99
+    # (multiplicidade 199) e 99 + 200 = 299, logo det ≈ 1e399 transborda como float,
+    # mas log|det| = 199*log(99) + log(299) ≈ 920 é calculado sem problemas.
+    m_200_cov = generate_matrix(200, 200, lambda r, c: 100.0 if r == c else 1.0)
+    run_slogdet_test_case(m_200_cov, 1, 199 * math.log(99) + math.log(299),
+                          "slogdet 200x200 densa (det ≈ 1e399 não cabe em float)")
+    m_200_small = generate_matrix(200, 200, lambda r, c: -0.01 if r == c else 0.0)
+    run_slogdet_test_case(m_200_small, 1, 200 * math.log(0.01), "slogdet 200x200 com det = 1e-400 (sinal de pivôs negativos)")
+
     # --- Seção: Casos de Teste de Erro ---
+    # Método desconhecido
+    run_determinant_test_case(
+        matrix=[[1, 2], [3, 4]],
+        expected_determinant=None,
+        description="Determinante com método desconhecido",
+        expect_error=True,
+        error_message_contains="Método de determinante desconhecido",
+        method="sarrus"
+    )
+
     # Matriz não quadrada
     run_determinant_test_case(
         matrix=[[1,2],[3,4],[5,6]], # Matriz 3x2
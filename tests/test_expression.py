@@ -0,0 +1,154 @@
+# calculadora_matrizes/tests/test_expression.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer
+# Importa a API de expressões e as operações usadas como referência.
+from logic.matrix import Matrix
+from logic.sparse import CSRMatrix
+from logic.expression import expr, Expression
+from logic.add_matrices import add_matrices
+from logic.subtract_matrices import subtract_matrices
+from logic.scalar_multiply import scalar_multiply
+from logic.multiply_matrices import multiply_matrices
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_expression_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de uma expressão preguiçosa.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_expression():
+    """
+    Define e executa uma suíte de casos de teste para expr/Expression: construção
+    preguiçosa, fusão de somas, subtrações e escalares, produtos e erros.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("expression.py")
+
+    a = [[1, 2], [3, 4]]
+    b = [[5, 6], [7, 8]]
+    c = [[-1, 0], [2, 1.5]]
+    reference = add_matrices(scalar_multiply(a, 2), subtract_matrices(b, c))
+
+    # --- Seção: Combinações Lineares ---
+    run_expression_test_case(lambda: (expr(a) * 2 + (expr(b) - c)).evaluate(), reference, "2*A + (B - C) em uma passada")
+    run_expression_test_case(lambda: expr(a).evaluate(), a, "Expressão de uma única matriz (cópia)")
+    run_expression_test_case(lambda: expr(a).evaluate() is a, False, "Avaliação não devolve a própria entrada")
+    run_expression_test_case(lambda: (-expr(a)).evaluate(), scalar_multiply(a, -1), "Negação")
+    run_expression_test_case(lambda: (b - expr(a) / 2).evaluate(), [[4.5, 5.0], [5.5, 6.0]], "Lista - expressão / escalar")
+    run_expression_test_case(lambda: (3 * (expr(a) - b) + c).evaluate(), [[-13, -12], [-10, -10.5]], "Escalar à esquerda e parênteses")
+    run_expression_test_case(lambda: len((expr(a) + a + a - b).terms), 4, "Termos acumulados sem avaliar")
+    run_expression_test_case(lambda: (expr(a) + a + a - b).evaluate(), [[-2, 0], [2, 4]], "Mesma matriz repetida soma os coeficientes")
+    run_expression_test_case(lambda: (expr(a) - a).evaluate(), [[0, 0], [0, 0]], "Termos que se cancelam resultam em zeros")
+    run_expression_test_case(lambda: (expr(a) * 0.5 + expr(b) * 0 + c).evaluate(), [[-0.5, 1.0], [3.5, 3.5]], "Coeficientes reais e zero")
+
+    # --- Seção: Matrix e Produtos ---
+    run_expression_test_case(lambda: isinstance((expr(Matrix.from_list(a)) + b).evaluate(), Matrix), True,
+                             "Expressão com Matrix resulta em Matrix")
+    run_expression_test_case(lambda: (expr(Matrix.from_list(a)) * 2 + (expr(b) - c)).evaluate(), reference, "Kernel plano (Matrix)")
+    m_a = Matrix.from_list(a)
+    run_expression_test_case(lambda: isinstance((expr(m_a) - expr(m_a)).evaluate(), Matrix), True,
+                             "Termos Matrix que se cancelam resultam em Matrix")
+    run_expression_test_case(lambda: (expr(m_a) - expr(m_a)).evaluate(), [[0, 0], [0, 0]], "Zeros do cancelamento (Matrix)")
+    product = expr(a) @ m_a
+    run_expression_test_case(lambda: isinstance((product - product).evaluate(), Matrix), True,
+                             "Produtos com Matrix que se cancelam resultam em Matrix")
+    run_expression_test_case(lambda: (expr(a) @ b + c).evaluate(), add_matrices(multiply_matrices(a, b), c), "A @ B + C")
+    run_expression_test_case(lambda: (2 * (expr(a) + b) @ (expr(c) - a)).evaluate(),
+                             scalar_multiply(multiply_matrices(add_matrices(a, b), subtract_matrices(c, a)), 2), "Produto de expressões")
+    run_expression_test_case(lambda: (expr([[1, 2, 3]]) @ [[1], [1], [1]]).shape, (1, 1), "Dimensões do produto")
+
+    # --- Seção: Avaliação Sob Demanda ---
+    mutable = [[1, 1], [1, 1]]
+    pending = expr(mutable) + a
+    mutable[0][0] = 10
+    run_expression_test_case(lambda: pending.evaluate(), [[11, 3], [4, 5]], "Avaliação acontece apenas em evaluate()")
+    run_expression_test_case(lambda: isinstance(expr(a) + b, Expression), True, "Operadores devolvem Expression")
+
+    # --- Seção: Erros ---
+    run_expression_test_case(lambda: expr(a) + [[1, 2, 3]], None, "Soma com dimensões diferentes",
+                             expect_error=True, error_message_contains="mesmas dimensões")
+    run_expression_test_case(lambda: expr(a) @ [[1, 2, 3]], None, "Produto com dimensões incompatíveis",
+                             expect_error=True, error_message_contains="Número de colunas")
+    run_expression_test_case(lambda: expr([[1, 2], [3]]), None, "Matriz inválida é recusada ao entrar na expressão",
+                             expect_error=True)
+    run_expression_test_case(lambda: expr(CSRMatrix.from_dense(a)), None, "Matriz esparsa é recusada",
+                             expect_error=True, error_message_contains="to_list()")
+
+    # --- Seção: Matriz Grande ---
+    n = 300
+    big_a = [[(i * j) % 7 for j in range(n)] for i in range(n)]
+    big_b = [[(i + j) % 5 for j in range(n)] for i in range(n)]
+    run_expression_test_case(lambda: (expr(big_a) * 3 - big_b + big_a).evaluate(),
+                             subtract_matrices(scalar_multiply(big_a, 4), big_b), "Combinação 300x300")
+
+    print_test_footer("expression.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_expression()
@@ -0,0 +1,169 @@
+# calculadora_matrizes/tests/test_finite_field.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, generate_matrix, print_test_header, print_test_footer
+# Importa as operações com o parâmetro 'modulus' (aritmética em GF(p)) e o posto.
+from logic.matrix import Matrix
+from logic.determinant import determinant
+from logic.inverse_matrix import inverse_matrix
+from logic.solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu
+from logic.matrix_rank import matrix_rank
+import random
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_finite_field_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de aritmética em GF(p).
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Comparar o resultado com 'expected_result' por igualdade exata (inteiros módulo p).
+    4. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    5. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result:
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def mod_product(matrix_a, matrix_b, modulus):
+    """Produto A * B reduzido módulo p (referência independente para as verificações)."""
+    return [[sum(x * y for x, y in zip(row, col)) % modulus for col in zip(*matrix_b)] for row in matrix_a]
+
+
+def test_finite_field():
+    """
+    Define e executa uma suíte de casos de teste para a aritmética em GF(p):
+    determinante, inversa, resolução de sistemas e posto com o parâmetro 'modulus'.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("finite_field.py")
+
+    m_2x2 = [[1, 2], [3, 4]]
+
+    # --- Seção: Determinante em GF(p) ---
+    # det = -2 => 5 (mod 7), 1 (mod 3); em GF(2) a matriz é singular.
+    run_finite_field_test_case(lambda: determinant(m_2x2, modulus=7), 5, "Determinante 2x2 em GF(7) (-2 = 5)")
+    run_finite_field_test_case(lambda: determinant(m_2x2, modulus=2), 0, "Determinante 2x2 em GF(2) (singular)")
+    m_5x5 = generate_matrix(5, 5, lambda r, c: (r * 7 + c * 3) % 11 - 5 + (4 if r == c else 0))
+    run_finite_field_test_case(lambda: determinant(m_5x5, modulus=101), determinant(m_5x5) % 101,
+                               "Determinante 5x5 em GF(101) concorda com o determinante inteiro")
+
+    # --- Seção: Inversa em GF(p) ---
+    # det = 5 e 5⁻¹ = 3 (mod 7): A⁻¹ = 3 * [[4, -2], [-3, 1]] = [[5, 1], [5, 3]].
+    run_finite_field_test_case(lambda: inverse_matrix(m_2x2, modulus=7), [[5, 1], [5, 3]], "Inversa 2x2 em GF(7)")
+    run_finite_field_test_case(lambda: inverse_matrix(Matrix.from_list(m_2x2), modulus=7), [[5, 1], [5, 3]],
+                               "Inversa de Matrix em GF(7)")
+    run_finite_field_test_case(lambda: inverse_matrix(m_2x2, modulus=2), None, "Inversa de matriz singular em GF(2)",
+                               expect_error=True, error_message_contains="determinante é zero")
+    run_finite_field_test_case(lambda: inverse_matrix(m_2x2, exact=True, modulus=7), None,
+                               "Inversa com exact=True e modulus juntos é recusada",
+                               expect_error=True, error_message_contains="não podem ser combinados")
+    m_30x30 = generate_matrix(30, 30, lambda r, c: (r * r + 3 * c + r * c) % 97)
+    run_finite_field_test_case(lambda: mod_product(m_30x30, inverse_matrix(m_30x30, modulus=65537), 65537),
+                               generate_matrix(30, 30, lambda r, c: 1 if r == c else 0),
+                               "Inversa 30x30 em GF(65537) satisfaz A * A⁻¹ = I (mod p)")
+
+    # --- Seção: Sistemas em GF(p) ---
+    # x + 2y = 1, 3x + 4y = 1 (mod 7) => x = 6, y = 1.
+    run_finite_field_test_case(lambda: solve_linear_system_lu(m_2x2, [[1], [1]], modulus=7), [[6], [1]],
+                               "Sistema 2x2 em GF(7) (LU)")
+    run_finite_field_test_case(lambda: solve_linear_system_inverse(m_2x2, [[1], [1]], modulus=7), [[6], [1]],
+                               "Sistema 2x2 em GF(7) (inversa)")
+    run_finite_field_test_case(lambda: solve_linear_system_inverse(m_2x2, [[1], [1]], exact=True, modulus=7), None,
+                               "Sistema com exact=True e modulus juntos é recusado",
+                               expect_error=True, error_message_contains="não podem ser combinados")
+    run_finite_field_test_case(lambda: solve_linear_system_lu([[0, 1], [1, 1]], [[3, 1], [5, 0]], modulus=11),
+                               [[2, 10], [3, 1]], "Sistema em GF(11) com pivô zero e B de 2 colunas")
+    run_finite_field_test_case(lambda: solve_linear_system_lu(m_2x2, [[1], [1]], modulus=2), None,
+                               "Sistema com A singular em GF(2)",
+                               expect_error=True, error_message_contains="Não é possível resolver o sistema")
+
+    # Sistema 500x500 denso sobre um primo de 31 bits, com solução conhecida.
+    prime_31 = 2147483647
+    rng = random.Random(2024)
+    m_500 = [[rng.randrange(prime_31) for _ in range(500)] for _ in range(500)]
+    exp_x_500 = [[rng.randrange(prime_31)] for _ in range(500)]
+    v_b_500 = mod_product(m_500, exp_x_500, prime_31)
+    run_finite_field_test_case(lambda: solve_linear_system_lu(m_500, v_b_500, modulus=prime_31), exp_x_500,
+                               "Sistema 500x500 denso em GF(2^31 - 1)")
+
+    # --- Seção: Posto (real e em GF(p)) ---
+    run_finite_field_test_case(lambda: matrix_rank([[1, 2, 3], [4, 5, 6], [7, 8, 9]]), 2,
+                               "Posto 3x3 com linhas dependentes")
+    run_finite_field_test_case(lambda: matrix_rank([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]]), 2,
+                               "Posto 3x3 em ponto flutuante (resíduos de arredondamento tratados como zero)")
+    run_finite_field_test_case(lambda: matrix_rank([[1, 2], [3, 4], [5, 6]]), 2, "Posto de matriz 3x2 não quadrada")
+    run_finite_field_test_case(lambda: matrix_rank([[1, 2], [3, 4]], modulus=2), 1,
+                               "Posto 2x2 em GF(2) (linhas iguais módulo 2)")
+    run_finite_field_test_case(lambda: matrix_rank([[1, 1, 0], [0, 1, 1], [1, 0, 1]], modulus=2), 2,
+                               "Posto 3x3 em GF(2) (soma das linhas é zero)")
+
+    # --- Seção: Casos de Erro ---
+    run_finite_field_test_case(lambda: determinant(m_2x2, modulus=8), None, "Módulo não primo",
+                               expect_error=True, error_message_contains="número primo")
+    run_finite_field_test_case(lambda: determinant([[1.5, 2], [3, 4]], modulus=7), None,
+                               "Elemento não inteiro em GF(p)",
+                               expect_error=True, error_message_contains="apenas números inteiros")
+
+    print_test_footer("finite_field.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_finite_field()
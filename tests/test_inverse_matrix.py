@@ -12,6 +12,8 @@ from test_utils import format_matrix_for_log, are_matrices_equal, generate_matri
 from logic.inverse_matrix import inverse_matrix
 # Importa a função de multiplicação de matrizes, usada para a verificação crucial A * A_inv = I.
 from logic.multiply_matrices import multiply_matrices
+# Importa Fraction para os resultados esperados do modo exato.
+from fractions import Fraction
 import math # Importa math (embora TOLERANCE já venha de test_utils, pode ser útil para outras comparações se necessário)
 
 # Contadores globais para rastrear o número total de casos de teste executados
@@ -21,7 +23,7 @@ passed_count = 0
 
 def run_inverse_test_case(matrix, expected_inverse, description, 
                           expect_error=False, error_message_contains=None, 
-                          check_identity=True):
+                          check_identity=True, method="auto", exact=False):
     """
     Executa um único caso de teste para a função inverse_matrix.
 
@@ -43,6 +45,9 @@ def run_inverse_test_case(matrix, expected_inverse, description,
                                               ignorando maiúsculas/minúsculas) deve estar contida na
                                               mensagem da exceção ValueError para o teste passar.
         check_identity (bool): Se True (padrão), realiza a verificação A * A_inv = I.
+        method (str): Algoritmo repassado para 'inverse_matrix' ("auto", "gauss_jordan", "adjoint").
+        exact (bool): Repassado para 'inverse_matrix'; se True, as comparações exigem
+                      igualdade exata (resultados em Fraction, sem tolerância).
     """
     global test_count, passed_count 
     test_count += 1 
@@ -52,7 +57,8 @@ def run_inverse_test_case(matrix, expected_inverse, description,
     log_details = [format_matrix_for_log(matrix, "Matriz Original de Entrada")]
 
     try:
-        result_inv = inverse_matrix(matrix)
+        result_inv = inverse_matrix(matrix, method=method, exact=exact)
+        matrices_match = (lambda m1, m2: m1 == m2) if exact else are_matrices_equal
         
         if expect_error:
             print(f"[FALHA] - {description}")
@@ -62,7 +68,7 @@ def run_inverse_test_case(matrix, expected_inverse, description,
         else:
             passed_this_test = True 
 
-            if expected_inverse is not None and not are_matrices_equal(result_inv, expected_inverse):
+            if expected_inverse is not None and not matrices_match(result_inv, expected_inverse):
                 passed_this_test = False 
                 log_details.append(format_matrix_for_log(expected_inverse, "Inversa Esperada (Definida no Teste)"))
                 log_details.append(format_matrix_for_log(result_inv, "Inversa Calculada pela Função"))
@@ -76,7 +82,7 @@ def run_inverse_test_case(matrix, expected_inverse, description,
                         ident_expected = generate_matrix(len(matrix), len(matrix[0]), lambda r,c: 1 if r==c else 0)
                         product = multiply_matrices(matrix, result_inv)
                         
-                        if not are_matrices_equal(product, ident_expected):
+                        if not matrices_match(product, ident_expected):
                             passed_this_test = False 
                             log_details.append(format_matrix_for_log(product, "Produto (Matriz Original * Inversa Calculada)"))
                             log_details.append(format_matrix_for_log(ident_expected, "Matriz Identidade (Esperada)"))
@@ -155,6 +161,44 @@ def test_inversao_matrizes():
 
     # O CASO DE TESTE DA MATRIZ 4X4 COMPLEXA FOI REMOVIDO DESTA VERSÃO.
 
+    # --- Seção: Gauss-Jordan com Pivoteamento vs. Adjunta ---
+    # Pivô zero em [0][0]: exige troca de linhas (desfeita como troca de colunas no final).
+    m_3x3_pivot = [[0, 1, 2], [1, 0, 3], [4, -3, 8]]
+    exp_inv_pivot = [[-4.5, 7, -1.5], [-2, 4, -1], [1.5, -2, 0.5]]
+    run_inverse_test_case(m_3x3_pivot, exp_inv_pivot, "Inversa 3x3 com pivô inicial zero (troca de linhas)")
+    run_inverse_test_case(m_3x3_pivot, exp_inv_pivot, "Inversa 3x3 com pivô inicial zero (método adjunta)",
+                          method="adjoint")
+
+    # Matriz 20x20 densa com diagonal dominante: inviável pela adjunta, imediata por Gauss-Jordan.
+    m_20x20 = generate_matrix(20, 20, lambda r, c: 25.0 if r == c else float((r * 3 + c * 5) % 7 - 3))
+    run_inverse_test_case(m_20x20, None, "Inversa 20x20 densa (verifica A*A_inv=I)", check_identity=True)
+
+    # --- Seção: Modo Exato (Gauss-Jordan sem frações, resultado em Fraction) ---
+    run_inverse_test_case([[2, 1], [1, 1]], [[1, -1], [-1, 2]], "Exata: inversa 2x2 inteira", exact=True)
+    run_inverse_test_case([[3]], [[Fraction(1, 3)]], "Exata: inversa 1x1 (1/3 sem arredondamento)", exact=True)
+    run_inverse_test_case(m_3x3_pivot, [[Fraction(-9, 2), 7, Fraction(-3, 2)], [-2, 4, -1], [Fraction(3, 2), -2, Fraction(1, 2)]],
+                          "Exata: inversa 3x3 com pivô inicial zero", exact=True)
+    run_inverse_test_case([[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), 1]], [[Fraction(12, 5), Fraction(-4, 5)], [Fraction(-3, 5), Fraction(6, 5)]],
+                          "Exata: inversa 2x2 com entradas Fraction", exact=True)
+
+    # Matriz de Hilbert 8x8 (h_ij = 1/(i+j+1)): muito mal condicionada em ponto flutuante,
+    # mas a inversa exata é inteira e satisfaz A * A⁻¹ = I exatamente.
+    hilbert_8 = generate_matrix(8, 8, lambda r, c: Fraction(1, r + c + 1))
+    run_inverse_test_case(hilbert_8, None, "Exata: inversa da matriz de Hilbert 8x8 (A*A_inv = I exato)", exact=True)
+
+    # Matriz inteira 40x40 densa: inviável pela adjunta, rápida sem frações.
+    m_40x40 = generate_matrix(40, 40, lambda r, c: (r * 7 + c * 11) % 19 - 9 + (50 if r == c else 0))
+    run_inverse_test_case(m_40x40, None, "Exata: inversa 40x40 inteira densa (A*A_inv = I exato)", exact=True)
+
+    run_inverse_test_case(
+        matrix=[[1, 2], [2, 4]],
+        expected_inverse=None,
+        description="Exata: inversa de matriz singular 2x2 (det=0)",
+        expect_error=True,
+        error_message_contains="determinante é zero",
+        exact=True
+    )
+
     # --- Seção: Casos de Teste de Erro ---
     run_inverse_test_case(
         matrix=[[1,2],[3,4],[5,6]], 
@@ -180,6 +224,25 @@ def test_inversao_matrizes():
         error_message_contains="determinante é zero"
     )
     
+    # Singularidade em ponto flutuante: a eliminação gera resíduos de arredondamento
+    # em vez de um zero exato, que devem ser reconhecidos como pivô nulo.
+    run_inverse_test_case(
+        matrix=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6], [0.7, 0.8, 0.9]],
+        expected_inverse=None,
+        description="Inversa de matriz 3x3 singular em ponto flutuante",
+        expect_error=True,
+        error_message_contains="determinante é zero"
+    )
+
+    run_inverse_test_case(
+        matrix=[[1, 2], [3, 4]],
+        expected_inverse=None,
+        description="Inversa com método desconhecido",
+        expect_error=True,
+        error_message_contains="Método de inversão desconhecido",
+        method="cramer"
+    )
+
     run_inverse_test_case(
         matrix=None, 
         expected_inverse=None,
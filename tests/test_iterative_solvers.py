@@ -0,0 +1,181 @@
+# calculadora_matrizes/tests/test_iterative_solvers.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer
+# Importa os resolvedores iterativos e o resolvedor direto usado como referência.
+from logic.matrix import Matrix
+from logic.iterative_solvers import conjugate_gradient, jacobi, gauss_seidel
+from logic.solve_linear_system import solve_linear_system_lu
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_iterative_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de um resolvedor iterativo.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+class TridiagonalOperator:
+    """Operador -1, 2, -1 (diferenças finitas 1D) sem armazenar a matriz: apenas matvec, diagonal e row_dot."""
+
+    def __init__(self, size):
+        self.size = size
+        self.shape = (size, size)
+
+    def matvec(self, x):
+        last = self.size - 1
+        return [2 * x[i] - (x[i - 1] if i > 0 else 0) - (x[i + 1] if i < last else 0) for i in range(self.size)]
+
+    def diagonal(self):
+        return [2.0] * self.size
+
+    def row_dot(self, i, x):
+        return 2 * x[i] - (x[i - 1] if i > 0 else 0) - (x[i + 1] if i < self.size - 1 else 0)
+
+
+class MatvecOnlyOperator:
+    """Operador que oferece apenas matvec (sem diagonal nem acesso às linhas)."""
+
+    shape = (2, 2)
+
+    def matvec(self, x):
+        return [3 * x[0] + x[1], x[0] + 2 * x[1]]
+
+
+def test_iterative_solvers():
+    """
+    Define e executa uma suíte de casos de teste para o Gradiente Conjugado,
+    Jacobi e Gauss-Seidel (convergência, ponto de partida x0 e relatório).
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("iterative_solvers.py")
+
+    spd_3 = [[4.0, 1.0, 0.0], [1.0, 3.0, 1.0], [0.0, 1.0, 2.0]]
+    v_b = [[1.0], [2.0], [3.0]]
+    expected = solve_linear_system_lu(spd_3, v_b)
+
+    # --- Seção: Gradiente Conjugado ---
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, v_b).solution, expected, "CG com matriz densa 3x3")
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, v_b).converged, True, "CG: relatório indica convergência")
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, v_b).iterations <= 3, True, "CG converge em no máximo n iterações")
+    run_iterative_test_case(lambda: conjugate_gradient(Matrix.from_list(spd_3), Matrix.from_list(v_b)).solution, expected,
+                            "CG com operandos Matrix")
+    run_iterative_test_case(lambda: conjugate_gradient(lambda x: [sum(a * xi for a, xi in zip(row, x)) for row in spd_3], v_b).solution,
+                            expected, "CG com uma função matvec")
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, v_b, x0=expected).iterations, 0,
+                            "CG com x0 = solução: nenhuma iteração")
+    run_iterative_test_case(lambda: conjugate_gradient([[1.0, 2.0], [2.0, -3.0]], [[1.0], [1.0]]), None,
+                            "CG com matriz indefinida", expect_error=True, error_message_contains="definida positiva")
+
+    # --- Seção: Jacobi e Gauss-Seidel ---
+    dominant_3 = [[10.0, -1.0, 2.0], [-1.0, 11.0, -1.0], [2.0, -1.0, 10.0]]
+    v_b_dominant = [[6.0], [25.0], [-11.0]]
+    expected_dominant = solve_linear_system_lu(dominant_3, v_b_dominant)
+    run_iterative_test_case(lambda: jacobi(dominant_3, v_b_dominant).solution, expected_dominant,
+                            "Jacobi com matriz diagonalmente dominante")
+    run_iterative_test_case(lambda: gauss_seidel(dominant_3, v_b_dominant).solution, expected_dominant,
+                            "Gauss-Seidel com matriz diagonalmente dominante")
+    run_iterative_test_case(lambda: gauss_seidel(dominant_3, v_b_dominant).iterations < jacobi(dominant_3, v_b_dominant).iterations,
+                            True, "Gauss-Seidel usa menos varreduras que Jacobi")
+    near = [[1.0], [2.0], [-1.0]]
+    run_iterative_test_case(lambda: jacobi(dominant_3, v_b_dominant, x0=near).iterations < jacobi(dominant_3, v_b_dominant).iterations,
+                            True, "Jacobi com x0 próximo da solução (warm start) usa menos iterações")
+    run_iterative_test_case(lambda: jacobi([[1.0, 3.0], [3.0, 1.0]], [[1.0], [1.0]], max_iter=20).converged, False,
+                            "Jacobi divergente: relatório com converged=False (sem erro)")
+    run_iterative_test_case(lambda: jacobi([[0.0, 1.0], [1.0, 0.0]], [[1.0], [1.0]]), None, "Jacobi com zero na diagonal",
+                            expect_error=True, error_message_contains="diagonal")
+    run_iterative_test_case(lambda: jacobi(MatvecOnlyOperator(), [[1.0], [1.0]]), None, "Jacobi com operador sem diagonal()",
+                            expect_error=True, error_message_contains="diagonal()")
+    run_iterative_test_case(lambda: conjugate_gradient(MatvecOnlyOperator(), [[4.0], [3.0]]).solution, [[1.0], [1.0]],
+                            "CG com operador que oferece apenas matvec")
+
+    # --- Seção: Validação das Entradas ---
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, [[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]]), None,
+                            "B com mais de uma coluna", expect_error=True, error_message_contains="vetor coluna")
+    run_iterative_test_case(lambda: conjugate_gradient(spd_3, v_b, x0=[[0.0], [0.0]]), None, "x0 de tamanho incompatível",
+                            expect_error=True, error_message_contains="x0")
+    run_iterative_test_case(lambda: jacobi(spd_3, v_b, tol=0), None, "Tolerância não positiva",
+                            expect_error=True, error_message_contains="tolerância")
+    run_iterative_test_case(lambda: conjugate_gradient(TridiagonalOperator(3), [[1.0], [1.0]]), None,
+                            "Operador com 'shape' incompatível com B", expect_error=True, error_message_contains="Número de linhas")
+
+    # --- Seção: Operador Grande (sem matriz armazenada) ---
+    #    -u'' = 1 com 400 incógnitas: o CG converge em ~n/2 iterações (simetria do problema).
+    n = 400
+    h = 1.0 / (n + 1)
+    rhs = [[h * h]] * n
+    middle = (n // 2 + 1) * h
+    result = conjugate_gradient(TridiagonalOperator(n), rhs)
+    run_iterative_test_case(lambda: result.solution[n // 2][0], 0.5 * middle * (1 - middle), "CG com operador tridiagonal 400x400")
+    run_iterative_test_case(lambda: result.converged and result.iterations <= n, True, "CG 400x400: convergência em até n iterações")
+    run_iterative_test_case(lambda: gauss_seidel(TridiagonalOperator(50), [[1.0]] * 50, max_iter=5000, tol=1e-8).converged, True,
+                            "Gauss-Seidel com operador (row_dot) 50x50")
+
+    print_test_footer("iterative_solvers.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_iterative_solvers()
@@ -0,0 +1,169 @@
+# calculadora_matrizes/tests/test_lu_factorization.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir matrizes de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa a fatoração que será testada e a multiplicação usada nas verificações P*A = L*U.
+from logic.lu_factorization import factorize
+from logic.multiply_matrices import multiply_matrices
+from logic.matrix import Matrix
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_factorization_test_case(matrix, operation, expected_result, description,
+                                expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste sobre um objeto LUFactorization.
+
+    Esta função irá:
+    1. Fatorar 'matrix' com 'factorize' e aplicar 'operation' ao objeto resultante.
+    2. Se um erro é esperado (expect_error=True):
+        a. Verificar se um ValueError foi levantado.
+        b. Se sim, verificar se a mensagem de erro contém 'error_message_contains'.
+    3. Se nenhum erro é esperado:
+        a. Comparar o resultado obtido com 'expected_result' usando 'are_matrices_equal'.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        matrix (list[list[float]] or None): A matriz A a ser fatorada.
+        operation (function): Recebe o objeto LUFactorization e retorna o valor testado
+                              (ex: lambda lu: lu.det()).
+        expected_result: O valor esperado (escalar ou matriz). None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = [format_matrix_for_log(matrix, "Matriz A de Entrada")]
+
+    try:
+        # 1. Execução: fatoração seguida da operação testada.
+        result = operation(factorize(matrix))
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+        if error_message_contains:
+            log_details.append(f"  Esperado que a Mensagem Contivesse: '{error_message_contains}'")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_fatoracao_lu():
+    """
+    Define e executa uma suíte de casos de teste para LUFactorization / factorize.
+    Verifica a reconstrução P*A = L*U, o determinante, a inversa e as resoluções
+    (simples e múltiplas) feitas a partir de uma única fatoração.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("lu_factorization.py")
+
+    m_3x3 = [[1, 2, 3], [0, 1, 4], [5, 6, 0]]  # det = 1
+
+    # --- Seção: Fatores P, L e U ---
+    run_factorization_test_case(m_3x3, lambda lu: multiply_matrices(lu.L, lu.U),
+                                multiply_matrices(factorize(m_3x3).P, m_3x3),
+                                "Reconstrução P*A = L*U (3x3)")
+    run_factorization_test_case(m_3x3, lambda lu: [[lu.U[r][c] for c in range(r)] for r in range(1, 3)],
+                                [[0], [0, 0]], "U é triangular superior")
+
+    # --- Seção: Determinante, Inversa e Resoluções ---
+    run_factorization_test_case(m_3x3, lambda lu: lu.det(), 1, "Determinante a partir da fatoração (det=1)")
+    run_factorization_test_case([[0, 1], [1, 0]], lambda lu: lu.det(), -1,
+                                "Determinante com troca de linhas (matriz de permutação, det=-1)")
+    run_factorization_test_case(m_3x3, lambda lu: lu.inverse(),
+                                [[-24, 18, 5], [20, -15, -4], [-5, 4, 1]], "Inversa a partir da fatoração (3x3)")
+    run_factorization_test_case(m_3x3, lambda lu: lu.solve([[6], [5], [11]]), [[1.0], [1.0], [1.0]],
+                                "Resolução de A*X = B (X=[1,1,1])")
+    run_factorization_test_case(m_3x3, lambda lu: lu.solve_many([[6, 1], [5, 0], [11, 0]]),
+                                [[1.0, -24.0], [1.0, 20.0], [1.0, -5.0]],
+                                "Resolução com múltiplos lados direitos (n x 2)")
+
+    # Mesma fatoração reutilizada para vários lados direitos.
+    m_25x25 = generate_matrix(25, 25, lambda r, c: 30.0 if r == c else float((3 * r + c) % 7 - 3))
+    lu_25 = factorize(m_25x25)
+    for k in range(3):
+        exp_x = generate_matrix(25, 1, lambda r, c: float(r - k))
+        b = multiply_matrices(m_25x25, exp_x)
+        run_factorization_test_case(m_25x25, lambda lu, b=b: lu_25.solve(b), exp_x,
+                                    f"Fatoração 25x25 reutilizada: lado direito #{k + 1}")
+
+    # Coluna inteira de valores pequenos: o pivô 1e-13 não é desprezível na sua coluna.
+    m_small_column = [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0], [0.0, 0.0, 1e-13]]
+    run_factorization_test_case(m_small_column, lambda lu: [[int(lu.is_singular), lu.det() * 1e13]], [[0, -2.0]],
+                                "Pivô pequeno não nulo: não singular e det() = -2e-13")
+
+    # --- Seção: Operandos Matrix ---
+    # Como nas demais operações, um Matrix (em A ou em B) resulta em Matrix.
+    run_factorization_test_case(m_3x3, lambda lu: isinstance(lu.solve(Matrix.from_list([[6], [5], [11]])), Matrix), True,
+                                "solve() com B Matrix devolve Matrix")
+    run_factorization_test_case(m_3x3, lambda lu: lu.solve_many(Matrix.from_list([[6, 1], [5, 0], [11, 0]])).to_list(),
+                                [[1.0, -24.0], [1.0, 20.0], [1.0, -5.0]], "solve_many() com B Matrix devolve Matrix")
+    run_factorization_test_case(Matrix.from_list(m_3x3), lambda lu: lu.inverse().to_list(),
+                                [[-24, 18, 5], [20, -15, -4], [-5, 4, 1]], "inverse() de A Matrix devolve Matrix")
+    run_factorization_test_case(Matrix.from_list(m_3x3), lambda lu: isinstance(lu.solve([[6], [5], [11]]), Matrix), True,
+                                "solve() de A Matrix com B em listas devolve Matrix")
+
+    # --- Seção: Matrizes Singulares e Erros ---
+    # Mal condicionada (pivô não nulo, porém desprezível): singular para resolver,
+    # mas os fatores L e U existem.
+    m_ill = [[1.0, 2.0], [2.0, 4.0 + 1e-14]]
+    run_factorization_test_case(m_ill, lambda lu: [[int(lu.is_singular)]], [[1]], "Matriz mal condicionada é singular para resolver")
+    run_factorization_test_case(m_ill, lambda lu: multiply_matrices(lu.L, lu.U), multiply_matrices(factorize(m_ill).P, m_ill),
+                                "Matriz mal condicionada: L e U disponíveis (P*A = L*U)")
+    m_singular = [[1, 2], [2, 4]]
+    run_factorization_test_case(m_singular, lambda lu: lu.det(), 0, "Matriz singular: det() retorna 0")
+    run_factorization_test_case(m_singular, lambda lu: lu.U, None, "Matriz singular (pivô exatamente zero): U não existe",
+                                expect_error=True, error_message_contains="pivô nulo")
+    run_factorization_test_case(m_singular, lambda lu: lu.inverse(), None, "Matriz singular: inverse() falha",
+                                expect_error=True, error_message_contains="determinante é zero")
+    run_factorization_test_case(m_singular, lambda lu: lu.solve([[1], [2]]), None, "Matriz singular: solve() falha",
+                                expect_error=True, error_message_contains="determinante é zero")
+    run_factorization_test_case(m_3x3, lambda lu: lu.solve([[1], [2]]), None,
+                                "Vetor B com número de linhas incompatível",
+                                expect_error=True, error_message_contains="deve ser igual ao número de linhas do Vetor B")
+    run_factorization_test_case([[1, 2, 3], [4, 5, 6]], lambda lu: lu.det(), None,
+                                "Fatoração de matriz não quadrada",
+                                expect_error=True, error_message_contains="deve ser quadrada")
+
+    print_test_footer("lu_factorization.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_fatoracao_lu()
@@ -0,0 +1,185 @@
+# calculadora_matrizes/tests/test_matrix.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa o tipo Matrix e as operações que o aceitam diretamente.
+from logic.matrix import Matrix
+from logic.add_matrices import add_matrices, iadd
+from logic.subtract_matrices import subtract_matrices
+from logic.scalar_multiply import scalar_multiply, iscale
+from logic.transpose_matrix import transpose_matrix
+from logic.multiply_matrices import multiply_matrices
+from logic.determinant import determinant
+from logic.inverse_matrix import inverse_matrix
+from logic.solve_linear_system import solve_linear_system_lu
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_matrix_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste envolvendo o tipo Matrix.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação
+       (exceto quando 'expected_result' for uma string, comparada com o typecode ou tipo).
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_matrix():
+    """
+    Define e executa uma suíte de casos de teste para o tipo Matrix:
+    construção, armazenamento compacto e uso direto nas operações do pacote 'logic'.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("matrix.py")
+
+    list_a = [[1, 2, 3], [4, 5, 6]]
+    list_b = [[6, 5, 4], [3, 2, 1]]
+    m_a = Matrix.from_list(list_a)
+    m_b = Matrix.from_list(list_b)
+
+    # --- Seção: Construção e Armazenamento ---
+    run_matrix_test_case(lambda: m_a.to_list(), list_a, "Conversão lista -> Matrix -> lista preserva os valores")
+    run_matrix_test_case(lambda: (m_a.rows, m_a.cols, m_a.typecode), (2, 3, "q"),
+                         "Matriz de inteiros usa typecode 'q' com rows/cols corretos")
+    run_matrix_test_case(lambda: Matrix.from_list([[1, 2.5]]).typecode, "d",
+                         "Matriz com float usa typecode 'd'")
+    run_matrix_test_case(lambda: Matrix.from_list([[2 ** 70, 1]]).typecode, "d",
+                         "Inteiro fora do intervalo de 64 bits é armazenado como float")
+    run_matrix_test_case(lambda: (m_a[1][2], m_a[1, 2], m_a.column(1).tolist()), (6, 6, [2, 5]),
+                         "Acesso m[i][j], m[i, j] e coluna por fatiamento com passo")
+
+    # Escrita de elementos: m[i, j] = valor altera o Matrix; m[i] é uma cópia da linha
+    # (apenas para leitura), então m[i][j] = valor não altera o Matrix.
+    def set_element(matrix):
+        matrix[0, 1] = 20
+        return matrix
+
+    def set_through_row_copy(matrix):
+        matrix[0][1] = 20
+        return matrix
+
+    def assign_row(matrix):
+        try:
+            matrix[0] = [7, 8, 9]
+        except TypeError as te:
+            return str(te)
+        return "sem erro"
+
+    run_matrix_test_case(lambda: set_element(Matrix.from_list(list_a)), [[1, 20, 3], [4, 5, 6]],
+                         "Escrita m[i, j] = valor altera o Matrix")
+    run_matrix_test_case(lambda: set_through_row_copy(Matrix.from_list(list_a)), list_a,
+                         "m[i] é cópia da linha: m[i][j] = valor não altera o Matrix")
+    run_matrix_test_case(lambda: "m[i, j] = valor" in assign_row(Matrix.from_list(list_a)), True,
+                         "Atribuição de linha m[i] = ... levanta TypeError orientando o uso de m[i, j]")
+    big = Matrix.zeros(300, 300)
+    run_matrix_test_case(lambda: len(big.data) * big.data.itemsize, 300 * 300 * 8,
+                         "Armazenamento de 300x300 ocupa exatamente 8 bytes por elemento")
+    run_matrix_test_case(lambda: Matrix.from_list([[1, 2], [3]]), None, "Construção a partir de matriz inconsistente",
+                         expect_error=True, error_message_contains="mesmo número de colunas")
+    run_matrix_test_case(lambda: Matrix.from_list([["a", "b"]]), None, "Construção com elementos não numéricos",
+                         expect_error=True, error_message_contains="apenas números")
+
+    # --- Seção: Operações com Matrix ---
+    run_matrix_test_case(lambda: add_matrices(m_a, m_b), [[7, 7, 7], [7, 7, 7]], "Soma Matrix + Matrix")
+    run_matrix_test_case(lambda: type(add_matrices(m_a, list_b)).__name__, "Matrix",
+                         "Soma Matrix + lista devolve Matrix")
+    run_matrix_test_case(lambda: subtract_matrices(m_a, m_b), [[-5, -3, -1], [1, 3, 5]], "Subtração Matrix - Matrix")
+    run_matrix_test_case(lambda: scalar_multiply(m_a, 0.5), [[0.5, 1, 1.5], [2, 2.5, 3]],
+                         "Multiplicação de Matrix por escalar")
+    run_matrix_test_case(lambda: transpose_matrix(m_a), [[1, 4], [2, 5], [3, 6]], "Transposta de Matrix (2x3 -> 3x2)")
+    run_matrix_test_case(lambda: multiply_matrices(m_a, transpose_matrix(m_b)),
+                         multiply_matrices(list_a, transpose_matrix(list_b)), "Multiplicação Matrix * Matrix")
+    m_square = generate_matrix(12, 12, lambda r, c: 20.0 if r == c else float((r + 3 * c) % 5 - 2))
+    run_matrix_test_case(lambda: multiply_matrices(Matrix.from_list(m_square), m_square, method="strassen", cutoff=3),
+                         multiply_matrices(m_square, m_square), "Multiplicação de Strassen com operando Matrix")
+    run_matrix_test_case(lambda: determinant(Matrix.from_list(m_square)), determinant(m_square),
+                         "Determinante de Matrix")
+    run_matrix_test_case(lambda: inverse_matrix(Matrix.from_list(m_square)), inverse_matrix(m_square),
+                         "Inversa de Matrix devolve Matrix com os mesmos valores")
+    v_b = generate_matrix(12, 1, lambda r, c: float(r))
+    run_matrix_test_case(lambda: solve_linear_system_lu(Matrix.from_list(m_square), Matrix.from_list(v_b)),
+                         solve_linear_system_lu(m_square, v_b), "Sistema linear com A e B do tipo Matrix")
+    m_out = Matrix.zeros(2, 3)
+    run_matrix_test_case(lambda: (add_matrices(m_a, m_b, out=m_out) is m_out, m_out.to_list()), (True, [[7, 7, 7], [7, 7, 7]]),
+                         "Soma escrita em um Matrix 'out' existente")
+    m_acc = Matrix.from_list(list_a)
+    acc_data = m_acc.data
+    run_matrix_test_case(lambda: (iadd(m_acc, list_b).data is acc_data, m_acc.to_list()), (True, [[7, 7, 7], [7, 7, 7]]),
+                         "iadd em Matrix reaproveita o array plano")
+    run_matrix_test_case(lambda: (iscale(Matrix.from_list(list_a), 0.5).typecode), "d",
+                         "iscale por float em Matrix de inteiros passa a armazenar floats")
+    run_matrix_test_case(lambda: subtract_matrices(m_a, Matrix.from_list([[1, 2, 3]])), [[0, 0, 0], [3, 3, 3]],
+                         "Broadcasting: Matrix - vetor linha Matrix 1x3")
+    run_matrix_test_case(lambda: add_matrices([[0.5], [1.5]], m_a), [[1.5, 2.5, 3.5], [5.5, 6.5, 7.5]],
+                         "Broadcasting: vetor coluna 2x1 + Matrix")
+    run_matrix_test_case(lambda: add_matrices(m_a, Matrix.from_list([[1, 2], [3, 4]])), None,
+                         "Soma de Matrix com dimensões diferentes",
+                         expect_error=True, error_message_contains="mesmas dimensões")
+
+    print_test_footer("matrix.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_matrix()
@@ -0,0 +1,166 @@
+# calculadora_matrizes/tests/test_matrix_structure.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - generate_matrix: Para criar matrizes de teste maiores.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
+# Importa a detecção de estrutura e as operações que a utilizam no modo "auto".
+from logic.matrix import Matrix
+from logic.matrix_structure import detect_structure, MatrixStructure
+from logic.determinant import determinant
+from logic.inverse_matrix import inverse_matrix
+from logic.solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu
+from logic.multiply_matrices import multiply_matrices
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_structure_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de detecção de estrutura ou de um caminho rápido.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_matrix_structure():
+    """
+    Define e executa uma suíte de casos de teste para a detecção de estrutura
+    e para os caminhos rápidos de determinante, inversa e resolução de sistemas.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("matrix_structure.py")
+
+    identity_3 = [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+    permutation_3 = [[0, 1, 0], [0, 0, 1], [1, 0, 0]]
+    upper_3 = [[2, 1, 3], [0, 4, 5], [0, 0, 8]]
+    lower_3 = [[2, 0, 0], [1, 4, 0], [3, 5, 8]]
+    symmetric_3 = [[2, 1, 0], [1, 3, 4], [0, 4, 5]]
+
+    # --- Seção: Detecção de Estrutura ---
+    run_structure_test_case(lambda: detect_structure(identity_3), MatrixStructure(True, True, True, True, True, True),
+                            "Identidade: diagonal, triangular, permutação e simétrica")
+    run_structure_test_case(lambda: detect_structure(permutation_3), MatrixStructure(False, False, False, True, False, False),
+                            "Permutação cíclica 3x3")
+    run_structure_test_case(lambda: detect_structure(upper_3), MatrixStructure(False, True, False, False, False, False),
+                            "Triangular superior")
+    run_structure_test_case(lambda: detect_structure(Matrix.from_list(lower_3)), MatrixStructure(False, False, True, False, False, False),
+                            "Triangular inferior (Matrix)")
+    run_structure_test_case(lambda: detect_structure(symmetric_3), MatrixStructure(False, False, False, False, False, True),
+                            "Simétrica")
+    run_structure_test_case(lambda: detect_structure([[3.0, 0.0], [0.0, -1.5]]), MatrixStructure(True, True, True, False, False, True),
+                            "Diagonal em ponto flutuante")
+    run_structure_test_case(lambda: detect_structure([[1, 1], [0, 0]]), MatrixStructure(False, True, False, False, False, False),
+                            "Linha com dois 1 não é permutação")
+    run_structure_test_case(lambda: detect_structure([[1, 2], [3, 4], [5, 6]]), None, "Estrutura de matriz não quadrada",
+                            expect_error=True, error_message_contains="deve ser quadrada")
+
+    # --- Seção: Determinante pelos Caminhos Rápidos ---
+    run_structure_test_case(lambda: determinant(upper_3), 64, "Determinante triangular superior = produto da diagonal")
+    run_structure_test_case(lambda: determinant(lower_3), 64, "Determinante triangular inferior = produto da diagonal")
+    run_structure_test_case(lambda: determinant(permutation_3), 1, "Determinante de permutação cíclica de 3 (par)")
+    run_structure_test_case(lambda: determinant([[0, 1, 0], [1, 0, 0], [0, 0, 1]]), -1,
+                            "Determinante de uma transposição (ímpar)")
+    upper_300 = generate_matrix(300, 300, lambda r, c: (2.0 if r == c else 0.5 / (1 + c - r)) if c >= r else 0.0)
+    run_structure_test_case(lambda: determinant(upper_300), 2.0 ** 300, "Determinante 300x300 triangular em O(n)")
+
+    # --- Seção: Inversa pelos Caminhos Rápidos ---
+    run_structure_test_case(lambda: inverse_matrix(identity_3), identity_3, "Inversa da identidade")
+    run_structure_test_case(lambda: inverse_matrix(permutation_3), [[0, 0, 1], [1, 0, 0], [0, 1, 0]],
+                            "Inversa de permutação = transposta")
+    run_structure_test_case(lambda: inverse_matrix([[2, 0], [0, 4]]), [[0.5, 0], [0, 0.25]], "Inversa diagonal")
+    run_structure_test_case(lambda: inverse_matrix(upper_3), inverse_matrix(upper_3, method="gauss_jordan"),
+                            "Inversa triangular superior concorda com Gauss-Jordan")
+    run_structure_test_case(lambda: inverse_matrix(Matrix.from_list(lower_3)), inverse_matrix(lower_3, method="gauss_jordan"),
+                            "Inversa triangular inferior (Matrix) concorda com Gauss-Jordan")
+    # Diagonais pequenas (ou grandes) mas não nulas: cada elemento da diagonal é comparado
+    # com a escala da sua coluna, como na LU e em Gauss-Jordan.
+    for scaled, name in (([[1e13, 0.0], [0.0, 1.0]], "diag(1e13, 1)"), ([[1.0, 0.0], [0.0, 1e-13]], "diag(1, 1e-13)"),
+                         ([[1.0, 0.0, 0.0], [2.0, 1e-13, 0.0], [0.0, 0.0, 1.0]], "triangular com diagonal 1e-13")):
+        run_structure_test_case(lambda scaled=scaled: inverse_matrix(scaled), inverse_matrix(scaled, method="gauss_jordan"),
+                                f"Inversa de {name} concorda com Gauss-Jordan")
+        run_structure_test_case(lambda scaled=scaled: multiply_matrices(scaled, solve_linear_system_lu(scaled, [[1.0]] * len(scaled))),
+                                [[1.0]] * len(scaled), f"Sistema com A = {name} (A*X = B)")
+    run_structure_test_case(lambda: inverse_matrix([[1, 2], [0, 0]]), None, "Inversa de triangular singular",
+                            expect_error=True, error_message_contains="determinante é zero")
+
+    # --- Seção: Sistemas pelos Caminhos Rápidos ---
+    v_b = [[6], [9], [16]]
+    run_structure_test_case(lambda: solve_linear_system_inverse(identity_3, v_b), v_b, "Sistema com A identidade: X = B")
+    run_structure_test_case(lambda: solve_linear_system_lu(permutation_3, v_b), [[16], [6], [9]],
+                            "Sistema com A de permutação: X = B permutado")
+    run_structure_test_case(lambda: multiply_matrices(upper_3, solve_linear_system_inverse(upper_3, v_b)), v_b,
+                            "Sistema triangular superior por substituição regressiva (A*X = B)")
+    run_structure_test_case(lambda: multiply_matrices(lower_3, solve_linear_system_lu(lower_3, [[6, 1], [9, 0], [16, 2]])),
+                            [[6, 1], [9, 0], [16, 2]], "Sistema triangular inferior com B de 2 colunas (A*X = B)")
+    v_b_300 = generate_matrix(300, 1, lambda r, c: float(r % 7))
+    run_structure_test_case(lambda: multiply_matrices(upper_300, solve_linear_system_lu(upper_300, v_b_300)), v_b_300,
+                            "Sistema 300x300 triangular por substituição O(n²)")
+    run_structure_test_case(lambda: solve_linear_system_lu([[1, 0], [5, 0]], [[1], [2]]), None,
+                            "Sistema com A triangular singular",
+                            expect_error=True, error_message_contains="Não é possível resolver o sistema")
+
+    print_test_footer("matrix_structure.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_matrix_structure()
@@ -0,0 +1,129 @@
+# calculadora_matrizes/tests/test_multiply_chain.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer
+# Importa a multiplicação em cadeia, a programação dinâmica interna (para verificar
+# a ordem escolhida) e a multiplicação de duas matrizes, usada como referência.
+from logic.matrix import Matrix
+from logic.sparse import CSRMatrix
+from logic.expression import expr
+from logic.multiply_matrices import multiply_matrices, multiply_chain, _chain_order
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_chain_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste da multiplicação em cadeia.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, Matrix):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_multiply_chain():
+    """
+    Define e executa uma suíte de casos de teste para multiply_chain: a escolha da
+    ordem de associação, o resultado do produto e os erros de dimensão.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("multiply_chain")
+
+    a = [[1, 2, 3], [4, 5, 6]]
+    b = [[1, 0], [0, 1], [2, -1]]
+    c = [[3, 1, 0, 2], [-1, 2, 1, 0]]
+    d = [[1], [2], [0], [-1]]
+    left_to_right = multiply_matrices(multiply_matrices(multiply_matrices(a, b), c), d)
+
+    # --- Seção: Ordem de Associação ---
+    run_chain_test_case(lambda: _chain_order([30, 35, 15, 5, 10, 20, 25])[0], 15125, "Custo mínimo do exemplo clássico (6 matrizes)")
+    run_chain_test_case(lambda: _chain_order([10, 1000, 10, 1000])[0], 200000, "(A*B)*C é escolhida para 10x1000, 1000x10, 10x1000")
+    run_chain_test_case(lambda: _chain_order([1000, 10, 1000, 10])[1][0][2], 0, "A*(B*C) é escolhida para 1000x10, 10x1000, 1000x10")
+
+    # --- Seção: Produto da Cadeia ---
+    run_chain_test_case(lambda: multiply_chain([a, b, c, d]), left_to_right, "Cadeia de 4 matrizes igual ao produto da esquerda para a direita")
+    run_chain_test_case(lambda: multiply_chain([a, b]), multiply_matrices(a, b), "Cadeia de 2 matrizes")
+    run_chain_test_case(lambda: multiply_chain([a]), a, "Cadeia de uma única matriz")
+    run_chain_test_case(lambda: isinstance(multiply_chain([Matrix.from_list(a), b, c]), Matrix), True, "Cadeia com Matrix resulta em Matrix")
+    run_chain_test_case(lambda: multiply_chain([CSRMatrix.from_dense(a), b, c, d]), left_to_right, "Cadeia com matriz esparsa")
+    run_chain_test_case(lambda: (expr(a) @ b @ c @ d).evaluate(), left_to_right, "Produtos encadeados em expressões usam a mesma ordem")
+
+    skinny_row = [[1.0] * 400]
+    tall = [[0.5] * 400 for _ in range(400)]
+    skinny_col = [[2.0] for _ in range(400)]
+    run_chain_test_case(lambda: multiply_chain([tall, tall, skinny_col]), [[80000.0] for _ in range(400)],
+                        "Cadeia 400x400 * 400x400 * 400x1 (associa pela direita)")
+    run_chain_test_case(lambda: multiply_chain([skinny_row, tall, tall, tall, skinny_col]), [[6400000000.0]],
+                        "Cadeia de 5 matrizes 1x400 ... 400x1")
+
+    # --- Seção: Erros ---
+    run_chain_test_case(lambda: multiply_chain([]), None, "Cadeia vazia", expect_error=True, error_message_contains="ao menos uma matriz")
+    run_chain_test_case(lambda: multiply_chain([a, b, d]), None, "Dimensões incompatíveis entre as matrizes 2 e 3",
+                        expect_error=True, error_message_contains="Matriz 2 deve ser igual ao número de linhas da Matriz 3")
+    run_chain_test_case(lambda: multiply_chain([a, [[1], []]]), None, "Matriz inválida na cadeia",
+                        expect_error=True, error_message_contains="Matriz 2 da cadeia")
+
+    print_test_footer("multiply_chain", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_multiply_chain()
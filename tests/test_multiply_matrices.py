@@ -13,7 +13,8 @@ from logic.multiply_matrices import multiply_matrices
 test_count = 0
 passed_count = 0
 
-def run_multiply_test_case(m_a, m_b, expected_result, description, expect_error=False, error_message_contains=None):
+def run_multiply_test_case(m_a, m_b, expected_result, description, expect_error=False, error_message_contains=None,
+                           method="auto", cutoff=None):
     """
     Executa um único caso de teste para a função multiply_matrices.
 
@@ -34,6 +35,8 @@ def run_multiply_test_case(m_a, m_b, expected_result, description, expect_error=
         description (str): Descrição do caso de teste.
         expect_error (bool): True se uma exceção ValueError é esperada.
         error_message_contains (str or None): Substring esperada na mensagem de erro.
+        method (str): Algoritmo repassado para 'multiply_matrices' ("auto", "classic", "strassen").
+        cutoff (int or None): Tamanho de corte da recursão de Strassen.
     """
     global test_count, passed_count
     test_count += 1
@@ -46,7 +49,7 @@ def run_multiply_test_case(m_a, m_b, expected_result, description, expect_error=
 
     try:
         # 1. Execução da Função: Realiza a multiplicação das matrizes.
-        result = multiply_matrices(m_a, m_b)
+        result = multiply_matrices(m_a, m_b, method=method, cutoff=cutoff)
         
         # 2. Verificação Pós-Execução (se nenhum erro ocorreu durante a execução):
         if expect_error:
@@ -174,6 +177,43 @@ def test_multiplicacao_matrizes():
     exp_7x3_twenties = [[20 for _ in range(3)] for _ in range(7)] 
     run_multiply_test_case(m_a_7x10_ones, m_b_10x3_twos, exp_7x3_twenties, "Multiplicação Matriz 7x10 (de 1s) * Matriz 10x3 (de 2s)")
 
+    # Teste 10b: Produto maior que um bloco de colunas do kernel (B com 150 colunas).
+    # (3x4) * (4x150) -> (3x150), com C[i][j] calculado pela fórmula fechada
+    # soma_k (i + k) * (k * j + 1) = 4i + 6 + j * (6i + 14)
+    m_a_3x4 = generate_matrix(3, 4, lambda r, c: r + c)
+    m_b_4x150 = generate_matrix(4, 150, lambda r, c: r * c + 1)
+    exp_3x150 = generate_matrix(3, 150, lambda r, c: 4 * r + 6 + c * (6 * r + 14))
+    run_multiply_test_case(m_a_3x4, m_b_4x150, exp_3x150, "Multiplicação (3x4) * (4x150): vários blocos de colunas")
+
+    # --- Seção: Multiplicação de Strassen ---
+    # Com cutoff pequeno a recursão é exercitada mesmo em matrizes pequenas;
+    # o resultado deve coincidir exatamente com o kernel clássico (inteiros).
+    run_multiply_test_case(m_a_2x2, m_b_2x2, exp_2x2, "Strassen: matrizes 2x2 (um nível de recursão)",
+                           method="strassen", cutoff=1)
+    m_a_5x7 = generate_matrix(5, 7, lambda r, c: (r * 3 + c) % 5 - 2)
+    m_b_7x3 = generate_matrix(7, 3, lambda r, c: (r + 2 * c) % 4 - 1)
+    run_multiply_test_case(m_a_5x7, m_b_7x3, multiply_matrices(m_a_5x7, m_b_7x3),
+                           "Strassen: (5x7) * (7x3) com preenchimento por zeros",
+                           method="strassen", cutoff=2)
+    m_a_20x20 = generate_matrix(20, 20, lambda r, c: (r * c) % 7 - 3)
+    run_multiply_test_case(m_a_20x20, m_a_20x20, multiply_matrices(m_a_20x20, m_a_20x20),
+                           "Strassen: 20x20 (20 -> 10 -> 5, sem preenchimento)",
+                           method="strassen", cutoff=5)
+    run_multiply_test_case(m_a_3x4, m_b_4x150, exp_3x150, "Strassen: (3x4) * (4x150) com cutoff padrão",
+                           method="strassen")
+    run_multiply_test_case(m_a_2x2, m_b_2x2, None, "Strassen com cutoff zero",
+                           expect_error=True, error_message_contains="inteiro positivo",
+                           method="strassen", cutoff=0)
+    run_multiply_test_case(m_a_2x2, m_b_2x2, None, "Strassen com cutoff negativo",
+                           expect_error=True, error_message_contains="inteiro positivo",
+                           method="strassen", cutoff=-4)
+    run_multiply_test_case(m_a_2x2, m_b_2x2, None, "Strassen com cutoff booleano",
+                           expect_error=True, error_message_contains="inteiro positivo",
+                           method="strassen", cutoff=True)
+    run_multiply_test_case(m_a_2x2, m_b_2x2, None, "Multiplicação com método desconhecido",
+                           expect_error=True, error_message_contains="Método de multiplicação desconhecido",
+                           method="winograd")
+
     # --- Seção: Casos de Teste de Erro ---
     # Teste 11: Dimensões incompatíveis (número de colunas de A != número de linhas de B)
     run_multiply_test_case(
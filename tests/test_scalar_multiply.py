@@ -7,14 +7,14 @@
 # - print_test_header/footer: Para formatar o output do conjunto de testes.
 from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
 # Importa a função de multiplicação por escalar que será testada.
-from logic.scalar_multiply import scalar_multiply
+from logic.scalar_multiply import scalar_multiply, iscale
 
 # Contadores globais para rastrear estatísticas dos testes.
 test_count = 0
 passed_count = 0
 
 def run_scalar_mult_test_case(matrix, scalar, expected_result, description, 
-                              expect_error=False, error_message_contains=None):
+                              expect_error=False, error_message_contains=None, out=None, in_place=False):
     """
     Executa um único caso de teste para a função scalar_multiply.
 
@@ -35,6 +35,8 @@ def run_scalar_mult_test_case(matrix, scalar, expected_result, description,
         description (str): Descrição do caso de teste.
         expect_error (bool): True se uma exceção ValueError é esperada (da validação da matriz).
         error_message_contains (str or None): Substring esperada na mensagem de erro para ValueErrors.
+        out (list[list[float]] or None): Matriz de destino repassada como 'out=' (o resultado deve ser ela própria).
+        in_place (bool): True para chamar 'iscale' (o resultado deve ser a própria 'matrix').
     """
     global test_count, passed_count
     test_count += 1
@@ -45,7 +47,8 @@ def run_scalar_mult_test_case(matrix, scalar, expected_result, description,
     ]
 
     try:
-        result = scalar_multiply(matrix, scalar)
+        result = iscale(matrix, scalar) if in_place else scalar_multiply(matrix, scalar, out=out)
+        target = matrix if in_place else out
         
         if expect_error:
             print(f"[FALHA] - {description}")
@@ -53,7 +56,7 @@ def run_scalar_mult_test_case(matrix, scalar, expected_result, description,
             log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
             if error_message_contains: 
                 log_details.append(f"  Detalhe do Erro Esperado: A mensagem deveria conter '{error_message_contains}'")
-        elif are_matrices_equal(result, expected_result):
+        elif are_matrices_equal(result, expected_result) and (target is None or result is target):
             print(f"[OK] - {description}")
             passed_count += 1
             return 
@@ -120,6 +123,15 @@ def test_multiplicacao_escalar():
     run_scalar_mult_test_case(m_10x10, 3, exp_10x10_x3, 
                               description="Multiplicação escalar: Matriz 10x10 gerada por escalar 3")
 
+    # --- Seção: Variantes out= e In-place ---
+    run_scalar_mult_test_case([[1, 2], [3, 4]], 3, [[3, 6], [9, 12]], out=[[0, 0], [0, 0]],
+                              description="Multiplicação escalar: resultado escrito em 'out'")
+    run_scalar_mult_test_case([[2, 4], [6, 8]], 0.5, [[1.0, 2.0], [3.0, 4.0]], in_place=True,
+                              description="Multiplicação escalar: iscale altera a própria matriz")
+    run_scalar_mult_test_case([[1, 2], [3, 4]], 2, None, out=[[0, 0]],
+                              description="Multiplicação escalar: 'out' com dimensões diferentes",
+                              expect_error=True, error_message_contains="Matriz de saída (out) deve ter as mesmas dimensões")
+
     # --- Seção: Casos de Teste de Erro (para validação da matriz de entrada) ---
     run_scalar_mult_test_case(matrix=None, scalar=2, expected_result=None, 
                               description="Multiplicação escalar: Matriz de entrada é None",
@@ -7,20 +7,39 @@
 # - print_test_header/footer: Para formatar o output do conjunto de testes.
 from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer, generate_matrix 
 # Importa a função de resolução de sistema linear que será testada.
-from logic.solve_linear_system import solve_linear_system_inverse
+from logic.solve_linear_system import solve_linear_system_inverse, solve_linear_system_lu
 # Importa a função de multiplicação para a verificação A * X_calculado = B.
 from logic.multiply_matrices import multiply_matrices 
+# Importa o contador de validações e o tipo Matrix, para verificar que as entradas
+# são validadas uma única vez na fronteira pública.
+from logic.validation_utils import get_validation_count, reset_validation_count
+from logic.inverse_matrix import inverse_matrix
+from logic.matrix import Matrix
+# Importa Fraction para as soluções esperadas do modo exato.
+from fractions import Fraction
 import math # Importa math (embora TOLERANCE já venha de test_utils, pode ser útil para outras comparações se necessário)
 
 # Contadores globais para rastrear estatísticas dos testes.
 test_count = 0
 passed_count = 0
 
+def counting_validations(operation):
+    """
+    Envolve 'operation' em um "solver" que executa a operação e devolve, como
+    matriz 1x1, quantas matrizes em listas foram validadas durante a chamada.
+    """
+    def solver(matrix_a, vector_b):
+        reset_validation_count()
+        operation(matrix_a, vector_b)
+        return [[get_validation_count()]]
+    return solver
+
 def run_solve_system_test_case(matrix_a, vector_b, expected_solution_x, description, 
                                expect_error=False, error_message_contains=None, 
-                               check_ax_eq_b=True):
+                               check_ax_eq_b=True, solver=solve_linear_system_inverse, exact=False):
     """
-    Executa um único caso de teste para a função solve_linear_system_inverse.
+    Executa um único caso de teste para uma função de resolução de sistemas
+    (por padrão solve_linear_system_inverse).
 
     Esta função irá:
     1. Chamar 'solve_linear_system_inverse(matrix_a, vector_b)'.
@@ -41,6 +60,9 @@ def run_solve_system_test_case(matrix_a, vector_b, expected_solution_x, descript
         expect_error (bool): True se uma exceção ValueError é esperada.
         error_message_contains (str or None): Substring esperada na mensagem de erro.
         check_ax_eq_b (bool): Se True, realiza a verificação A * X = B.
+        solver (function): A função de resolução testada (solve_linear_system_inverse
+                           ou solve_linear_system_lu).
+        exact (bool): Se True, as comparações exigem igualdade exata (soluções em Fraction).
     """
     global test_count, passed_count
     test_count += 1
@@ -53,7 +75,8 @@ def run_solve_system_test_case(matrix_a, vector_b, expected_solution_x, descript
 
     try:
         # 1. Execução da Função: Tenta resolver o sistema linear.
-        solution_x = solve_linear_system_inverse(matrix_a, vector_b)
+        solution_x = solver(matrix_a, vector_b)
+        matrices_match = (lambda m1, m2: m1 == m2) if exact else are_matrices_equal
         
         # 2. Verificação Pós-Execução (se nenhum erro ocorreu durante a execução):
         if expect_error:
@@ -67,7 +90,7 @@ def run_solve_system_test_case(matrix_a, vector_b, expected_solution_x, descript
             passed_this_test = True # Flag para rastrear o sucesso das múltiplas verificações.
 
             # 2a. Comparação Direta da Solução X com a Esperada (se fornecida):
-            if expected_solution_x is not None and not are_matrices_equal(solution_x, expected_solution_x):
+            if expected_solution_x is not None and not matrices_match(solution_x, expected_solution_x):
                 passed_this_test = False # Falha se X calculado não bate com X esperado.
                 log_details.append(format_matrix_for_log(expected_solution_x, "Solução X Esperada"))
                 log_details.append(format_matrix_for_log(solution_x, "Solução X Calculada pela Função"))
@@ -89,7 +112,7 @@ def run_solve_system_test_case(matrix_a, vector_b, expected_solution_x, descript
                     # Calcula o produto: Matriz A * Solução X calculada.
                     product_ax = multiply_matrices(matrix_a, solution_x)
                     
-                    if not are_matrices_equal(product_ax, vector_b):
+                    if not matrices_match(product_ax, vector_b):
                         passed_this_test = False # Falha se A*X não for igual a B (dentro da tolerância).
                         log_details.append(format_matrix_for_log(product_ax, "Produto A * X_calculado (Obtido)"))
                         log_details.append(format_matrix_for_log(vector_b, "Vetor B Original (Esperado)"))
@@ -214,14 +237,14 @@ def test_resolucao_sistemas():
         error_message_contains="Número de linhas da Matriz A (coeficientes) deve ser igual ao número de linhas do Vetor B"
     )
     
-    # Teste 8: Vetor B não é um vetor coluna (tem mais de uma coluna)
+    # Teste 8: B com várias colunas (N x k): cada coluna é um lado direito independente.
+    #   Coluna 1: x + 2y = 1, 3x + 4y = 2  => x = 0, y = 0.5
+    #   Coluna 2: x + 2y = 0, 3x + 4y = 0  => x = 0, y = 0
     run_solve_system_test_case(
         matrix_a=[[1,2],[3,4]],   # Matriz A 2x2
-        vector_b=[[1,0],[2,0]],   # Vetor B 2x2 (não é coluna)
-        expected_solution_x=None,
-        description="Sistema com Vetor B não sendo um vetor coluna",
-        expect_error=True, 
-        error_message_contains="Vetor B (termos independentes) deve ser um vetor coluna"
+        vector_b=[[1,0],[2,0]],   # B 2x2 (dois lados direitos)
+        expected_solution_x=[[0.0, 0.0],[0.5, 0.0]],
+        description="Sistema com B de várias colunas (N x k)"
     )
     
     # Teste 9: Matriz A é None (inválida)
@@ -246,6 +269,97 @@ def test_resolucao_sistemas():
         error_message_contains="Vetor B (termos independentes) deve ser uma lista de listas" # Mensagem da validação
     )
 
+    # --- Seção: Resolução Direta por Fatoração LU (solve_linear_system_lu) ---
+    run_solve_system_test_case(m_a_2x2, v_b_2x2, exp_x_2x2, "LU: Sistema linear 2x2 com solução única",
+                               solver=solve_linear_system_lu)
+    run_solve_system_test_case(m_a_3x3, v_b_3x3, exp_x_3x3, "LU: Sistema linear 3x3 com solução conhecida",
+                               solver=solve_linear_system_lu)
+
+    # Pivô zero em [0][0]: a fatoração precisa trocar linhas.
+    # y = 3, x + y = 5  => x = 2, y = 3
+    run_solve_system_test_case([[0, 1], [1, 1]], [[3], [5]], [[2.0], [3.0]],
+                               "LU: Sistema 2x2 com pivô inicial zero (troca de linhas)",
+                               solver=solve_linear_system_lu)
+
+    # Sistema 30x30 denso com solução conhecida X = [1, 2, ..., 30].
+    m_a_30x30 = generate_matrix(30, 30, lambda r, c: 40.0 if r == c else float((r + 2 * c) % 5 - 2))
+    exp_x_30x1 = generate_matrix(30, 1, lambda r, c: float(r + 1))
+    v_b_30x1 = multiply_matrices(m_a_30x30, exp_x_30x1)
+    run_solve_system_test_case(m_a_30x30, v_b_30x1, exp_x_30x1, "LU: Sistema 30x30 denso com solução conhecida",
+                               solver=solve_linear_system_lu)
+
+    # Vários lados direitos resolvidos com uma única fatoração:
+    # as colunas de B são A*X para X com colunas [1..30], [30..1] e uma constante.
+    exp_x_30x3 = generate_matrix(30, 3, lambda r, c: float(r + 1) if c == 0 else (float(30 - r) if c == 1 else 2.5))
+    v_b_30x3 = multiply_matrices(m_a_30x30, exp_x_30x3)
+    run_solve_system_test_case(m_a_30x30, v_b_30x3, exp_x_30x3, "LU: Sistema 30x30 com B de 3 colunas (N x k)",
+                               solver=solve_linear_system_lu)
+
+    # A bem condicionada com uma coluna inteira de valores pequenos (det = -2e-13):
+    # o pivô 1e-13 é comparado com a escala da sua coluna e o sistema tem solução.
+    m_a_small_column = [[1.0, 2.0, 0.0], [3.0, 4.0, 0.0], [0.0, 0.0, 1e-13]]
+    run_solve_system_test_case(m_a_small_column, [[1.0], [2.0], [3.0]], [[0.0], [0.5], [3e13]],
+                               "LU: Sistema 3x3 com pivô pequeno não nulo (det=-2e-13)",
+                               solver=solve_linear_system_lu)
+    run_solve_system_test_case(m_a_small_column, [[1.0], [2.0], [3.0]], [[0.0], [0.5], [3e13]],
+                               "Inversa: Sistema 3x3 com pivô pequeno não nulo (det=-2e-13)")
+
+    run_solve_system_test_case(
+        matrix_a=m_a_singular,
+        vector_b=v_b_singular,
+        expected_solution_x=None,
+        description="LU: Sistema com Matriz A singular (det=0)",
+        expect_error=True,
+        error_message_contains="determinante é zero",
+        solver=solve_linear_system_lu
+    )
+
+    run_solve_system_test_case(
+        matrix_a=[[1,2],[3,4],[5,6]],
+        vector_b=[[1],[1]],
+        expected_solution_x=None,
+        description="LU: Sistema com Matriz A não quadrada",
+        expect_error=True,
+        error_message_contains="Matriz A (coeficientes) deve ser quadrada",
+        solver=solve_linear_system_lu
+    )
+
+    # --- Seção: Resolução Exata (Gauss-Jordan sem frações sobre [A | B]) ---
+    def solve_exact(matrix_a, vector_b):
+        return solve_linear_system_inverse(matrix_a, vector_b, exact=True)
+
+    # 2x + y = 1, x + 3y = 2  =>  x = 1/5, y = 3/5
+    run_solve_system_test_case([[2, 1], [1, 3]], [[1], [2]], [[Fraction(1, 5)], [Fraction(3, 5)]],
+                               "Exata: Sistema 2x2 com solução fracionária", solver=solve_exact, exact=True)
+    run_solve_system_test_case([[0, 1], [1, 1]], [[3, 1], [5, 0]], [[2, -1], [3, 1]],
+                               "Exata: Sistema 2x2 com pivô zero e B de 2 colunas", solver=solve_exact, exact=True)
+
+    # Sistema inteiro 40x40 denso com solução conhecida X = [1/1, 1/2, ..., 1/40]:
+    # B = A*X é formado por frações, e a solução deve ser recuperada exatamente.
+    m_a_40x40 = generate_matrix(40, 40, lambda r, c: (r * 5 + c * 13) % 17 - 8 + (40 if r == c else 0))
+    exp_x_40x1 = generate_matrix(40, 1, lambda r, c: Fraction(1, r + 1))
+    v_b_40x1 = multiply_matrices(m_a_40x40, exp_x_40x1)
+    run_solve_system_test_case(m_a_40x40, v_b_40x1, exp_x_40x1, "Exata: Sistema 40x40 inteiro com solução fracionária",
+                               solver=solve_exact, exact=True)
+
+    run_solve_system_test_case(m_a_singular, v_b_singular, None, "Exata: Sistema com Matriz A singular (det=0)",
+                               expect_error=True, error_message_contains="determinante é zero", solver=solve_exact)
+
+    # --- Seção: Validação Única na Fronteira Pública ---
+    # Cada matriz é percorrida pela validação uma única vez: a inversa e o produto
+    # chamados internamente pela resolução não revalidam A nem B.
+    run_solve_system_test_case(m_a_3x3, v_b_3x3, [[2]], "Validação: solve_inverse valida A e B uma única vez",
+                               check_ax_eq_b=False, solver=counting_validations(solve_linear_system_inverse))
+    run_solve_system_test_case(m_a_3x3, v_b_3x3, [[2]], "Validação: solve_lu valida A e B uma única vez",
+                               check_ax_eq_b=False, solver=counting_validations(solve_linear_system_lu))
+    run_solve_system_test_case(m_a_3x3, v_b_3x3, [[1]], "Validação: inversa pela adjunta valida A uma única vez (sem revalidar os menores)",
+                               check_ax_eq_b=False,
+                               solver=counting_validations(lambda a, b: inverse_matrix(a, method="adjoint")))
+    # Um Matrix foi validado na construção: nenhuma validação adicional.
+    run_solve_system_test_case(Matrix.from_list(m_a_3x3), Matrix.from_list(v_b_3x3), [[0]],
+                               "Validação: operandos Matrix não são revalidados",
+                               check_ax_eq_b=False, solver=counting_validations(solve_linear_system_inverse))
+
     print_test_footer("solve_linear_system.py", test_count, passed_count)
 
 if __name__ == "__main__":
@@ -0,0 +1,158 @@
+# calculadora_matrizes/tests/test_sparse.py
+
+# Importa utilitários de teste:
+# - format_matrix_for_log: Para exibir resultados de forma legível.
+# - are_matrices_equal: Para comparar resultados (matrizes em listas ou escalares) com tolerância.
+# - print_test_header/footer: Para formatar o output do conjunto de testes.
+from test_utils import format_matrix_for_log, are_matrices_equal, print_test_header, print_test_footer
+# Importa os tipos esparsos e as operações que os aceitam.
+from logic.matrix import Matrix
+from logic.sparse import SparseMatrix, CSRMatrix, CSCMatrix
+from logic.add_matrices import add_matrices, iadd
+from logic.subtract_matrices import subtract_matrices
+from logic.scalar_multiply import scalar_multiply
+from logic.transpose_matrix import transpose_matrix
+from logic.multiply_matrices import multiply_matrices
+from logic.determinant import determinant
+from logic.iterative_solvers import conjugate_gradient
+
+# Contadores globais para rastrear estatísticas dos testes.
+test_count = 0
+passed_count = 0
+
+def run_sparse_test_case(operation, expected_result, description, expect_error=False, error_message_contains=None):
+    """
+    Executa um único caso de teste de uma operação com matrizes esparsas.
+
+    Esta função irá:
+    1. Chamar 'operation()' (uma função sem argumentos que executa o cenário testado).
+    2. Se o resultado for um Matrix ou uma matriz esparsa, convertê-lo para listas antes da comparação.
+    3. Se um erro é esperado (expect_error=True), verificar o ValueError e sua mensagem.
+    4. Imprimir o status ([OK] ou [FALHA]) e um log detalhado em caso de falha.
+
+    Args:
+        operation (function): Função sem argumentos que retorna o valor testado.
+        expected_result: O valor esperado. None se um erro é esperado.
+        description (str): Descrição do caso de teste.
+        expect_error (bool): True se uma exceção ValueError é esperada.
+        error_message_contains (str or None): Substring esperada na mensagem de erro.
+    """
+    global test_count, passed_count
+    test_count += 1
+    print(f"\n--- Teste: {description} ---")
+    log_details = []
+
+    try:
+        # 1. Execução do Cenário:
+        result = operation()
+        if isinstance(result, (Matrix, SparseMatrix)):
+            result = result.to_list()
+
+        # 2. Verificação Pós-Execução:
+        if expect_error:
+            print(f"[FALHA] - {description}")
+            log_details.append("  Status: Um erro era esperado, mas a operação foi concluída sem erros.")
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
+        elif result == expected_result or are_matrices_equal(result, expected_result):
+            print(f"[OK] - {description}")
+            passed_count += 1
+            return
+        else:
+            print(f"[FALHA] - {description}")
+            log_details.append(format_matrix_for_log(expected_result, "Resultado Esperado"))
+            log_details.append(format_matrix_for_log(result, "Resultado Obtido"))
+
+    except ValueError as ve:
+        # 3. Tratamento de ValueErrors:
+        if expect_error and (error_message_contains is None or error_message_contains.lower() in str(ve).lower()):
+            print(f"[OK] - {description} (Erro esperado ValueError corretamente capturado: {ve})")
+            passed_count += 1
+            return
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Detalhe do Erro: ValueError: {ve}")
+
+    except Exception as e:
+        # 4. Tratamento de Outras Exceções Inesperadas:
+        print(f"[FALHA] - {description}")
+        log_details.append(f"  Status: Uma exceção totalmente inesperada do tipo {type(e).__name__} ocorreu.")
+        log_details.append(f"  Detalhe do Erro: {e}")
+
+    # 5. Impressão do Log Detalhado (Apenas em caso de FALHA):
+    print("  Log Detalhado da Operação:")
+    for detail in log_details:
+        print(detail)
+
+
+def test_sparse():
+    """
+    Define e executa uma suíte de casos de teste para CSRMatrix/CSCMatrix e para as
+    versões esparsas de adição, subtração, escalar, transposição e multiplicação.
+    """
+    global test_count, passed_count
+    test_count = 0
+    passed_count = 0
+    print_test_header("sparse.py")
+
+    dense_a = [[1, 0, 0, 2], [0, 0, 3, 0], [4, 0, 0, 5]]
+    dense_b = [[0, 1, 0, -2], [0, 0, 0, 0], [-4, 0, 6, 0]]
+    dense_c = [[1, 0], [0, 2], [3, 0], [0, 4]]
+    csr_a = CSRMatrix.from_dense(dense_a)
+    csr_b = CSRMatrix.from_dense(dense_b)
+
+    # --- Seção: Construção e Conversões ---
+    run_sparse_test_case(lambda: (csr_a.data, csr_a.indices, csr_a.indptr), ([1, 2, 3, 4, 5], [0, 3, 2, 0, 3], [0, 2, 3, 5]),
+                         "Arrays CSR de uma matriz 3x4")
+    run_sparse_test_case(lambda: CSCMatrix.from_dense(dense_a).indptr, [0, 2, 2, 3, 5], "indptr CSC (por colunas)")
+    run_sparse_test_case(lambda: CSCMatrix.from_dense(Matrix.from_list(dense_a)).to_list(), dense_a, "Ida e volta CSC <-> densa (Matrix)")
+    run_sparse_test_case(lambda: (csr_a[2, 3], csr_a[1, 1], csr_a.nnz, csr_a.shape), (5, 0, 5, (3, 4)), "Acesso a elementos, nnz e shape")
+    run_sparse_test_case(lambda: CSRMatrix.from_triplets(2, 3, [0, 1, 0, 1], [2, 0, 2, 1], [1.5, 2.0, 0.5, 0.0]),
+                         [[0, 0, 2.0], [2.0, 0, 0]], "from_triplets soma repetidos e descarta zeros")
+    run_sparse_test_case(lambda: CSRMatrix.from_triplets(2, 2, [2], [0], [1.0]), None, "from_triplets com índice fora das dimensões",
+                         expect_error=True, error_message_contains="fora das dimensões")
+    run_sparse_test_case(lambda: csr_a == CSCMatrix.from_dense(dense_a), True, "CSR e CSC da mesma matriz são iguais")
+
+    # --- Seção: Adição, Subtração e Escalar ---
+    run_sparse_test_case(lambda: add_matrices(csr_a, csr_b), [[1, 1, 0, 0], [0, 0, 3, 0], [0, 0, 6, 5]], "Esparsa + esparsa")
+    run_sparse_test_case(lambda: add_matrices(csr_a, csr_b).nnz, 5, "Soma esparsa descarta os cancelamentos")
+    run_sparse_test_case(lambda: isinstance(subtract_matrices(CSCMatrix.from_dense(dense_a), csr_b), CSCMatrix), True,
+                         "Subtração esparsa mantém o formato de A (CSC)")
+    run_sparse_test_case(lambda: subtract_matrices(csr_a, dense_b), [[1, -1, 0, 4], [0, 0, 3, 0], [8, 0, -6, 5]], "Esparsa - densa = densa")
+    run_sparse_test_case(lambda: subtract_matrices(Matrix.from_list(dense_b), csr_a), [[-1, 1, 0, -4], [0, 0, -3, 0], [-8, 0, 6, -5]],
+                         "Matrix - esparsa = Matrix")
+    run_sparse_test_case(lambda: add_matrices(csr_a, CSRMatrix.from_dense([[1, 2], [3, 4]])), None, "Soma esparsa com dimensões diferentes",
+                         expect_error=True, error_message_contains="mesmas dimensões")
+    run_sparse_test_case(lambda: iadd(csr_a, csr_b), None, "Soma in-place recusa matriz esparsa",
+                         expect_error=True, error_message_contains="requer matrizes densas")
+    run_sparse_test_case(lambda: scalar_multiply(csr_a, 2), [[2, 0, 0, 4], [0, 0, 6, 0], [8, 0, 0, 10]], "Escalar em matriz esparsa")
+    run_sparse_test_case(lambda: scalar_multiply(csr_a, 0).nnz, 0, "Escalar zero resulta em matriz sem não nulos")
+
+    # --- Seção: Transposição e Multiplicação ---
+    run_sparse_test_case(lambda: transpose_matrix(csr_a), transpose_matrix(dense_a), "Transposta de CSR")
+    run_sparse_test_case(lambda: transpose_matrix(csr_a).data is csr_a.data, True, "Transposta CSR -> CSC reaproveita os arrays (O(1))")
+    run_sparse_test_case(lambda: multiply_matrices(csr_a, CSRMatrix.from_dense(dense_c)), multiply_matrices(dense_a, dense_c),
+                         "Esparsa * esparsa (Gustavson)")
+    run_sparse_test_case(lambda: multiply_matrices(csr_a, dense_c), multiply_matrices(dense_a, dense_c), "Esparsa * densa")
+    run_sparse_test_case(lambda: multiply_matrices(dense_c, CSCMatrix.from_dense([[1, 0, 2], [0, 3, 0]])),
+                         multiply_matrices(dense_c, [[1, 0, 2], [0, 3, 0]]), "Densa * esparsa (CSC)")
+    run_sparse_test_case(lambda: multiply_matrices(csr_a, csr_b), None, "Multiplicação esparsa com dimensões incompatíveis",
+                         expect_error=True, error_message_contains="Número de colunas")
+
+    # --- Seção: Operações sem Versão Esparsa e Resolvedores Iterativos ---
+    run_sparse_test_case(lambda: determinant(CSRMatrix.from_dense([[1, 0], [0, 1]])), None, "Determinante recusa matriz esparsa",
+                         expect_error=True, error_message_contains="to_list()")
+    run_sparse_test_case(lambda: conjugate_gradient(CSRMatrix.from_dense([[4.0, 1.0], [1.0, 3.0]]), [[1.0], [2.0]]).solution,
+                         [[1 / 11], [7 / 11]], "CG com CSRMatrix como operador")
+
+    # --- Seção: Matriz Grande ---
+    #    50 000 x 50 000 com ~150 000 não nulos (tridiagonal): inviável na forma densa.
+    n = 50000
+    rows = [i for i in range(n) for _ in range(3)]
+    cols = [min(max(i + d, 0), n - 1) for i in range(n) for d in (-1, 0, 1)]
+    large = CSRMatrix.from_triplets(n, n, rows, cols, [1.0] * (3 * n))
+    run_sparse_test_case(lambda: add_matrices(large, transpose_matrix(large)).nnz, large.nnz, "Soma 50 000 x 50 000 esparsa")
+    run_sparse_test_case(lambda: multiply_matrices(large, large)[n // 2, n // 2], 3.0, "Produto 50 000 x 50 000 esparsa * esparsa")
+
+    print_test_footer("sparse.py", test_count, passed_count)
+
+if __name__ == "__main__":
+    test_sparse()
@@ -7,14 +7,13 @@
 # - print_test_header/footer: Para formatar o output do conjunto de testes.
 from test_utils import format_matrix_for_log, are_matrices_equal, generate_matrix, print_test_header, print_test_footer
 # Importa a função de subtração de matrizes que será testada.
-from logic.subtract_matrices import subtract_matrices
-
+from logic.subtract_matrices import subtract_matrices, isub
 # Contadores globais para rastrear estatísticas dos testes.
 test_count = 0
 passed_count = 0
 
 def run_subtract_test_case(m_a, m_b, expected_result, description, 
-                           expect_error=False, error_message_contains=None):
+                           expect_error=False, error_message_contains=None, out=None, in_place=False):
     """
     Executa um único caso de teste para a função subtract_matrices.
 
@@ -35,6 +34,8 @@ def run_subtract_test_case(m_a, m_b, expected_result, description,
         description (str): Descrição do caso de teste.
         expect_error (bool): True se uma exceção ValueError é esperada.
         error_message_contains (str or None): Substring esperada na mensagem de erro.
+        out (list[list[float]] or None): Matriz de destino repassada como 'out=' (o resultado deve ser ela própria).
+        in_place (bool): True para chamar 'isub' (o resultado deve ser a própria 'm_a').
     """
     global test_count, passed_count
     test_count += 1
@@ -48,7 +49,8 @@ def run_subtract_test_case(m_a, m_b, expected_result, description,
 
     try:
         # 1. Execução da Função: Realiza a subtração das matrizes (A - B).
-        result = subtract_matrices(m_a, m_b)
+        result = isub(m_a, m_b) if in_place else subtract_matrices(m_a, m_b, out=out)
+        target = m_a if in_place else out
         
         # 2. Verificação Pós-Execução (se nenhum erro ocorreu durante a execução):
         if expect_error:
@@ -58,7 +60,7 @@ def run_subtract_test_case(m_a, m_b, expected_result, description,
             log_details.append(format_matrix_for_log(result, "Resultado Obtido (Inesperado)"))
             if error_message_contains:
                  log_details.append(f"  Detalhe do Erro Esperado: A mensagem deveria conter '{error_message_contains}'")
-        elif are_matrices_equal(result, expected_result):
+        elif are_matrices_equal(result, expected_result) and (target is None or result is target):
             # Se nenhum erro era esperado e o resultado bate com o esperado, o teste PASSA.
             print(f"[OK] - {description}")
             passed_count += 1
@@ -173,11 +175,32 @@ def test_subtracao_matrizes():
     exp_10x10 = generate_matrix(10, 10, lambda r, c: r + c + 4)
     run_subtract_test_case(m_a_10x10, m_b_10x10, exp_10x10, "Subtração de matrizes 10x10 (geradas)")
 
+    # --- Seção: Broadcasting (escalar, vetor linha 1 x n e vetor coluna m x 1) ---
+    #    Centralização das colunas: subtrai a média de cada coluna (vetor linha 1 x n).
+    m_data = generate_matrix(4, 3, lambda r, c: r * 3 + c)
+    run_subtract_test_case(m_data, [[4.5, 5.5, 6.5]], generate_matrix(4, 3, lambda r, c: r * 3 + c - 4.5 - c),
+                           "Broadcasting: centralização das colunas (matriz 4x3 - médias 1x3)")
+    run_subtract_test_case([[5, 6], [7, 8]], [[1], [2]], [[4, 5], [5, 6]], "Broadcasting: matriz - vetor coluna 2x1")
+    run_subtract_test_case(10, [[1, 2], [3, 4]], [[9, 8], [7, 6]], "Broadcasting: escalar - matriz")
+    run_subtract_test_case([[1, 2], [3, 4]], 1, [[0, 1], [2, 3]], "Broadcasting: matriz - escalar")
+    m_center = [[1.0, 2.0], [3.0, 4.0]]
+    run_subtract_test_case(m_center, [[2.0, 3.0]], [[-1.0, -1.0], [1.0, 1.0]], "Broadcasting com out= (a própria matriz)",
+                           out=m_center)
+
+    # --- Seção: Variantes out= e In-place ---
+    run_subtract_test_case([[5, 6], [7, 8]], [[1, 2], [3, 4]], [[4, 4], [4, 4]], "Subtração escrita em 'out'",
+                           out=[[0, 0], [0, 0]])
+    run_subtract_test_case([[5, 6], [7, 8]], [[0.5, 1], [1, 0.5]], [[4.5, 5], [6, 7.5]], "isub altera a própria Matriz A",
+                           in_place=True)
+    run_subtract_test_case([[1, 2]], [[1, 2]], None, "Subtração com 'out' inválida (None na linha)",
+                           out=[None], expect_error=True, error_message_contains="Matriz de saída (out)")
+
     # --- Seção: Casos de Teste de Erro ---
     # Teste 9: Tentativa de subtrair matrizes com dimensões incompatíveis
+    #   (nenhum eixo diferente tem tamanho 1, então não há broadcasting)
     run_subtract_test_case(
-        m_a=[[1,2]],           # Matriz 1x2
-        m_b=[[1],[2]],         # Matriz 2x1
+        m_a=[[1,2],[3,4]],     # Matriz 2x2
+        m_b=[[1,2,3],[4,5,6],[7,8,9]], # Matriz 3x3
         expected_result=None,
         description="Subtração com dimensões incompatíveis (erro: linhas/colunas diferentes)", 
         expect_error=True, 